@@ -35,25 +35,63 @@ __all__ = [
     # Контейнеры
     'Horizontal', 'Vertical', 'Grid', 'ScrollableFrame',
     'Tabs', 'Pages', 'Table',
+    
+    # Источники данных для таблицы
+    'DataSource', 'ListDataSource', 'SQLiteDataSource', 'ColumnarDataSource',
+    'CSVDataSource',
 ]
 
+import importlib
+
 from .app import App
 from .menu import Menu
 from .utils import Utils
 
-from .controls import (
-    Button, Label, Input, Checkbox, RadioGroup,
-    Dropdown, Slider, ListBox, SearchableList
-)
+# Элементы управления и контейнеры импортируются при первом обращении
+# (см. __getattr__), чтобы `import simpletk` не загружал ttk, таблицы и
+# поиск, если приложению нужны только App и Label.
+_LAZY = {
+    'Button': 'controls.button',
+    'Label': 'controls.label',
+    'Input': 'controls.input',
+    'Checkbox': 'controls.checkbox',
+    'RadioGroup': 'controls.radiogroup',
+    'Dropdown': 'controls.dropdown',
+    'Slider': 'controls.slider',
+    'ListBox': 'controls.listbox',
+    'SearchableList': 'controls.searchable_list',
+    'Horizontal': 'containers.horizontal',
+    'Vertical': 'containers.vertical',
+    'Grid': 'containers.grid',
+    'ScrollableFrame': 'containers.scrollable',
+    'Tabs': 'containers.tabs',
+    'Pages': 'containers.pages',
+    'Table': 'containers.table',
+    'DataSource': 'containers.datasource',
+    'ListDataSource': 'containers.datasource',
+    'SQLiteDataSource': 'containers.datasource',
+    'ColumnarDataSource': 'containers.columnar',
+    'CSVDataSource': 'containers.csvsource',
+}
+
+# Подпакеты тоже загружаются при первом обращении: simpletk.controls.Button
+_SUBPACKAGES = ('controls', 'containers')
 
-from .containers import (
-    Horizontal, Vertical, Grid, ScrollableFrame,
-    Tabs, Pages, Table
-)
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBPACKAGES))
 
 
 def __getattr__(name):
-    """Помощь при опечатках в названиях классов"""
+    """Ленивый импорт классов и помощь при опечатках в их названиях"""
+    if name in _LAZY:
+        module = importlib.import_module('.' + _LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name in _SUBPACKAGES:
+        return importlib.import_module('.' + name, __name__)
+    
     suggestions = {
         'ListBox': ['Listbox', 'List_box', 'List-Box'],
         'SearchableList': ['Searchablelist', 'Searchable_list'],
@@ -1,5 +1,5 @@
 import tkinter as tk
-from tkinter import messagebox, filedialog
+from contextlib import contextmanager
 
 class App:
     """Главное окно приложения
@@ -9,29 +9,153 @@ class App:
     Пример:
         >>> app = App("Моё приложение", 800, 600)
         >>> app.run()
+        
+    Профилирование обработчиков и поиск зависаний (см. profiler.Profiler):
+        >>> app = App("Моё приложение", profile=True, profile_path="profile.json")
+        
+    Долгая работа в фоне с обновлением виджетов по завершении:
+        >>> app.run_background(load_report, path, on_done=label.set_text)
+        
+    Вместе с asyncio (обработчики элементов могут быть async def):
+        >>> async def refresh():
+        ...     label.set_text(await client.fetch_status())
+        >>> Button(app, "Обновить", on_click=refresh)
+        >>> app.run_async()  # Или await app.run_forever() внутри asyncio
     """
     
-    def __init__(self, title="My Application", width=800, height=600):
+    def __init__(self, title="My Application", width=800, height=600,
+                 profile=False, stall_ms=200, profile_path=None,
+                 executor='thread', max_workers=None):
         """Инициализация главного окна
         
         Args:
             title (str): Заголовок окна
             width (int): Ширина окна
             height (int): Высота окна
+            profile (bool): Замерять время обработчиков элементов и искать
+                зависания главного цикла (статистика в app.profiler)
+            stall_ms (int): С какой задержки цикла событий считать зависание
+            profile_path (str): Файл JSON, в который статистика сохраняется
+                после выхода из run()
+            executor: Исполнитель для run_background(): 'thread', 'process'
+                или готовый concurrent.futures.Executor
+            max_workers (int): Количество потоков или процессов исполнителя
         """
         self.root = tk.Tk()
         self.root.title(title)
         self.root.geometry(f"{width}x{height}")
         self.elements = []
         
+        # Профилировщик создаётся до элементов, чтобы они обернули обработчики
+        self.profiler = None
+        self.profile_path = profile_path
+        if profile:
+            from .profiler import Profiler
+            self.profiler = Profiler(self.root, stall_ms=stall_ms)
+            
+        # Фоновые задачи: исполнитель создаётся при первом run_background()
+        self.executor = executor
+        self.max_workers = max_workers
+        self._tasks = None
+        self._async = None  # Цикл Tk внутри asyncio (run_forever)
+        
+    @contextmanager
+    def _profiling(self):
+        """Профилировщик работает, пока выполняется главный цикл"""
+        if self.profiler is None:
+            yield
+            return
+        self.profiler.start()
+        try:
+            yield
+        finally:
+            self.profiler.stop()
+            if self.profile_path:
+                self.profiler.dump(self.profile_path)
+        
     def run(self):
         """Запуск приложения (главный цикл обработки событий)"""
-        self.root.mainloop()
+        with self._profiling():
+            self.root.mainloop()
+            
+    async def run_forever(self):
+        """Главный цикл Tk внутри уже работающего цикла asyncio
+        
+        События Tk обрабатываются между задачами asyncio, пока окно не
+        закрыто или не вызван close(). Обработчики async def элементов
+        запускаются задачами; при выходе незавершённые задачи отменяются.
+        
+        Пример:
+            >>> async def main():
+            ...     app = App("Клиент")
+            ...     ...
+            ...     await asyncio.gather(app.run_forever(), client.listen())
+        """
+        from .async_loop import AsyncLoop
+        self._async = AsyncLoop(self.root)
+        try:
+            with self._profiling():
+                await self._async.run()
+        finally:
+            self._async = None
+            
+    def run_async(self):
+        """Запуск приложения с циклом asyncio (asyncio.run(run_forever()))"""
+        import asyncio
+        asyncio.run(self.run_forever())
         
     def close(self):
-        """Закрытие приложения"""
+        """Закрытие приложения
+        
+        Незавершённые фоновые задачи и задачи asyncio обработчиков отменяются.
+        """
+        if self._tasks is not None:
+            self._tasks.shutdown()
+            self._tasks = None
+        if self._async is not None:
+            self._async.stop()
         self.root.quit()
         
+    def run_background(self, fn, *args, on_done=None, on_error=None, on_progress=None,
+                       **kwargs):
+        """Выполнить функцию в фоне, не блокируя окно
+        
+        Функция выполняется в потоке или процессе исполнителя (параметр
+        executor у App), а обработчики вызываются в потоке Tk, поэтому в
+        них можно менять виджеты.
+        
+        Args:
+            fn (callable): Функция (для executor='process' - объявленная на
+                уровне модуля)
+            *args, **kwargs: Аргументы функции
+            on_done (callable): Вызывается с результатом функции
+            on_error (callable): Вызывается с исключением (без него
+                исключение передаётся в обработчик ошибок tkinter)
+            on_progress (callable): Вызывается со значениями, которые функция
+                передаёт в progress(value); если задан, функция получает
+                аргумент progress
+            
+        Returns:
+            BackgroundTask: Задача (можно отменить через cancel())
+            
+        Пример:
+            >>> def count_lines(path, progress):
+            ...     total = 0
+            ...     with open(path) as f:
+            ...         for total, _ in enumerate(f, 1):
+            ...             if total % 100000 == 0:
+            ...                 progress(total)
+            ...     return total
+            >>> app.run_background(count_lines, "big.csv",
+            ...                    on_progress=lambda n: status.set_text(f"{n} строк..."),
+            ...                    on_done=lambda n: status.set_text(f"Всего {n} строк"))
+        """
+        if self._tasks is None:
+            from .tasks import TaskRunner
+            self._tasks = TaskRunner(self.root, self.executor, self.max_workers)
+        return self._tasks.submit(fn, *args, on_done=on_done, on_error=on_error,
+                                  on_progress=on_progress, **kwargs)
+        
     def set_size(self, width, height):
         """Установка размера окна
         
@@ -65,6 +189,7 @@ class App:
             text (str): Текст сообщения
             title (str): Заголовок окна
         """
+        from tkinter import messagebox
         messagebox.showinfo(title, text)
         
     def question(self, text, title="Question"):
@@ -77,6 +202,7 @@ class App:
         Returns:
             bool: True если пользователь нажал "Да", иначе False
         """
+        from tkinter import messagebox
         return messagebox.askyesno(title, text)
         
     def warning(self, text, title="Warning"):
@@ -86,6 +212,7 @@ class App:
             text (str): Текст предупреждения
             title (str): Заголовок окна
         """
+        from tkinter import messagebox
         messagebox.showwarning(title, text)
         
     def error(self, text, title="Error"):
@@ -95,6 +222,7 @@ class App:
             text (str): Текст ошибки
             title (str): Заголовок окна
         """
+        from tkinter import messagebox
         messagebox.showerror(title, text)
         
     def open_file(self, filetypes=[("All files", "*.*")]):
@@ -106,6 +234,7 @@ class App:
         Returns:
             str: Путь к выбранному файлу или пустая строка
         """
+        from tkinter import filedialog
         return filedialog.askopenfilename(filetypes=filetypes)
         
     def open_folder(self):
@@ -114,4 +243,5 @@ class App:
         Returns:
             str: Путь к выбранной папке или пустая строка
         """
+        from tkinter import filedialog
         return filedialog.askdirectory()
\ No newline at end of file
@@ -0,0 +1,103 @@
+import asyncio
+import tkinter as tk
+import _tkinter
+
+
+class AsyncLoop:
+    """Совместная работа главного цикла Tk и цикла событий asyncio
+
+    Вместо root.mainloop() корутина run() в цикле asyncio обрабатывает
+    накопившиеся события Tk (dooneevent без ожидания) и уступает
+    управление задачам asyncio. Пока событий Tk нет, пауза между
+    проверками удваивается от min_interval до max_interval, поэтому
+    простаивающее окно почти не загружает процессор, а после ввода
+    пользователя события снова обрабатываются без задержки.
+
+    Используется через App.run_async() и App.run_forever(); там же
+    обработчики async def элементов запускаются задачами через spawn().
+    """
+
+    def __init__(self, root, min_interval=0.001, max_interval=0.02):
+        """Инициализация
+
+        Args:
+            root (tk.Tk): Главное окно
+            min_interval (float): Пауза после обработанных событий Tk в секундах
+            max_interval (float): Наибольшая пауза, пока событий нет
+        """
+        self.root = root
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.running = False
+        self._tasks = set()
+
+    def spawn(self, coro):
+        """Запустить корутину задачей asyncio
+
+        Задачи отменяются при остановке цикла. Исключение задачи
+        передаётся в обработчик ошибок tkinter (report_callback_exception).
+
+        Args:
+            coro: Корутина
+
+        Returns:
+            asyncio.Task: Задача
+        """
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+        return task
+
+    def _task_done(self, task):
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self.root.report_callback_exception(type(error), error, error.__traceback__)
+
+    def _window_exists(self):
+        """Не закрыто ли окно (например, кнопкой заголовка)"""
+        try:
+            return bool(self.root.winfo_exists())
+        except tk.TclError:
+            return False
+
+    async def run(self):
+        """Обрабатывать события Tk, пока окно не закрыто или не вызван stop()"""
+        root = self.root
+        dooneevent = root.tk.dooneevent
+        flags = _tkinter.ALL_EVENTS | _tkinter.DONT_WAIT
+        root._simpletk_async = self
+        self.running = True
+        interval = self.min_interval
+        try:
+            while self.running:
+                handled = 0
+                # Ограничение порции, чтобы поток событий не задерживал задачи asyncio
+                while handled < 1000 and dooneevent(flags):
+                    handled += 1
+                if handled:
+                    interval = self.min_interval
+                    await asyncio.sleep(0)
+                elif not self._window_exists():
+                    break
+                else:
+                    await asyncio.sleep(interval)
+                    interval = min(interval * 2, self.max_interval)
+        finally:
+            self.running = False
+            del root._simpletk_async
+            await self.cancel_tasks()
+
+    def stop(self):
+        """Остановить run() (задачи отменяются при выходе из run())"""
+        self.running = False
+
+    async def cancel_tasks(self):
+        """Отменить задачи и дождаться их завершения"""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,13 @@
+"""Замеры производительности SimpleTK
+
+Запуск (без DISPLAY поднимается виртуальный X сервер Xvfb):
+    python -m simpletk.bench -o new.json
+    python -m simpletk.bench --only listbox,table --sizes 1000,100000
+    python -m simpletk.bench compare old.json new.json
+
+Модули пакета:
+    scenarios  - сценарии замеров (списки, таблица, Dropdown, контейнеры)
+    harness    - Xvfb, повторы, перцентили и пик памяти
+    compare    - сравнение двух запусков
+    importtime - время импорта simpletk и проверка ленивой загрузки
+"""
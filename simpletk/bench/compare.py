@@ -0,0 +1,78 @@
+def _key(result):
+    return result['scenario'], result['op'], result['size']
+
+
+def compare(base, new, threshold=0.1, min_ms=1.0, metric='p50_ms', memory_threshold=0.2):
+    """Сравнить два запуска замеров
+
+    Операция считается ухудшившейся, если metric вырос больше чем на
+    threshold (доля) и больше чем на min_ms миллисекунд (шум коротких
+    операций), или пик памяти вырос больше чем на memory_threshold.
+
+    Args:
+        base (dict): Результат прежнего запуска (JSON из run())
+        new (dict): Результат нового запуска
+        threshold (float): Допустимый рост времени (0.1 - 10%)
+        min_ms (float): Разница во времени, которая не считается ухудшением
+        metric (str): Сравниваемая величина ('p50_ms', 'p90_ms', 'min_ms'...)
+        memory_threshold (float): Допустимый рост пика памяти
+
+    Returns:
+        list: Строки сравнения: scenario, op, size, base, new, change
+            (отношение new / base - 1), memory_change, status ('regression',
+            'improvement', 'ok', 'added' или 'removed')
+    """
+    old_results = {_key(r): r for r in base['results']}
+    new_results = {_key(r): r for r in new['results']}
+    rows = []
+    for key in sorted(old_results.keys() | new_results.keys(), key=lambda k: (k[0], k[2], k[1])):
+        old, cur = old_results.get(key), new_results.get(key)
+        row = {'scenario': key[0], 'op': key[1], 'size': key[2],
+               'base': old and old[metric], 'new': cur and cur[metric],
+               'change': None, 'memory_change': None}
+        if old is None or cur is None:
+            row['status'] = 'added' if old is None else 'removed'
+            rows.append(row)
+            continue
+
+        diff = cur[metric] - old[metric]
+        row['change'] = diff / old[metric] if old[metric] else 0.0
+        if old['peak_kb']:
+            row['memory_change'] = cur['peak_kb'] / old['peak_kb'] - 1
+        slower = row['change'] > threshold and diff > min_ms
+        bigger = row['memory_change'] is not None and row['memory_change'] > memory_threshold \
+            and cur['peak_kb'] - old['peak_kb'] > 64
+        if slower or bigger:
+            row['status'] = 'regression'
+        elif row['change'] < -threshold and -diff > min_ms:
+            row['status'] = 'improvement'
+        else:
+            row['status'] = 'ok'
+        rows.append(row)
+    return rows
+
+
+def format_comparison(rows, only_changed=False):
+    """Таблица сравнения для вывода в консоль
+
+    Args:
+        rows (list): Результат compare()
+        only_changed (bool): Показывать только ухудшения и улучшения
+
+    Returns:
+        str: Текст таблицы
+    """
+    marks = {'regression': '!!', 'improvement': '++', 'ok': '', 'added': 'новое',
+             'removed': 'нет'}
+    lines = [f"{'сценарий':<20} {'операция':<20} {'размер':>8} {'было, мс':>10} "
+             f"{'стало, мс':>10} {'время':>8} {'память':>8}"]
+    for row in rows:
+        if only_changed and row['status'] in ('ok', 'added', 'removed'):
+            continue
+        base = '-' if row['base'] is None else f"{row['base']:.2f}"
+        new = '-' if row['new'] is None else f"{row['new']:.2f}"
+        change = '' if row['change'] is None else f"{row['change']:+.0%}"
+        memory = '' if row['memory_change'] is None else f"{row['memory_change']:+.0%}"
+        lines.append(f"{row['scenario']:<20} {row['op']:<20} {row['size']:>8} {base:>10} "
+                     f"{new:>10} {change:>8} {memory:>8} {marks[row['status']]}")
+    return '\n'.join(lines)
@@ -0,0 +1,184 @@
+import os
+import shutil
+import subprocess
+import time
+import tracemalloc
+import tkinter as tk
+from contextlib import contextmanager
+
+
+@contextmanager
+def virtual_display(force=False, screen='1280x1024x24'):
+    """Виртуальный X сервер (Xvfb) на время замеров
+
+    Если DISPLAY уже задан и force не указан, используется текущий
+    дисплей. Иначе запускается Xvfb, номер свободного дисплея он сообщает
+    сам (-displayfd).
+
+    Args:
+        force (bool): Запустить Xvfb, даже если DISPLAY задан
+        screen (str): Размер и глубина экрана Xvfb
+
+    Yields:
+        str: Значение DISPLAY
+    """
+    if os.environ.get('DISPLAY') and not force:
+        yield os.environ['DISPLAY']
+        return
+
+    xvfb = shutil.which('Xvfb')
+    if xvfb is None:
+        raise RuntimeError("Не найден Xvfb и не задан DISPLAY: установите Xvfb "
+                           "(пакет xvfb) или запустите замеры в графической сессии")
+
+    read_fd, write_fd = os.pipe()
+    proc = subprocess.Popen([xvfb, '-displayfd', str(write_fd), '-screen', '0', screen,
+                             '-nolisten', 'tcp'],
+                            pass_fds=(write_fd,), stderr=subprocess.DEVNULL)
+    os.close(write_fd)
+    previous = os.environ.get('DISPLAY')
+    try:
+        with os.fdopen(read_fd) as f:
+            number = f.readline().strip()
+        if not number:
+            raise RuntimeError("Xvfb не запустился")
+        os.environ['DISPLAY'] = f":{number}"
+        yield os.environ['DISPLAY']
+    finally:
+        if previous is None:
+            os.environ.pop('DISPLAY', None)
+        else:
+            os.environ['DISPLAY'] = previous
+        proc.terminate()
+        proc.wait()
+
+
+def percentile(sorted_samples, fraction):
+    """Перцентиль отсортированного списка (линейная интерполяция)"""
+    if not sorted_samples:
+        return None
+    position = (len(sorted_samples) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    low, high = sorted_samples[lower], sorted_samples[upper]
+    return low + (high - low) * (position - lower)
+
+
+def summarize(samples):
+    """Сводка по замерам времени
+
+    Args:
+        samples (list): Время повторов в секундах
+
+    Returns:
+        dict: samples, min_ms, p50_ms, p90_ms, p99_ms, max_ms, mean_ms
+    """
+    ordered = sorted(s * 1000 for s in samples)
+    return {
+        'samples': len(ordered),
+        'min_ms': ordered[0],
+        'p50_ms': percentile(ordered, 0.5),
+        'p90_ms': percentile(ordered, 0.9),
+        'p99_ms': percentile(ordered, 0.99),
+        'max_ms': ordered[-1],
+        'mean_ms': sum(ordered) / len(ordered),
+    }
+
+
+class Recorder:
+    """Замер операций сценария
+
+    Каждая операция один раз выполняется под tracemalloc (пик памяти
+    Python и прогрев), затем repeat раз без него для замера времени.
+    После каждого повтора вызывается update_idletasks(), поэтому в
+    замер входят отложенные перерисовки и пересчёт геометрии Tk.
+
+    Пример:
+        >>> bench.measure('create', lambda parent: ListBox(parent, items),
+        ...               setup=bench.frame)
+        >>> listbox = ListBox(bench.frame(), items)
+        >>> bench.measure('search', lambda: listbox.search("77"))
+    """
+
+    def __init__(self, root, repeat=5, max_time=10.0):
+        """Инициализация
+
+        Args:
+            root (tk.Tk): Корневое окно
+            repeat (int): Количество повторов для замера времени
+            max_time (float): Не начинать новый повтор, если операция уже
+                заняла больше max_time секунд (минимум один повтор)
+        """
+        self.root = root
+        self.repeat = repeat
+        self.max_time = max_time
+        self.scenario = None
+        self.size = None
+        self.results = []
+        self._frames = []
+
+    def frame(self):
+        """Новый фрейм в корневом окне
+
+        Фреймы, созданные в setup, уничтожаются после каждого повтора,
+        остальные - в конце сценария.
+        """
+        frame = tk.Frame(self.root)
+        frame.pack(fill=tk.BOTH, expand=True)
+        self._frames.append(frame)
+        return frame
+
+    def _release(self, keep):
+        """Уничтожить фреймы, созданные после первых keep"""
+        while len(self._frames) > keep:
+            self._frames.pop().destroy()
+        self.root.update_idletasks()
+
+    def _run(self, fn, setup):
+        """Один повтор: время в секундах"""
+        keep = len(self._frames)
+        args = () if setup is None else (setup(),)
+        self.root.update_idletasks()
+        start = time.perf_counter()
+        fn(*args)
+        self.root.update_idletasks()
+        elapsed = time.perf_counter() - start
+        self._release(keep)
+        return elapsed
+
+    def measure(self, op, fn, setup=None, repeat=None):
+        """Замерить операцию
+
+        Args:
+            op (str): Название операции
+            fn (callable): Замеряемая функция; если задан setup, получает
+                его результат
+            setup (callable): Подготовка перед каждым повтором (не входит
+                в замер)
+            repeat (int): Количество повторов (по умолчанию self.repeat)
+        """
+        tracemalloc.start()
+        try:
+            first = self._run(fn, setup)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        samples = []
+        total = 0.0
+        for _ in range(repeat or self.repeat):
+            if samples and total > self.max_time:
+                break
+            samples.append(self._run(fn, setup))
+            total += samples[-1]
+
+        result = {'scenario': self.scenario, 'op': op, 'size': self.size,
+                  'first_ms': first * 1000}
+        result.update(summarize(samples))
+        result['peak_kb'] = peak / 1024
+        self.results.append(result)
+        return result
+
+    def finish(self):
+        """Уничтожить все фреймы сценария"""
+        self._release(0)
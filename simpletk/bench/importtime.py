@@ -0,0 +1,121 @@
+"""Время импорта simpletk
+
+Импорт замеряется в отдельном процессе с `python -X importtime`, чтобы
+не учитывать уже загруженные модули. Кроме времени проверяется, что
+`import simpletk` не загружает модули, которые нужны только отдельным
+элементам (ttk, диалоги, concurrent.futures, sqlite3).
+
+Запуск:
+    python -m simpletk.bench.importtime
+    python -m simpletk.bench.importtime --budget 40 --runs 10
+
+Код возврата 1, если бюджет превышен или загружен лишний модуль.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+# Бюджет времени импорта simpletk в миллисекундах (вместе с tkinter)
+DEFAULT_BUDGET_MS = 60
+
+# Модули, которые не должны загружаться при `import simpletk`
+LAZY_MODULES = (
+    'tkinter.ttk', 'tkinter.messagebox', 'tkinter.filedialog',
+    'concurrent.futures', 'sqlite3',
+    'simpletk.controls', 'simpletk.containers',
+)
+
+
+def parse_importtime(output):
+    """Разобрать вывод -X importtime
+
+    Args:
+        output (str): stderr процесса
+
+    Returns:
+        dict: {модуль: (собственное время, суммарное время)} в микросекундах
+    """
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # Строка заголовка
+        times[parts[2].strip()] = (int(parts[0]), int(parts[1]))
+    return times
+
+
+def measure(module='simpletk', runs=5):
+    """Замерить время импорта модуля
+
+    Args:
+        module (str): Имя модуля
+        runs (int): Количество запусков (берётся лучший)
+
+    Returns:
+        dict: module, best_ms, runs_ms, slowest (10 модулей с наибольшим
+            собственным временем в лучшем запуске), loaded (загруженные
+            модули из LAZY_MODULES)
+    """
+    code = (f"import {module}, sys; "
+            f"print('\\n'.join(m for m in {LAZY_MODULES!r} if m in sys.modules))")
+    results = []
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                              capture_output=True, text=True, check=True)
+        times = parse_importtime(proc.stderr)
+        results.append((times[module][1], times, proc.stdout.split()))
+
+    best, times, loaded = min(results, key=lambda result: result[0])
+    slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)[:10]
+    return {
+        'module': module,
+        'best_ms': best / 1000,
+        'runs_ms': [result[0] / 1000 for result in results],
+        'slowest': [{'module': name, 'self_ms': own / 1000} for name, (own, total) in slowest],
+        'loaded': loaded,
+    }
+
+
+def check(budget_ms=DEFAULT_BUDGET_MS, module='simpletk', runs=5):
+    """Проверить бюджет времени импорта и ленивую загрузку
+
+    Returns:
+        tuple: (успех, результат measure())
+    """
+    result = measure(module, runs)
+    ok = result['best_ms'] <= budget_ms and not result['loaded']
+    return ok, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m simpletk.bench.importtime',
+                                     description="Время импорта simpletk")
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_MS,
+                        help="Бюджет в миллисекундах (по умолчанию %(default)s)")
+    parser.add_argument('--runs', type=int, default=5, help="Количество запусков")
+    parser.add_argument('--module', default='simpletk', help="Проверяемый модуль")
+    parser.add_argument('--json', action='store_true', help="Вывести результат в JSON")
+    args = parser.parse_args(argv)
+
+    ok, result = check(args.budget, args.module, args.runs)
+    result['budget_ms'] = args.budget
+    result['ok'] = ok
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print(f"import {result['module']}: {result['best_ms']:.1f} мс "
+              f"(бюджет {args.budget:g} мс)")
+        for item in result['slowest'][:5]:
+            print(f"  {item['self_ms']:7.1f} мс  {item['module']}")
+        if result['loaded']:
+            print("Загружены модули, которые должны импортироваться лениво: "
+                  + ", ".join(result['loaded']))
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
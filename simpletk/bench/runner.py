@@ -0,0 +1,151 @@
+import argparse
+import datetime
+import gc
+import json
+import platform
+import sys
+import tkinter as tk
+
+from .compare import compare, format_comparison
+from .harness import Recorder, virtual_display
+from .scenarios import DEFAULT_SIZES, SCENARIOS
+
+
+def run(names=None, sizes=DEFAULT_SIZES, repeat=5, max_time=10.0, xvfb=False, log=None):
+    """Выполнить сценарии замеров
+
+    Args:
+        names (list): Имена сценариев (по умолчанию все)
+        sizes (list): Размеры данных
+        repeat (int): Количество повторов каждой операции
+        max_time (float): Ограничение времени повторов одной операции в секундах
+        xvfb (bool): Запустить Xvfb, даже если DISPLAY задан
+        log (callable): Вызывается с текстом о ходе замеров
+
+    Returns:
+        dict: {'meta': сведения о запуске, 'results': список замеров}
+    """
+    from .. import __version__
+
+    names = list(names or SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Неизвестные сценарии: {', '.join(unknown)}")
+
+    with virtual_display(force=xvfb) as display:
+        root = tk.Tk()
+        root.geometry("1024x768")
+        try:
+            meta = {
+                'simpletk': __version__,
+                'python': platform.python_version(),
+                'tk': root.tk.call('info', 'patchlevel'),
+                'platform': platform.platform(),
+                'display': display,
+                'date': datetime.datetime.now().isoformat(timespec='seconds'),
+                'sizes': list(sizes),
+                'repeat': repeat,
+            }
+            bench = Recorder(root, repeat=repeat, max_time=max_time)
+            for name in names:
+                func, max_size = SCENARIOS[name]
+                for size in sizes:
+                    if max_size is not None and size > max_size:
+                        continue
+                    if log:
+                        log(f"{name} [{size}]")
+                    bench.scenario, bench.size = name, size
+                    try:
+                        func(bench, size)
+                    finally:
+                        bench.finish()
+                        gc.collect()
+        finally:
+            root.destroy()
+    return {'meta': meta, 'results': bench.results}
+
+
+def _parse_sizes(text):
+    return [int(float(part)) for part in text.split(',') if part]
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0] not in ('run', 'compare', 'list', '-h', '--help'):
+        argv.insert(0, 'run')
+
+    parser = argparse.ArgumentParser(prog='python -m simpletk.bench',
+                                     description="Замеры производительности SimpleTK")
+    commands = parser.add_subparsers(dest='command')
+
+    run_parser = commands.add_parser('run', help="Выполнить замеры (по умолчанию)")
+    run_parser.add_argument('-o', '--output', help="Файл для результата JSON "
+                                                   "(по умолчанию - вывод в консоль)")
+    run_parser.add_argument('--only', help="Сценарии через запятую")
+    run_parser.add_argument('--sizes', type=_parse_sizes, default=list(DEFAULT_SIZES),
+                            help="Размеры данных через запятую (по умолчанию 1e3,1e4,1e5,1e6)")
+    run_parser.add_argument('--repeat', type=int, default=5, help="Повторов каждой операции")
+    run_parser.add_argument('--max-time', type=float, default=10.0,
+                            help="Ограничение времени повторов операции в секундах")
+    run_parser.add_argument('--xvfb', action='store_true',
+                            help="Запустить Xvfb, даже если DISPLAY задан")
+    run_parser.add_argument('--baseline', help="Сравнить с прежним JSON после замеров")
+    run_parser.add_argument('--threshold', type=float, default=0.1,
+                            help="Допустимый рост времени при сравнении (0.1 - 10%%)")
+
+    compare_parser = commands.add_parser('compare', help="Сравнить два файла JSON")
+    compare_parser.add_argument('base', help="Прежний запуск")
+    compare_parser.add_argument('new', help="Новый запуск")
+    compare_parser.add_argument('--threshold', type=float, default=0.1,
+                                help="Допустимый рост времени (0.1 - 10%%)")
+    compare_parser.add_argument('--min-ms', type=float, default=1.0,
+                                help="Разница в мс, которая не считается ухудшением")
+    compare_parser.add_argument('--metric', default='p50_ms',
+                                help="Сравниваемая величина (p50_ms, p90_ms, min_ms...)")
+    compare_parser.add_argument('--changed', action='store_true',
+                                help="Показывать только изменившиеся операции")
+    compare_parser.add_argument('--json', action='store_true', help="Вывести сравнение в JSON")
+
+    commands.add_parser('list', help="Показать сценарии")
+    args = parser.parse_args(argv)
+
+    if args.command == 'list':
+        for name, (func, max_size) in SCENARIOS.items():
+            limit = f" (до {max_size})" if max_size else ""
+            print(f"{name}{limit}")
+        return 0
+
+    if args.command == 'compare':
+        with open(args.base, encoding='utf-8') as f:
+            base = json.load(f)
+        with open(args.new, encoding='utf-8') as f:
+            new = json.load(f)
+        rows = compare(base, new, threshold=args.threshold, min_ms=args.min_ms,
+                       metric=args.metric)
+        if args.json:
+            print(json.dumps(rows, ensure_ascii=False, indent=2))
+        else:
+            print(format_comparison(rows, only_changed=args.changed))
+        return 1 if any(row['status'] == 'regression' for row in rows) else 0
+
+    names = args.only.split(',') if args.only else None
+    try:
+        result = run(names, sizes=args.sizes, repeat=args.repeat, max_time=args.max_time,
+                     xvfb=args.xvfb, log=lambda text: print(text, file=sys.stderr))
+    except (RuntimeError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 2
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            base = json.load(f)
+        rows = compare(base, result, threshold=args.threshold)
+        print(format_comparison(rows, only_changed=True), file=sys.stderr)
+        return 1 if any(row['status'] == 'regression' for row in rows) else 0
+    return 0
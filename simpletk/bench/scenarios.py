@@ -0,0 +1,193 @@
+import random
+import tkinter as tk
+from typing import Callable, Dict, Optional, Tuple
+
+from ..containers import Grid, ScrollableFrame, Table, Vertical
+from ..controls import Button, Checkbox, Dropdown, Input, Label, ListBox, SearchableList
+
+DEFAULT_SIZES = (1000, 10000, 100000, 1000000)
+
+# Сценарии: имя -> (функция, наибольший размер или None)
+SCENARIOS: Dict[str, Tuple[Callable, Optional[int]]] = {}
+
+_WORDS = ("альфа", "бета", "гамма", "дельта", "эпсилон", "дзета", "эта", "тета",
+          "йота", "каппа", "лямбда", "мю", "apple", "banana", "cherry", "delta")
+
+
+def scenario(name, max_size=None):
+    """Зарегистрировать сценарий
+
+    Args:
+        name (str): Имя сценария
+        max_size (int): Наибольший размер данных (большие пропускаются)
+    """
+    def register(func):
+        SCENARIOS[name] = (func, max_size)
+        return func
+    return register
+
+
+def make_items(n, seed=0):
+    """Строки для списков: одинаковые для одного n в любом запуске"""
+    rnd = random.Random(seed + n)
+    words = [rnd.choice(_WORDS) for _ in range(n)]
+    numbers = list(range(n))
+    rnd.shuffle(numbers)
+    return [f"{word} {number:07d}" for word, number in zip(words, numbers)]
+
+
+def make_rows(n, seed=0):
+    """Строки для таблицы: название, цена, количество"""
+    rnd = random.Random(seed + n)
+    return [[item, str(rnd.randint(1, 100000)), str(rnd.randint(0, 500))]
+            for item in make_items(n, seed)]
+
+
+# Списки
+@scenario('listbox', max_size=100000)
+def bench_listbox(bench, n):
+    _list_ops(bench, n, virtual=False)
+
+
+@scenario('listbox_virtual')
+def bench_listbox_virtual(bench, n):
+    _list_ops(bench, n, virtual=True)
+
+
+def _list_ops(bench, n, virtual):
+    items = make_items(n)
+    bench.measure('create', lambda parent: ListBox(parent, items, virtual=virtual),
+                  setup=bench.frame)
+    listbox = ListBox(bench.frame(), items, virtual=virtual)
+    bench.measure('search', lambda: listbox.search("7"))
+    bench.measure('clear_search', listbox.clear_search)
+    bench.measure('sort', lambda: (listbox.sort(), listbox.sort(reverse=True)))
+    added = make_items(1000, seed=1)
+    bench.measure('add_items_1k', lambda: listbox.add_items(added), repeat=1)
+
+
+@scenario('searchable_list', max_size=100000)
+def bench_searchable_list(bench, n):
+    items = make_items(n)
+    bench.measure('create', lambda parent: SearchableList(parent, items), setup=bench.frame)
+    lst = SearchableList(bench.frame(), items)
+    bench.measure('search', lambda: lst.search("7"))
+    bench.measure('search_startswith', lambda: lst.search_startswith("гамма"))
+    bench.measure('search_fuzzy', lambda: lst.search_fuzzy("гама 12"))
+    bench.measure('clear_search', lst.clear_search)
+    bench.measure('sort_by_length', lst.sort_by_length_desc)
+
+
+@scenario('dropdown')
+def bench_dropdown(bench, n):
+    items = make_items(n)
+    bench.measure('create', lambda parent: Dropdown(parent, items, autocomplete=True),
+                  setup=bench.frame)
+    dropdown = Dropdown(bench.frame(), items, autocomplete=True)
+
+    def type_text(text):
+        dropdown.value.set(text)
+        dropdown._on_type()
+        bench.root.update_idletasks()  # Отложенное обновление вариантов
+
+    bench.measure('autocomplete', lambda: (type_text("бе"), type_text("бета 00")))
+    bench.measure('sort', lambda: (dropdown.sort_ascending(), dropdown.sort_descending()))
+    added = make_items(1000, seed=1)
+    bench.measure('add_items_1k', lambda: dropdown.add_items(added), repeat=1)
+
+
+# Таблица
+@scenario('table')
+def bench_table(bench, n):
+    rows = make_rows(n)
+    columns = ["Название", "Цена", "Кол-во"]
+    bench.measure('create', lambda parent: Table(parent, columns, rows, rows_per_page=50),
+                  setup=bench.frame)
+    table = Table(bench.frame(), columns, rows, rows_per_page=50)
+    bench.measure('show_page', lambda: (table.next_page(), table.prev_page()))
+    bench.measure('sort_by', lambda: (table.sort_by("Цена"), table.sort_by("Название")))
+    bench.measure('set_filter', lambda: (table.set_filter("Цена", "100..5000"),
+                                         table.clear_filter()))
+
+
+@scenario('table_virtual')
+def bench_table_virtual(bench, n):
+    rows = make_rows(n)
+    columns = ["Название", "Цена", "Кол-во"]
+    table = Table(bench.frame(), columns, rows, rows_per_page=40, virtual=True)
+    middle = n // 2
+    bench.measure('scroll', lambda: (table._scroll_to(middle), table._scroll_to(0)))
+    bench.measure('sort_by', lambda: (table.sort_by("Цена"), table.sort_by("Название")))
+
+
+# Контейнеры
+@scenario('scrollable_rows')
+def bench_scrollable_rows(bench, n):
+    items = make_items(n)
+
+    def bind_row(widget, index):
+        widget.config(text=items[index])
+
+    def create(parent):
+        scroll = ScrollableFrame(parent, height=400, row_count=n, row_height=20,
+                                 bind_row=bind_row)
+        scroll.pack(fill=tk.BOTH, expand=True)
+        return scroll
+
+    bench.measure('create', create, setup=bench.frame)
+    scroll = create(bench.frame())
+    bench.measure('scroll_to_row', lambda: (scroll.scroll_to_row(n // 2),
+                                            scroll.scroll_to_row(0)))
+    bench.measure('set_row_count', lambda: (scroll.set_row_count(n // 2),
+                                            scroll.set_row_count(n)))
+
+
+@scenario('scrollable_populate', max_size=10000)
+def bench_scrollable_populate(bench, n):
+    def populate(parent):
+        scroll = ScrollableFrame(parent, height=400)
+        scroll.pack(fill=tk.BOTH, expand=True)
+        with scroll.batch():
+            for i in range(n):
+                tk.Label(scroll.scrollable_frame, text=f"Строка {i}").pack(fill=tk.X)
+
+    bench.measure('populate', populate, setup=bench.frame)
+
+
+@scenario('containers', max_size=10000)
+def bench_containers(bench, n):
+    def labels(parent):
+        return [tk.Label(parent, text=f"Строка {i}") for i in range(n)]
+
+    def vertical():
+        parent = bench.frame()
+        return Vertical(parent), labels(parent)
+
+    def grid():
+        parent = bench.frame()
+        return Grid(parent, rows=(n + 9) // 10, cols=10), labels(parent)
+
+    def add_each(args):
+        container, widgets = args
+        for widget in widgets:
+            container.add(widget)
+
+    def add_many(args):
+        container, widgets = args
+        container.add_many(widgets)
+
+    bench.measure('vertical_add', add_each, setup=vertical)
+    bench.measure('vertical_add_many', add_many, setup=vertical)
+    bench.measure('grid_add', add_each, setup=grid)
+    bench.measure('grid_add_many', add_many, setup=grid)
+
+
+@scenario('widgets', max_size=10000)
+def bench_widgets(bench, n):
+    def create(factory):
+        return lambda parent: [factory(parent, i) for i in range(n)]
+
+    bench.measure('button', create(lambda p, i: Button(p, f"Кнопка {i}")), setup=bench.frame)
+    bench.measure('label', create(lambda p, i: Label(p, f"Метка {i}")), setup=bench.frame)
+    bench.measure('input', create(lambda p, i: Input(p, f"Поле {i}")), setup=bench.frame)
+    bench.measure('checkbox', create(lambda p, i: Checkbox(p, f"Флажок {i}")), setup=bench.frame)
@@ -0,0 +1,55 @@
+import functools
+
+from .profiler import profiled
+
+# Флаг кода async def (inspect.CO_COROUTINE); inspect не импортируется ради
+# времени импорта simpletk
+_CO_COROUTINE = 0x80
+
+
+def is_async(callback):
+    """Объявлен ли обработчик через async def
+
+    Учитываются связанные методы и functools.partial.
+    """
+    func = getattr(callback, '__func__', callback)
+    while isinstance(func, functools.partial):
+        func = func.func
+    code = getattr(func, '__code__', None)
+    return code is not None and bool(code.co_flags & _CO_COROUTINE)
+
+
+def wrap_callback(widget, callback, name):
+    """Подготовить обработчик пользователя для передачи в tkinter
+
+    Через эту функцию элементы пропускают on_click, on_change, on_select
+    и другие обработчики, которые передаёт пользователь:
+        - обработчик async def запускается задачей asyncio (работает в
+          App.run_async() и App.run_forever())
+        - при App(profile=True) замеряется время вызова (см. profiled)
+
+    Args:
+        widget: Виджет tkinter, по которому находится главное окно
+        callback (callable): Обработчик (None возвращается как есть)
+        name (str): Название обработчика в статистике профилировщика
+
+    Returns:
+        callable: Обычная функция, которую можно передать в tkinter
+    """
+    if callback is None:
+        return None
+    if is_async(callback):
+        callback = _as_task(widget, callback)
+    return profiled(widget, callback, name)
+
+
+def _as_task(widget, callback):
+    """Обработчик, запускающий корутину callback задачей asyncio"""
+    @functools.wraps(callback)
+    def start(*args, **kwargs):
+        runner = getattr(widget._root(), '_simpletk_async', None)
+        if runner is None:
+            raise RuntimeError(f"Обработчик async def {callback.__qualname__} работает "
+                               f"только в App.run_async() или App.run_forever()")
+        return runner.spawn(callback(*args, **kwargs))
+    return start
@@ -1,14 +1,39 @@
 """Контейнеры SimpleTK"""
 
-from .horizontal import Horizontal
-from .vertical import Vertical
-from .grid import Grid
-from .scrollable import ScrollableFrame
-from .tabs import Tabs
-from .pages import Pages
-from .table import Table
+import importlib
 
 __all__ = [
     'Horizontal', 'Vertical', 'Grid', 'ScrollableFrame',
-    'Tabs', 'Pages', 'Table'
-]
\ No newline at end of file
+    'Tabs', 'Pages', 'Table',
+    'DataSource', 'ListDataSource', 'SQLiteDataSource', 'ColumnarDataSource',
+    'CSVDataSource'
+]
+
+# Модули контейнеров импортируются при первом обращении к классу
+_LAZY = {
+    'Horizontal': 'horizontal',
+    'Vertical': 'vertical',
+    'Grid': 'grid',
+    'ScrollableFrame': 'scrollable',
+    'Tabs': 'tabs',
+    'Pages': 'pages',
+    'Table': 'table',
+    'DataSource': 'datasource',
+    'ListDataSource': 'datasource',
+    'SQLiteDataSource': 'datasource',
+    'ColumnarDataSource': 'columnar',
+    'CSVDataSource': 'csvsource',
+}
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+def __getattr__(name):
+    """Ленивый импорт классов контейнеров"""
+    if name in _LAZY:
+        value = getattr(importlib.import_module('.' + _LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"Модуль '{__name__}' не имеет атрибута '{name}'")
@@ -0,0 +1,245 @@
+from array import array
+
+from .datasource import ListDataSource
+
+# Типы колонок, которые хранятся в типизированных массивах
+_ARRAY_TYPES = {
+    'number': ('d', float),
+    'int': ('q', int),
+}
+
+
+class StringColumn:
+    """Колонка со словарным кодированием значений
+
+    Каждое уникальное значение хранится один раз, а для строк таблицы
+    хранятся только 4-байтовые коды в array('I'). Повторяющиеся строки
+    (категории, города, статусы) занимают в десятки раз меньше памяти,
+    а ключи сортировки и условия фильтра вычисляются один раз на
+    уникальное значение.
+    """
+
+    def __init__(self, values=()):
+        """Инициализация
+
+        Args:
+            values: Начальные значения (должны быть хешируемыми)
+        """
+        self.codes = array('I')
+        self.strings = []
+        self._lookup = {}
+        self.extend(values)
+
+    def _code(self, value):
+        """Код значения (новое значение добавляется в словарь)"""
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.strings)
+            self.strings.append(value)
+        return code
+
+    def extend(self, values):
+        """Дописать значения в конец колонки"""
+        self.codes.extend(map(self._code, values))
+
+    def take(self, positions):
+        """Новая колонка из значений с указанными номерами
+
+        Коды копируются без повторного кодирования значений;
+        неиспользуемые значения выбрасываются из словаря.
+        """
+        codes = array('I', map(self.codes.__getitem__, positions))
+        used = sorted(set(codes))
+        column = StringColumn()
+        if len(used) == len(self.strings):
+            column.codes = codes
+            column.strings = list(self.strings)
+            column._lookup = dict(self._lookup)
+            return column
+        remap = [0] * len(self.strings)
+        for new, old in enumerate(used):
+            remap[old] = new
+        column.codes = array('I', map(remap.__getitem__, codes))
+        column.strings = list(map(self.strings.__getitem__, used))
+        column._lookup = {value: code for code, value in enumerate(column.strings)}
+        return column
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.strings[code] for code in self.codes[index]]
+        return self.strings[self.codes[index]]
+
+    def __iter__(self):
+        return map(self.strings.__getitem__, self.codes)
+
+
+def _identity(value):
+    return value
+
+
+def _make_column(column_type, values):
+    """Создать хранилище колонки по её типу
+
+    'number' и 'int' хранятся в array('d') и array('q'), 'str' - в
+    StringColumn, остальные типы - в обычном списке.
+    """
+    if column_type in _ARRAY_TYPES:
+        typecode, convert = _ARRAY_TYPES[column_type]
+        try:
+            return array(typecode, map(convert, values))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Колонка типа {column_type} содержит нечисловое значение: {e}")
+    if column_type == 'str':
+        return StringColumn(values)
+    return list(values)
+
+
+def _take(column, positions):
+    """Оставить в колонке только значения с указанными номерами"""
+    if isinstance(column, StringColumn):
+        return column.take(positions)
+    if isinstance(column, array):
+        return array(column.typecode, map(column.__getitem__, positions))
+    return [column[p] for p in positions]
+
+
+class ColumnarDataSource(ListDataSource):
+    """Источник данных в памяти с поколоночным хранением
+
+    Каждая колонка хранится отдельно: числа ('number', 'int') - в
+    типизированных массивах, строки ('str') - со словарным кодированием
+    (StringColumn), остальные - в списках. Строка таблицы собирается из
+    колонок только при выводе. Для миллиона строк это в несколько раз
+    меньше памяти, чем список списков, а фильтры и сортировка работают
+    прямо по массивам колонок.
+
+    Как и в ListDataSource, у строк есть постоянные идентификаторы, а
+    удаление только помечает строку: массивы колонок сжимаются, когда
+    удалённых строк становится больше, чем живых.
+
+    Значения числовых колонок приводятся к float или int; строки
+    возвращаются как списки.
+
+    Пример:
+        >>> source = ColumnarDataSource([["Товар 1", 100], ["Товар 2", 200]],
+        ...                             column_types={0: 'str', 1: 'int'})
+        >>> table = Table(app, ["Название", "Цена"], source=source, virtual=True)
+    """
+
+    def __init__(self, rows=None, column_types=None):
+        """Инициализация
+
+        Args:
+            rows (list): Начальные строки (копируются в колонки)
+            column_types (dict): {номер колонки: тип}; типы те же, что
+                для сортировки: 'auto', 'str', 'number', 'int', 'date'
+        """
+        super().__init__()
+        self.column_types = dict(column_types or {})
+        self._data = []  # Список колонок (создаётся по первой строке)
+        if rows:
+            self.extend(rows)
+
+    @property
+    def rows(self):
+        """Все строки списком (собираются из колонок)"""
+        self._prepare()
+        self._compact()
+        return [self._row(p) for p in range(self._size())]
+
+    @rows.setter
+    def rows(self, rows):
+        """Заменить все строки (копируются в колонки)"""
+        self.clear()
+        self.extend(rows)
+
+    def set_column_types(self, column_types):
+        super().set_column_types(column_types)
+        if self._data:
+            self._data = [_make_column(self.column_types.get(i, 'auto'), column)
+                          for i, column in enumerate(self._data)]
+
+    # Хранение строк
+    def _size(self):
+        return len(self._data[0]) if self._data else 0
+
+    def _row(self, position):
+        return [column[position] for column in self._data]
+
+    def _values(self, column):
+        return self._data[column] if self._data else []
+
+    def _key(self, column):
+        if isinstance(self._values(column), array):
+            # В типизированном массиве нет нечисловых значений
+            return _identity
+        return super()._key(column)
+
+    def _sort_keys(self, column):
+        values = self._values(column)
+        if isinstance(values, StringColumn):
+            key = self._key(column)
+            keys = [key(value) for value in values.strings]
+            return [keys[code] for code in values.codes]
+        return super()._sort_keys(column)
+
+    def _predicate_values(self, column, predicate):
+        values = self._values(column)
+        if isinstance(values, StringColumn):
+            # Условие проверяется один раз для каждого уникального значения
+            matches = [bool(predicate(value)) for value in values.strings]
+            return values.codes, matches.__getitem__
+        return values, predicate
+
+    def _store(self, rows):
+        if not rows:
+            return
+        if not self._data:
+            self._data = [_make_column(self.column_types.get(i, 'auto'), ())
+                          for i in range(len(rows[0]))]
+        for i, column in enumerate(self._data):
+            values = [row[i] for row in rows]
+            if isinstance(column, array):
+                column.extend(_make_column(self.column_types.get(i, 'auto'), values))
+            else:
+                column.extend(values)
+
+    def _drop(self, kept):
+        self._data = [_take(column, kept) for column in self._data]
+
+    def to_numpy(self, column):
+        """Колонка в виде массива NumPy
+
+        Числовые колонки передаются без копирования (через буфер array).
+        Требует установленного пакета numpy.
+
+        Args:
+            column (int): Номер колонки
+
+        Returns:
+            numpy.ndarray: Значения колонки
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("Для to_numpy() нужен пакет numpy: pip install numpy")
+        self._prepare()
+        self._compact()
+        values = self._data[column]
+        if isinstance(values, array):
+            dtype = numpy.float64 if values.typecode == 'd' else numpy.int64
+            return numpy.frombuffer(values, dtype=dtype)
+        return numpy.array(list(values), dtype=object)
+
+    # Изменение данных
+    def remove(self, row):
+        super().remove(list(row))
+
+    def clear(self):
+        self._data = []
+        self._ids = array('q')
+        self._dead = set()
+        self._reset_cache()
@@ -0,0 +1,233 @@
+import csv
+import io
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from itertools import accumulate, chain
+
+from .columnar import ColumnarDataSource, StringColumn
+
+_BOM = b'\xef\xbb\xbf'
+
+# Заголовок файла индекса: метка, размер и время изменения CSV, контрольная
+# сумма параметров разбора (кодировка, разделитель, кавычки), число записей
+_INDEX_HEADER = struct.Struct('<8sqqIq')
+_INDEX_MAGIC = b'STKIDX02'
+
+
+class CSVDataSource(ColumnarDataSource):
+    """Источник данных для таблицы из CSV/TSV файла без загрузки в память
+
+    При открытии файл один раз просматривается и строится индекс смещений
+    записей (array('q'), 8 байт на строку). Индекс сохраняется рядом с
+    файлом (path + '.idx') и при следующем открытии читается с диска, если
+    размер и время изменения файла, а также кодировка и параметры csv не
+    поменялись. Строки страницы читаются
+    по смещениям из отображения файла в память (mmap) и разбираются модулем
+    csv только при выводе.
+
+    Сортировка и фильтр по колонке один раз читают весь файл и сохраняют
+    значения этой колонки со словарным кодированием (StringColumn); дальше
+    работают те же кэши, что и в ListDataSource.
+
+    Источник только для чтения: add_row, delete_selected и clear таблицы
+    вызовут NotImplementedError.
+
+    Пример:
+        >>> source = CSVDataSource("export.csv")
+        >>> table = Table(app, source.columns, source=source, virtual=True)
+        >>> table = Table.from_csv(app, "export.csv", virtual=True)  # То же самое
+    """
+
+    def __init__(self, path, delimiter=None, encoding='utf-8', header=True,
+                 use_mmap=True, cache_index=True, **fmtparams):
+        """Открыть файл и построить (или прочитать) индекс строк
+
+        Args:
+            path (str): Путь к CSV/TSV файлу
+            delimiter (str): Разделитель (по умолчанию табуляция для .tsv и
+                .tab, иначе запятая)
+            encoding (str): Кодировка файла
+            header (bool): Первая запись - названия колонок
+            use_mmap (bool): Читать строки через mmap (иначе seek/read)
+            cache_index (bool): Сохранять индекс строк в path + '.idx'
+            **fmtparams: Дополнительные параметры csv.reader (quotechar и т.д.)
+        """
+        super().__init__()
+        if delimiter is None:
+            delimiter = '\t' if path.lower().endswith(('.tsv', '.tab')) else ','
+        self.path = path
+        self.encoding = encoding
+        self.fmtparams = dict(fmtparams, delimiter=delimiter)
+        self.index_path = path + '.idx'
+
+        self._file = open(path, 'rb')
+        self._mmap = None
+        if use_mmap and os.fstat(self._file.fileno()).st_size:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._offsets = self._load_index() if cache_index else None
+        if self._offsets is None:
+            self._offsets = self._scan()
+            if cache_index:
+                self._save_index()
+
+        # Названия колонок из заголовка или по номерам первой записи
+        first_record = self._parse(0) if len(self._offsets) > 1 else []
+        self._first = 1 if header and first_record else 0
+        if self._first:
+            self.columns = first_record
+        else:
+            self.columns = [f"Колонка {i + 1}" for i in range(len(first_record))]
+
+    # Индекс строк
+    def _file_stamp(self):
+        """Размер и время изменения файла и сумма параметров разбора для проверки индекса"""
+        stat = os.fstat(self._file.fileno())
+        params = repr((self.encoding, sorted(self.fmtparams.items())))
+        return stat.st_size, stat.st_mtime_ns, zlib.crc32(params.encode('utf-8'))
+
+    def _scan(self):
+        """Построить индекс: смещения начала каждой записи и конца файла
+
+        Если в файле нет кавычек, записи совпадают с физическими строками и
+        смещения считаются на уровне C через accumulate() длин строк.
+        Иначе учитывается, что поле в кавычках может содержать перевод строки.
+        """
+        quote = self.fmtparams.get('quotechar', '"').encode(self.encoding)
+        f = self._file
+        f.seek(0)
+        start = len(_BOM) if f.read(len(_BOM)) == _BOM else 0
+
+        f.seek(start)
+        quoted = any(quote in block for block in iter(lambda: f.read(1 << 24), b''))
+        f.seek(start)
+
+        if not quoted:
+            return array('q', accumulate(chain((start,), map(len, f))))
+
+        offsets = array('q', [start])
+        position = start
+        inside = False
+        for line in f:
+            position += len(line)
+            if line.count(quote) % 2:
+                inside = not inside
+            if not inside:
+                offsets.append(position)
+        if offsets[-1] != position:
+            # Незакрытая кавычка в конце файла
+            offsets.append(position)
+        return offsets
+
+    def _load_index(self):
+        """Прочитать индекс с диска или None, если он устарел"""
+        try:
+            with open(self.index_path, 'rb') as f:
+                magic, size, mtime, params, count = _INDEX_HEADER.unpack(
+                    f.read(_INDEX_HEADER.size))
+                if magic != _INDEX_MAGIC or (size, mtime, params) != self._file_stamp():
+                    return None
+                offsets = array('q')
+                offsets.fromfile(f, count)
+                return offsets
+        except (OSError, EOFError, struct.error):
+            return None
+
+    def _save_index(self):
+        """Сохранить индекс рядом с файлом (ошибки записи не критичны)"""
+        try:
+            with open(self.index_path, 'wb') as f:
+                f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, *self._file_stamp(), len(self._offsets)))
+                self._offsets.tofile(f)
+        except OSError:
+            pass
+
+    # Чтение записей
+    def _read(self, start, end):
+        """Байты файла в диапазоне [start, end)"""
+        if self._mmap is not None:
+            return self._mmap[start:end]
+        self._file.seek(start)
+        return self._file.read(end - start)
+
+    def _parse(self, record):
+        """Разобрать одну запись по её номеру в индексе"""
+        data = self._read(self._offsets[record], self._offsets[record + 1])
+        text = data.decode(self.encoding)
+        return next(csv.reader(io.StringIO(text, newline=''), **self.fmtparams), [])
+
+    def _iter_rows(self):
+        """Последовательно прочитать все строки данных"""
+        self._file.seek(self._offsets[self._first])
+        text = io.TextIOWrapper(self._file, encoding=self.encoding, newline='')
+        try:
+            yield from csv.reader(text, **self.fmtparams)
+        finally:
+            text.detach()
+
+    @property
+    def rows(self):
+        """Все строки списком (читается весь файл)"""
+        return list(self._iter_rows())
+
+    @rows.setter
+    def rows(self, rows):
+        raise NotImplementedError(f"{type(self).__name__} не поддерживает замену строк")
+
+    def set_column_types(self, column_types):
+        # Прочитанные колонки не зависят от типов, их не нужно читать заново
+        columns = self._columns
+        super().set_column_types(column_types)
+        self._columns = columns
+
+    def _prepare(self):
+        # Файл не меняется: идентификатор строки - её номер
+        pass
+
+    def _size(self):
+        return len(self._offsets) - 1 - self._first
+
+    def _row(self, position):
+        return self._parse(position + self._first)
+
+    def _values(self, column):
+        values = self._columns.get(column)
+        if values is None:
+            values = StringColumn(row[column] if column < len(row) else ''
+                                  for row in self._iter_rows())
+            self._columns[column] = values
+        return values
+
+    def fetch_keyed(self, offset, limit, sort=None, filter=None):
+        return [(p, self._row(p)) for p in self._fetch_positions(offset, limit, sort, filter)]
+
+    def get(self, row_id):
+        if not 0 <= row_id < self._size():
+            raise KeyError(row_id)
+        return self._row(row_id)
+
+    def close(self):
+        """Закрыть файл"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    # Источник только для чтения
+    def extend(self, rows):
+        raise NotImplementedError(f"{type(self).__name__} не поддерживает добавление строк")
+
+    def append(self, row):
+        self.extend([row])
+
+    def delete_ids(self, row_ids):
+        raise NotImplementedError(f"{type(self).__name__} не поддерживает удаление строк")
+
+    def remove(self, row):
+        raise NotImplementedError(f"{type(self).__name__} не поддерживает удаление строк")
+
+    def clear(self):
+        raise NotImplementedError(f"{type(self).__name__} не поддерживает очистку")
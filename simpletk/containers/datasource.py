@@ -0,0 +1,748 @@
+import bisect
+from array import array
+from itertools import compress, filterfalse
+from typing import Dict
+
+from .sorting import sort_key, ranks
+from .filtering import RowFilter
+
+
+class DataSource:
+    """Источник данных для таблицы
+
+    Таблица не хранит данные сама, а запрашивает у источника только
+    строки текущей страницы. Источник должен реализовать два метода:
+
+        count(filter=None) - количество строк
+        fetch(offset, limit, sort=None, filter=None) - строки страницы
+
+    sort - список пар (номер колонки, по убыванию), первая пара главная.
+    Колонки сравниваются по типам из column_types ('auto', 'str', 'number',
+    'int', 'date'), которые таблица передаёт через set_column_types().
+    filter - функция, принимающая строку и возвращающая True, если строку
+    нужно показать, обычно RowFilter с выражениями по колонкам.
+
+    Методы append, extend, remove и clear нужны только для изменения
+    данных через таблицу (add_row, delete_selected и т.д.).
+
+    Источник с постоянными идентификаторами строк (stable_ids = True)
+    реализует fetch_keyed, get и delete_ids: таблица использует
+    идентификатор как iid строки Treeview, поэтому выбор и удаление строки
+    не требуют поиска по значениям.
+    """
+
+    column_types: Dict[int, str] = {}  # {номер колонки: тип}
+    stable_ids = False
+
+    def count(self, filter=None):
+        """Количество строк
+
+        Args:
+            filter (callable): Фильтр строк
+
+        Returns:
+            int: Количество строк
+        """
+        raise NotImplementedError
+
+    def fetch(self, offset, limit, sort=None, filter=None):
+        """Получить строки
+
+        Args:
+            offset (int): Номер первой строки
+            limit (int): Максимальное количество строк
+            sort (list): Список пар (номер колонки, по убыванию)
+            filter (callable): Фильтр строк
+
+        Returns:
+            list: Список строк
+        """
+        raise NotImplementedError
+
+    def fetch_keyed(self, offset, limit, sort=None, filter=None):
+        """Получить строки вместе с идентификаторами
+
+        Без постоянных идентификаторов (stable_ids = False) идентификатором
+        служит номер строки в текущем представлении.
+
+        Returns:
+            list: Список пар (идентификатор, строка)
+        """
+        return list(enumerate(self.fetch(offset, limit, sort, filter), offset))
+
+    def get(self, row_id):
+        """Строка по постоянному идентификатору"""
+        raise NotImplementedError(f"{type(self).__name__} не поддерживает идентификаторы строк")
+
+    def delete_ids(self, row_ids):
+        """Удалить строки по постоянным идентификаторам"""
+        raise NotImplementedError(f"{type(self).__name__} не поддерживает идентификаторы строк")
+
+    def set_column_types(self, column_types):
+        """Задать типы колонок для сортировки
+
+        Args:
+            column_types (dict): {номер колонки: 'auto', 'str', 'number', 'int' или 'date'}
+        """
+        self.column_types = dict(column_types)
+
+    def append(self, row):
+        """Добавить строку"""
+        raise NotImplementedError(f"{type(self).__name__} не поддерживает добавление строк")
+
+    def extend(self, rows):
+        """Добавить несколько строк"""
+        for row in rows:
+            self.append(row)
+
+    def remove(self, row):
+        """Удалить все строки, равные row"""
+        raise NotImplementedError(f"{type(self).__name__} не поддерживает удаление строк")
+
+    def clear(self):
+        """Удалить все строки"""
+        raise NotImplementedError(f"{type(self).__name__} не поддерживает очистку")
+
+
+class ListDataSource(DataSource):
+    """Источник данных на основе списка строк в памяти
+
+    Для каждой колонки, по которой уже сортировали, хранится отсортированный
+    порядок строк. Он обновляется при добавлении и удалении строк, поэтому
+    повторная сортировка по той же колонке не требует пересортировки.
+
+    Фильтр RowFilter проверяется поколоночно, блоками по FILTER_CHUNK строк,
+    по копии значений колонки. Результат - массив номеров подходящих строк,
+    по которому затем идут постраничный вывод и выбор; сами строки не
+    копируются.
+
+    Каждая строка получает постоянный идентификатор (stable_ids = True).
+    Идентификаторы выдаются по возрастанию, поэтому строка по
+    идентификатору находится двоичным поиском без отдельного словаря.
+    Удалённые строки только помечаются: номера остальных строк и кэши
+    сортировки не меняются, count() вычитает количество помеченных, а
+    чтение их пропускает. Хранилище сжимается, когда помеченных строк
+    становится больше, чем живых (как в ItemStore).
+
+    Пример:
+        >>> source = ListDataSource([["Товар 1", 100], ["Товар 2", 200]])
+        >>> source.fetch(0, 1)
+        [['Товар 1', 100]]
+    """
+
+    FILTER_CHUNK = 65536
+    stable_ids = True
+
+    def __init__(self, rows=None):
+        """Инициализация
+
+        Args:
+            rows (list): Список строк (используется без копирования)
+        """
+        self._rows = rows if rows is not None else []
+        self.column_types = {}
+        self._ids = array('q')  # Номер строки -> идентификатор (по возрастанию)
+        self._next_id = 0
+        self._dead = set()  # Номера удалённых строк (до сжатия хранилища)
+        self._reset_cache()
+
+    @property
+    def rows(self):
+        """Список строк"""
+        self._prepare()
+        self._compact()
+        return self._rows
+
+    @rows.setter
+    def rows(self, rows):
+        self._rows = rows
+        self._ids = array('q')
+        self._dead = set()
+        self._reset_cache()
+
+    def _reset_cache(self):
+        """Сбросить кэши сортировки и фильтрации"""
+        self._sorted = {}  # колонка -> (ключи по возрастанию, номера строк)
+        self._ranks = {}   # колонка -> ранги строк
+        self._multi = None  # (sort, порядок) для сортировки по нескольким колонкам
+        self._columns = {}  # колонка -> список значений
+        self._filtered = None  # (фильтр, номера строк, количество строк)
+        self._view = None  # ((sort, фильтр), номера строк)
+        self._skips = {}  # sort -> индексы удалённых строк в порядке сортировки
+
+    def set_column_types(self, column_types):
+        super().set_column_types(column_types)
+        self._reset_cache()
+
+    # Хранение строк (переопределяется в ColumnarDataSource)
+    def _size(self):
+        """Количество строк в хранилище"""
+        return len(self._rows)
+
+    def _row(self, position):
+        """Строка по номеру"""
+        return self._rows[position]
+
+    def _values(self, column):
+        """Значения колонки отдельным списком (с кэшем)"""
+        values = self._columns.get(column)
+        if values is None or len(values) != len(self._rows):
+            values = [row[column] for row in self._rows]
+            self._columns[column] = values
+        return values
+
+    def _store(self, rows):
+        """Дописать строки в хранилище"""
+        self._rows.extend(rows)
+        for column, values in self._columns.items():
+            values.extend(row[column] for row in rows)
+
+    def _sort_keys(self, column):
+        """Ключи сортировки для всех строк колонки"""
+        return list(map(self._key(column), self._values(column)))
+
+    def _predicate_values(self, column, predicate):
+        """Значения колонки и предикат для поколоночной фильтрации"""
+        return self._values(column), predicate
+
+    def _drop(self, kept):
+        """Оставить в хранилище только строки с номерами kept (по возрастанию)"""
+        self._rows = list(map(self._rows.__getitem__, kept))
+        self._columns = {}
+
+    # Идентификаторы строк
+    def _prepare(self):
+        """Согласовать идентификаторы с хранилищем перед чтением
+
+        Выдаёт идентификаторы строкам, добавленным в список в обход
+        источника.
+        """
+        size = self._size()
+        if len(self._ids) < size:
+            start = self._next_id
+            self._next_id += size - len(self._ids)
+            self._ids.extend(range(start, self._next_id))
+        elif len(self._ids) > size:
+            # Строки удалены из списка напрямую - соответствие потеряно
+            self._ids = array('q', range(self._next_id, self._next_id + size))
+            self._next_id += size
+            self._dead = set()
+            self._reset_cache()
+
+    def _position(self, row_id):
+        """Номер строки по идентификатору или None"""
+        position = bisect.bisect_left(self._ids, row_id)
+        if (position < len(self._ids) and self._ids[position] == row_id
+                and position not in self._dead):
+            return position
+        return None
+
+    def _live(self):
+        """Количество неудалённых строк"""
+        return self._size() - len(self._dead)
+
+    def _skip_dead(self, offset, limit, deleted, total, position_at):
+        """Страница последовательности строк, минуя удалённые
+
+        Args:
+            offset (int): Номер первой строки среди неудалённых
+            limit (int): Количество строк
+            deleted (list): Индексы удалённых строк в последовательности по возрастанию
+            total (int): Длина последовательности вместе с удалёнными
+            position_at (callable): Номер строки по индексу в последовательности
+
+        Returns:
+            list: Номера строк
+        """
+        # Индекс = offset + количество удалённых до него включительно
+        index = offset
+        while True:
+            shifted = offset + bisect.bisect_right(deleted, index)
+            if shifted == index:
+                break
+            index = shifted
+        dead = self._dead
+        positions = []
+        while index < total and len(positions) < limit:
+            position = position_at(index)
+            if position not in dead:
+                positions.append(position)
+            index += 1
+        return positions
+
+    def _dead_indexes(self, sort):
+        """Индексы удалённых строк в порядке сортировки (с кэшем)
+
+        Для сортировки по одной колонке индекс удалённой строки находится
+        двоичным поиском по её ключу, без прохода по всему порядку.
+
+        Returns:
+            list: Индексы по возрастанию или None, если дешевле собрать
+                порядок без удалённых строк заново (_live_order)
+        """
+        spec = tuple(tuple(item) for item in sort or ())
+        if spec in self._skips:
+            return self._skips[spec]
+        dead = self._dead
+        if not spec:
+            indexes = sorted(dead)
+        elif len(spec) > 1 or len(dead) * 32 > self._size():
+            indexes = None
+        else:
+            column, descending = spec[0]
+            keys, order = self._column_order(column)
+            key = self._key(column)
+            values = self._values(column)
+            last = len(order) - 1
+            indexes = []
+            for position in dead:
+                index = bisect.bisect_left(keys, key(values[position]))
+                while index <= last and order[index] != position:
+                    index += 1  # Среди строк с тем же ключом
+                if index > last:
+                    index = order.index(position)  # Несравнимые ключи (NaN)
+                indexes.append(last - index if descending else index)
+            indexes.sort()
+        self._skips[spec] = indexes
+        return indexes
+
+    def _key(self, column):
+        """Функция-ключ сортировки для колонки"""
+        return sort_key(self.column_types.get(column, 'auto'))
+
+    def _column_order(self, column):
+        """Ключи и номера строк, отсортированные по колонке (с кэшем)"""
+        cached = self._sorted.get(column)
+        # Список мог измениться в обход источника (например, table.all_data.append)
+        if cached is None or len(cached[1]) != self._size():
+            values = self._sort_keys(column)
+            order = sorted(range(len(values)), key=values.__getitem__)
+            cached = ([values[i] for i in order], order)
+            self._sorted[column] = cached
+            self._ranks.pop(column, None)
+        return cached
+
+    def _column_ranks(self, column):
+        """Ранги строк по колонке (с кэшем)"""
+        keys, order = self._column_order(column)
+        if column not in self._ranks:
+            self._ranks[column] = ranks(keys, order)
+        return self._ranks[column]
+
+    def _order(self, sort):
+        """Порядок строк для сортировки
+
+        Returns:
+            tuple: (номера строк по возрастанию, читать ли с конца)
+        """
+        if len(sort) == 1:
+            column, descending = sort[0]
+            return self._column_order(column)[1], descending
+
+        spec = tuple(tuple(item) for item in sort)
+        if self._multi is None or self._multi[0] != spec or len(self._multi[1]) != self._size():
+            # Устойчивая сортировка по рангам, начиная с младшей колонки
+            order = list(range(self._size()))
+            for column, descending in reversed(spec):
+                order.sort(key=self._column_ranks(column).__getitem__, reverse=descending)
+            self._multi = (spec, order)
+        return self._multi[1], False
+
+    # Фильтрация
+    def _filter_positions(self, row_filter):
+        """Номера строк, подходящих под RowFilter (с кэшем)
+
+        Первый предикат проверяется по всей колонке блоками, следующие -
+        только по уже отобранным строкам. Удалённые строки не входят в
+        результат.
+        """
+        size = self._size()
+        cached = self._filtered
+        if cached is not None and cached[0] == row_filter and cached[2] == size:
+            return cached[1]
+
+        positions = None
+        for column, predicate in row_filter.predicates:
+            values, predicate = self._predicate_values(column, predicate)
+            if positions is None:
+                positions = array('q')
+                for start in range(0, size, self.FILTER_CHUNK):
+                    chunk = values[start:start + self.FILTER_CHUNK]
+                    positions.extend(compress(range(start, start + len(chunk)),
+                                              map(predicate, chunk)))
+            else:
+                positions = array('q', compress(
+                    positions, map(predicate, map(values.__getitem__, positions))))
+        if positions is None:
+            positions = array('q', range(size))
+        if self._dead:
+            positions = array('q', filterfalse(self._dead.__contains__, positions))
+
+        self._filtered = (row_filter, positions, size)
+        self._view = None
+        return positions
+
+    def _positions(self, sort, filter):
+        """Номера строк представления с учётом сортировки и фильтра"""
+        if isinstance(filter, RowFilter):
+            matched = self._filter_positions(filter)
+            spec = (tuple(tuple(item) for item in sort or ()), filter)
+            if self._view is not None and self._view[0] == spec:
+                return self._view[1]
+            if sort:
+                order, reverse = self._order(sort)
+                mask = bytearray(self._size())
+                for p in matched:
+                    mask[p] = 1
+                positions = array('q', (p for p in (reversed(order) if reverse else order)
+                                        if mask[p]))
+            else:
+                positions = matched
+            self._view = (spec, positions)
+            return positions
+
+        if sort:
+            order, reverse = self._order(sort)
+            if reverse:
+                order = order[::-1]
+        else:
+            order = range(self._size())
+        if self._dead:
+            order = filterfalse(self._dead.__contains__, order)
+        if filter is None:
+            return order
+        return [p for p in order if filter(self._row(p))]
+
+    def _live_order(self, sort):
+        """Порядок сортировки без удалённых строк (с кэшем до изменения данных)"""
+        spec = (tuple(tuple(item) for item in sort), None)
+        if self._view is None or self._view[0] != spec:
+            order, reverse = self._order(sort)
+            positions = array('q', filterfalse(self._dead.__contains__,
+                                               reversed(order) if reverse else order))
+            self._view = (spec, positions)
+        return self._view[1]
+
+    def _fetch_positions(self, offset, limit, sort, filter):
+        """Номера строк страницы"""
+        if filter is None and self._dead:
+            deleted = self._dead_indexes(sort)
+            if deleted is None:
+                return self._live_order(sort)[offset:offset + limit]
+            size = self._size()
+            if not sort:
+                return self._skip_dead(offset, limit, deleted, size, _identity)
+            order, reverse = self._order(sort)
+            if reverse:
+                return self._skip_dead(offset, limit, deleted, size,
+                                       lambda index: order[size - 1 - index])
+            return self._skip_dead(offset, limit, deleted, size, order.__getitem__)
+        if not sort and filter is None:
+            return range(offset, min(offset + limit, self._size()))
+        if filter is None:
+            # Берём только нужный участок готового порядка
+            order, reverse = self._order(sort)
+            if reverse:
+                end = max(0, len(order) - offset)
+                return order[max(0, end - limit):end][::-1]
+            return order[offset:offset + limit]
+        return self._positions(sort, filter)[offset:offset + limit]
+
+    def count(self, filter=None):
+        self._prepare()
+        if filter is None:
+            return self._live()
+        if isinstance(filter, RowFilter):
+            return len(self._filter_positions(filter))
+        dead = self._dead
+        return sum(1 for p in range(self._size()) if p not in dead and filter(self._row(p)))
+
+    def fetch(self, offset, limit, sort=None, filter=None):
+        self._prepare()
+        return [self._row(p) for p in self._fetch_positions(offset, limit, sort, filter)]
+
+    def fetch_keyed(self, offset, limit, sort=None, filter=None):
+        self._prepare()
+        return [(self._ids[p], self._row(p))
+                for p in self._fetch_positions(offset, limit, sort, filter)]
+
+    def get(self, row_id):
+        """Строка по идентификатору
+
+        Args:
+            row_id (int): Идентификатор строки
+
+        Returns:
+            Строка (тот же объект, что был добавлен)
+
+        Raises:
+            KeyError: Если строки с таким идентификатором нет
+        """
+        position = self._position(row_id)
+        if position is None:
+            raise KeyError(row_id)
+        return self._row(position)
+
+    # Изменение данных
+    def append(self, row):
+        self.extend([row])
+
+    def extend(self, rows):
+        self._prepare()
+        rows = list(rows)
+        start = self._size()
+        self._store(rows)
+        size = self._size()
+        first_id = self._next_id
+        self._next_id += size - start
+        self._ids.extend(range(first_id, self._next_id))
+        self._ranks.clear()
+        self._multi = None
+        self._view = None
+        self._skips = {}
+        if self._filtered is not None:
+            # Новые строки проверяются отдельно и дописываются в конец
+            row_filter, positions, _ = self._filtered
+            positions.extend(p for p in range(start, size) if row_filter(self._row(p)))
+            self._filtered = (row_filter, positions, size)
+        if len(rows) * 16 > size:
+            # При большом добавлении дешевле отсортировать заново при запросе
+            self._sorted.clear()
+            return
+        for column, (keys, order) in self._sorted.items():
+            key = self._key(column)
+            values = self._values(column)
+            for position in range(start, size):
+                value = key(values[position])
+                index = bisect.bisect_right(keys, value)
+                keys.insert(index, value)
+                order.insert(index, position)
+
+    def _delete_positions(self, deleted):
+        """Пометить строки удалёнными
+
+        Кэши сортировки остаются верными: номера строк не меняются.
+        Хранилище сжимается, когда удалённых строк больше, чем живых.
+
+        Args:
+            deleted (set): Номера удаляемых строк
+        """
+        deleted = deleted - self._dead
+        if not deleted:
+            return
+        self._dead |= deleted
+        self._view = None
+        self._skips = {}
+        if self._filtered is not None:
+            row_filter, positions, size = self._filtered
+            positions = array('q', filterfalse(deleted.__contains__, positions))
+            self._filtered = (row_filter, positions, size)
+        if self._size() > 2 * self._live() + 1024:
+            self._compact()
+
+    def _compact(self):
+        """Убрать удалённые строки из хранилища
+
+        Номера строк меняются; отсортированные порядки пересчитываются
+        через таблицу новых номеров без повторной сортировки.
+        """
+        dead = self._dead
+        if not dead:
+            return
+        self._dead = set()
+        size = self._size()
+        kept = [p for p in range(size) if p not in dead]
+        remap = array('q', [-1]) * size
+        for new, old in enumerate(kept):
+            remap[old] = new
+        self._drop(kept)
+        self._ids = array('q', map(self._ids.__getitem__, kept))
+        self._ranks.clear()
+        self._multi = None
+        self._filtered = None
+        self._view = None
+        self._skips = {}
+        for column, (keys, order) in list(self._sorted.items()):
+            kept_keys = [key for key, p in zip(keys, order) if p not in dead]
+            self._sorted[column] = (kept_keys, [remap[p] for p in order if p not in dead])
+
+    def delete_ids(self, row_ids):
+        """Удалить строки по идентификаторам
+
+        Строки только помечаются (см. описание класса).
+
+        Args:
+            row_ids: Идентификаторы строк
+        """
+        self._prepare()
+        deleted = set()
+        for row_id in row_ids:
+            position = self._position(row_id)
+            if position is not None:
+                deleted.add(position)
+        self._delete_positions(deleted)
+
+    def remove(self, row):
+        self._prepare()
+        dead = self._dead
+        self._delete_positions({p for p in range(self._size())
+                                if p not in dead and self._row(p) == row})
+
+    def clear(self):
+        self.rows = []
+
+
+def _identity(value):
+    return value
+
+
+def _quote(name):
+    """Экранировать имя таблицы или колонки для SQL"""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+class SQLiteDataSource(DataSource):
+    """Источник данных на основе таблицы SQLite
+
+    Строки читаются через LIMIT/OFFSET, поэтому в памяти находится только
+    текущая страница, а таблица с миллионами строк открывается сразу.
+
+    Постоянный идентификатор строки - rowid SQLite (stable_ids = True),
+    поэтому delete_ids удаляет ровно выбранные строки, даже если в
+    таблице есть одинаковые.
+
+    Пример:
+        >>> source = SQLiteDataSource("data.db", "products",
+        ...                           columns=["Название", "Цена"])
+        >>> source.extend([["Товар 1", 100], ["Товар 2", 200]])
+        >>> table = Table(app, ["Название", "Цена"], source=source)
+    """
+
+    stable_ids = True
+    DELETE_CHUNK = 500  # Идентификаторов в одном DELETE (ограничение числа параметров)
+
+    def __init__(self, database, table, columns=None):
+        """Инициализация
+
+        Если таблицы нет и переданы columns, она будет создана.
+
+        Args:
+            database: Путь к файлу базы данных или объект sqlite3.Connection
+            table (str): Имя таблицы
+            columns (list): Имена колонок (по умолчанию все колонки таблицы)
+        """
+        import sqlite3
+        if isinstance(database, sqlite3.Connection):
+            self.connection = database
+        else:
+            self.connection = sqlite3.connect(database)
+        self.table = table
+
+        existing = [info[1] for info in
+                    self.connection.execute(f"PRAGMA table_info({_quote(table)})")]
+        if not existing and columns:
+            column_sql = ", ".join(_quote(column) for column in columns)
+            self.connection.execute(f"CREATE TABLE {_quote(table)} ({column_sql})")
+            self.connection.commit()
+            existing = list(columns)
+        self.columns = list(columns) if columns else existing
+
+        self._select = ", ".join(_quote(column) for column in self.columns)
+        self._count_cache = {}
+
+    def _where(self, filter):
+        """SQL-условие для фильтра
+
+        Фильтр-функция регистрируется в SQLite и вызывается для каждой строки.
+        """
+        if filter is None:
+            return ""
+        self.connection.create_function(
+            "simpletk_filter", len(self.columns), lambda *row: bool(filter(list(row))))
+        return f" WHERE simpletk_filter({self._select})"
+
+    def _order(self, sort):
+        """SQL-выражение сортировки с учётом типов колонок"""
+        if not sort:
+            return " ORDER BY rowid"
+        terms = []
+        for column, descending in sort:
+            expression = _quote(self.columns[column])
+            column_type = self.column_types.get(column, 'auto')
+            if column_type == 'number':
+                expression = f"CAST({expression} AS REAL)"
+            elif column_type == 'int':
+                expression = f"CAST({expression} AS INTEGER)"
+            elif column_type == 'str':
+                expression += " COLLATE NOCASE"
+            terms.append(f"{expression} {'DESC' if descending else 'ASC'}")
+        return " ORDER BY " + ", ".join(terms)
+
+    def count(self, filter=None):
+        if filter not in self._count_cache:
+            sql = f"SELECT COUNT(*) FROM {_quote(self.table)}" + self._where(filter)
+            self._count_cache[filter] = self.connection.execute(sql).fetchone()[0]
+        return self._count_cache[filter]
+
+    def fetch(self, offset, limit, sort=None, filter=None):
+        sql = (f"SELECT {self._select} FROM {_quote(self.table)}"
+               + self._where(filter) + self._order(sort) + " LIMIT ? OFFSET ?")
+        return [list(row) for row in self.connection.execute(sql, (limit, offset))]
+
+    def fetch_keyed(self, offset, limit, sort=None, filter=None):
+        sql = (f"SELECT rowid, {self._select} FROM {_quote(self.table)}"
+               + self._where(filter) + self._order(sort) + " LIMIT ? OFFSET ?")
+        return [(row[0], list(row[1:]))
+                for row in self.connection.execute(sql, (limit, offset))]
+
+    def get(self, row_id):
+        """Строка по rowid
+
+        Raises:
+            KeyError: Если строки с таким rowid нет
+        """
+        row = self.connection.execute(
+            f"SELECT {self._select} FROM {_quote(self.table)} WHERE rowid = ?",
+            (row_id,)).fetchone()
+        if row is None:
+            raise KeyError(row_id)
+        return list(row)
+
+    def _changed(self):
+        """Сохранить изменения и сбросить кэш количества строк"""
+        self.connection.commit()
+        self._count_cache.clear()
+
+    def append(self, row):
+        self.extend([row])
+
+    def extend(self, rows):
+        placeholders = ", ".join("?" * len(self.columns))
+        self.connection.executemany(
+            f"INSERT INTO {_quote(self.table)} ({self._select}) VALUES ({placeholders})",
+            (tuple(row) for row in rows))
+        self._changed()
+
+    def delete_ids(self, row_ids):
+        """Удалить строки по rowid
+
+        Args:
+            row_ids: Идентификаторы строк
+        """
+        row_ids = list(row_ids)
+        for start in range(0, len(row_ids), self.DELETE_CHUNK):
+            chunk = row_ids[start:start + self.DELETE_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            self.connection.execute(
+                f"DELETE FROM {_quote(self.table)} WHERE rowid IN ({placeholders})", chunk)
+        self._changed()
+
+    def remove(self, row):
+        condition = " AND ".join(f"{_quote(column)} IS ?" for column in self.columns)
+        self.connection.execute(
+            f"DELETE FROM {_quote(self.table)} WHERE {condition}", tuple(row))
+        self._changed()
+
+    def clear(self):
+        self.connection.execute(f"DELETE FROM {_quote(self.table)}")
+        self._changed()
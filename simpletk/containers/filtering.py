@@ -0,0 +1,164 @@
+import operator
+import re
+
+from .sorting import sort_key
+
+# Операторы сравнения в порядке проверки (двухсимвольные раньше односимвольных)
+_OPERATORS = (
+    ('>=', operator.ge),
+    ('<=', operator.le),
+    ('!=', operator.ne),
+    ('>', operator.gt),
+    ('<', operator.lt),
+    ('=', operator.eq),
+)
+
+
+def _to_number(value):
+    """Число из значения ячейки или None"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    try:
+        return float(str(value).replace(",", ".").strip())
+    except ValueError:
+        return None
+
+
+def _to_date(value):
+    """Дата из значения ячейки или None"""
+    kind, result = sort_key('date')(value)
+    return result if kind == 0 else None
+
+
+def _to_string(value):
+    """Строка в нижнем регистре"""
+    return "" if value is None else str(value).lower()
+
+
+_CONVERTERS = {
+    'number': _to_number,
+    'int': _to_number,
+    'date': _to_date,
+    'str': _to_string,
+}
+
+
+def _converter(column_type, operand):
+    """Выбрать преобразование значений для сравнения с operand
+
+    Для типа 'auto' числа сравниваются как числа, если операнд - число,
+    иначе как строки.
+    """
+    if column_type == 'auto':
+        column_type = 'number' if _to_number(operand) is not None else 'str'
+    convert = _CONVERTERS[column_type]
+    target = convert(operand)
+    if target is None:
+        raise ValueError(f"Значение '{operand}' не подходит для колонки типа {column_type}")
+    return convert, target
+
+
+def compile_expression(expr, column_type='auto'):
+    """Скомпилировать выражение фильтра в функцию-предикат для значения ячейки
+
+    Поддерживаемые выражения:
+        =значение, !=значение  - равенство и неравенство
+        >5, >=5, <5, <=5       - сравнение
+        10..20                 - диапазон (включительно)
+        ~текст или текст       - содержит подстроку (без учёта регистра)
+        /шаблон/ или /шаблон/i - регулярное выражение
+
+    Args:
+        expr (str): Выражение
+        column_type (str): Тип колонки: 'auto', 'str', 'number', 'int' или 'date'
+
+    Returns:
+        callable: Функция, принимающая значение ячейки и возвращающая bool
+    """
+    expr = expr.strip()
+
+    regex = re.fullmatch(r'/(.*)/(i?)', expr, re.DOTALL)
+    if regex:
+        flags = re.IGNORECASE if regex.group(2) else 0
+        try:
+            pattern = re.compile(regex.group(1), flags)
+        except re.error as e:
+            raise ValueError(f"Неверное регулярное выражение '{expr}': {e}")
+        return lambda value: pattern.search(str(value)) is not None
+
+    if expr.startswith('~'):
+        text = expr[1:].lower()
+        return lambda value: text in _to_string(value)
+
+    if '..' in expr:
+        low, high = (part.strip() for part in expr.split('..', 1))
+        if column_type == 'auto':
+            # Обе границы сравниваются одним способом: как числа или как строки
+            numeric = _to_number(low) is not None
+            if numeric != (_to_number(high) is not None):
+                raise ValueError(f"Границы диапазона '{expr}' должны быть обе числами "
+                                 f"или обе текстом")
+            column_type = 'number' if numeric else 'str'
+        convert, low_value = _converter(column_type, low)
+        high_value = convert(high)
+        if high_value is None:
+            raise ValueError(f"Значение '{high}' не подходит для колонки типа {column_type}")
+
+        def in_range(value):
+            value = convert(value)
+            return value is not None and low_value <= value <= high_value
+        return in_range
+
+    for symbol, compare in _OPERATORS:
+        if expr.startswith(symbol):
+            convert, target = _converter(column_type, expr[len(symbol):].strip())
+
+            def check(value, compare=compare):
+                value = convert(value)
+                if value is None:
+                    return compare is operator.ne
+                return compare(value, target)
+            return check
+
+    text = expr.lower()
+    return lambda value: text in _to_string(value)
+
+
+class RowFilter:
+    """Набор фильтров по колонкам, объединённых условием И
+
+    Объект можно вызвать со строкой как обычную функцию-фильтр, поэтому он
+    подходит любому источнику данных. ListDataSource дополнительно проверяет
+    фильтры поколоночно, блоками, и кэширует номера подходящих строк.
+
+    Пример:
+        >>> row_filter = RowFilter({1: ">=100", 0: "~товар"})
+        >>> row_filter(["Товар 1", 150])
+        True
+    """
+
+    def __init__(self, expressions, column_types=None):
+        """Инициализация
+
+        Args:
+            expressions (dict): {номер колонки: выражение}
+            column_types (dict): {номер колонки: тип}
+        """
+        column_types = column_types or {}
+        self.expressions = dict(expressions)
+        self.predicates = []
+        key = []
+        for column, expr in sorted(self.expressions.items()):
+            column_type = column_types.get(column, 'auto')
+            self.predicates.append((column, compile_expression(expr, column_type)))
+            key.append((column, expr, column_type))
+        self.key = tuple(key)
+
+    def __call__(self, row):
+        return all(predicate(row[column]) for column, predicate in self.predicates)
+
+    def __eq__(self, other):
+        return isinstance(other, RowFilter) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
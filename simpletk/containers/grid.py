@@ -53,4 +53,36 @@ class Grid:
         self.current_col += 1
         if self.current_col >= self.max_cols:
             self.current_col = 0
-            self.current_row += 1
\ No newline at end of file
+            self.current_row += 1
+            
+    def add_many(self, elements):
+        """Добавить несколько элементов, по одной команде grid на строку
+        
+        Элементы одной строки сетки передаются в одну команду Tcl (пустые
+        ячейки в начале строки пропускаются через "x"), а распространение
+        размеров на родителя отключается до конца вставки, поэтому
+        геометрия пересчитывается один раз.
+        
+        Args:
+            elements (list): Элементы для добавления (заполняют сетку по порядку)
+        """
+        widgets = [str(e.widget if hasattr(e, 'widget') else e) for e in elements]
+        if not widgets:
+            return
+        propagate = self.frame.grid_propagate()
+        self.frame.grid_propagate(False)
+        try:
+            start = 0
+            while start < len(widgets):
+                count = min(self.max_cols - self.current_col, len(widgets) - start)
+                row = ['x'] * self.current_col + widgets[start:start + count]
+                self.frame.tk.call('grid', 'configure', *row, '-in', str(self.frame),
+                                   '-row', self.current_row, '-padx', 2, '-pady', 2,
+                                   '-sticky', 'nsew')
+                start += count
+                self.current_col += count
+                if self.current_col >= self.max_cols:
+                    self.current_col = 0
+                    self.current_row += 1
+        finally:
+            self.frame.grid_propagate(propagate)
\ No newline at end of file
@@ -0,0 +1,88 @@
+import tkinter as tk
+from collections import OrderedDict
+
+
+class LazyContent:
+    """Отложенное построение содержимого вкладок и страниц
+
+    Для каждой вкладки запоминается функция builder(frame), которая
+    вызывается при первом открытии вкладки. Если задан max_alive, в памяти
+    остаётся не больше max_alive построенных вкладок: содержимое давно не
+    открывавшихся уничтожается и строится заново при следующем открытии.
+
+    Используется в Tabs.add_lazy() и Pages.add_lazy().
+    """
+
+    def __init__(self, max_alive=None):
+        """Инициализация
+
+        Args:
+            max_alive (int): Сколько построенных вкладок держать в памяти
+                (None - без ограничения)
+        """
+        if max_alive is not None and max_alive < 1:
+            raise ValueError("max_alive должен быть положительным")
+        self.max_alive = max_alive
+        self._entries = {}           # ключ -> [фрейм вкладки, builder, содержимое]
+        self._alive = OrderedDict()  # построенные ключи, последний - недавно открытый
+
+    def add(self, key, frame, builder):
+        """Зарегистрировать вкладку
+
+        Args:
+            key: Ключ вкладки
+            frame (tk.Frame): Фрейм вкладки
+            builder (callable): Функция builder(frame), создающая содержимое
+        """
+        self._entries[key] = [frame, builder, None]
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def is_built(self, key):
+        """Построено ли содержимое вкладки"""
+        entry = self._entries.get(key)
+        return entry is not None and entry[2] is not None
+
+    def activate(self, key):
+        """Открыть вкладку: построить содержимое, если его нет
+
+        Args:
+            key: Ключ вкладки (неизвестные ключи пропускаются)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        if entry[2] is None:
+            frame, builder, _ = entry
+            content = tk.Frame(frame)
+            content.pack(fill=tk.BOTH, expand=True)
+            try:
+                builder(content)
+            except Exception:
+                content.destroy()
+                raise
+            entry[2] = content
+        self._alive[key] = True
+        self._alive.move_to_end(key)
+        self._trim()
+
+    def _trim(self):
+        """Уничтожить содержимое давно не открывавшихся вкладок"""
+        if self.max_alive is None:
+            return
+        while len(self._alive) > self.max_alive:
+            self.release(next(iter(self._alive)))
+
+    def release(self, key):
+        """Уничтожить содержимое вкладки (builder вызовется при открытии)
+
+        Args:
+            key: Ключ вкладки
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[2] is None:
+            return
+        entry[2].destroy()
+        entry[2] = None
+        self._alive.pop(key, None)
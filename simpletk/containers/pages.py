@@ -1,5 +1,8 @@
 import tkinter as tk
 
+from .lazy import LazyContent
+from ..profiler import profiled
+
 class Pages:
     """Контейнер со страницами и навигацией (пагинация)
     
@@ -9,13 +12,16 @@ class Pages:
         >>> Label(page1, "Первая страница")
         >>> page2 = pages.add_page("Страница 2")
         >>> Input(page2, "Поле на второй странице")
+        >>> pages.add_lazy("Отчёт", lambda frame: Label(frame, "Строится при открытии"))
     """
     
-    def __init__(self, parent):
+    def __init__(self, parent, max_alive=None):
         """Инициализация контейнера со страницами
         
         Args:
             parent: Родительский элемент
+            max_alive (int): Сколько страниц из add_lazy() держать
+                построенными (None - без ограничения)
         """
         # Get the actual tkinter widget
         if hasattr(parent, 'frame'):
@@ -27,6 +33,7 @@ class Pages:
             
         self.pages = []
         self.current = 0
+        self._lazy = LazyContent(max_alive)
         
         self.main_frame = tk.Frame(self.parent)
         self.main_frame.pack(fill=tk.BOTH, expand=True)
@@ -37,10 +44,12 @@ class Pages:
         self.buttons_frame = tk.Frame(self.main_frame)
         self.buttons_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        self.prev_btn = tk.Button(self.buttons_frame, text="← Предыдущая", command=self.prev)
+        self.prev_btn = tk.Button(self.buttons_frame, text="← Предыдущая",
+                                  command=profiled(self.parent, self.prev, "Pages.switch"))
         self.prev_btn.pack(side=tk.LEFT, padx=2)
         
-        self.next_btn = tk.Button(self.buttons_frame, text="Следующая →", command=self.next)
+        self.next_btn = tk.Button(self.buttons_frame, text="Следующая →",
+                                  command=profiled(self.parent, self.next, "Pages.switch"))
         self.next_btn.pack(side=tk.LEFT, padx=2)
         
         self.page_label = tk.Label(self.buttons_frame, text="Страница 1 из 1")
@@ -67,6 +76,27 @@ class Pages:
         self._update_nav()
         return frame
         
+    def add_lazy(self, title, builder):
+        """Добавить страницу, содержимое которой строится при открытии
+        
+        builder(frame) вызывается при первом переключении на страницу.
+        Если задан max_alive, содержимое давно не открывавшихся страниц
+        уничтожается и builder вызывается снова.
+        
+        Args:
+            title (str): Заголовок страницы
+            builder (callable): Функция, создающая содержимое в frame
+            
+        Returns:
+            tk.Frame: Фрейм страницы
+        """
+        frame = self.add_page(title)
+        index = len(self.pages) - 1
+        self._lazy.add(index, frame, builder)
+        if index == self.current:
+            self._lazy.activate(index)
+        return frame
+        
     def switch_to(self, index):
         """Переключиться на страницу по индексу
         
@@ -76,6 +106,7 @@ class Pages:
         if 0 <= index < len(self.pages):
             self.pages[self.current]['frame'].pack_forget()
             self.current = index
+            self._lazy.activate(index)
             self.pages[self.current]['frame'].pack(fill=tk.BOTH, expand=True)
             self._update_nav()
             
@@ -1,4 +1,5 @@
 import tkinter as tk
+from contextlib import contextmanager
 
 class ScrollableFrame(tk.Frame):
     """
@@ -9,9 +10,24 @@ class ScrollableFrame(tk.Frame):
         >>> scroll.pack(fill=tk.BOTH, expand=True)
         >>> for i in range(50):
         ...     Label(scroll.scrollable_frame, f"Строка {i}")
+        
+    Область прокрутки пересчитывается один раз за цикл ожидания Tk, а
+    внутри batch() - один раз после выхода из блока:
+        >>> with scroll.batch():
+        ...     for i in range(1000):
+        ...         Label(scroll.scrollable_frame, f"Строка {i}")
+        
+    Режим переиспользуемых строк для тысяч одинаковых строк: виджеты
+    создаются только для видимых строк и при прокрутке получают данные
+    других строк через bind_row(widget, index):
+        >>> scroll = ScrollableFrame(app, height=300, row_count=len(users),
+        ...                          row_height=24,
+        ...                          bind_row=lambda w, i: w.config(text=users[i]))
     """
     
-    def __init__(self, parent, width=None, height=None, bg=None, **kwargs):
+    def __init__(self, parent, width=None, height=None, bg=None,
+                 row_count=None, row_height=None, create_row=None, bind_row=None,
+                 **kwargs):
         """
         Инициализация прокручиваемого контейнера
         
@@ -20,6 +36,13 @@ class ScrollableFrame(tk.Frame):
             width (int): Ширина области просмотра
             height (int): Высота области просмотра
             bg (str): Цвет фона
+            row_count (int): Количество строк; включает режим
+                переиспользуемых строк (scrollable_frame не создаётся)
+            row_height (int): Высота строки в пикселях
+            create_row (callable): create_row(parent) создаёт виджет строки
+                (по умолчанию tk.Label)
+            bind_row (callable): bind_row(widget, index) заполняет виджет
+                данными строки index
             **kwargs: Дополнительные аргументы для tk.Frame
         """
         # Получаем реальный tkinter widget от родителя
@@ -50,6 +73,16 @@ class ScrollableFrame(tk.Frame):
         if height:
             self.canvas.config(height=height)
         
+        self._region_after = None  # Отложенный пересчёт области прокрутки
+        self._batch_depth = 0
+        self.bind("<Destroy>", self._on_destroy, add="+")
+        
+        self.row_count = row_count
+        if row_count is not None:
+            self._init_rows(row_count, row_height, create_row, bind_row)
+            self._bind_mousewheel()
+            return
+        
         # Создаём внутренний фрейм для содержимого - ЭТОТ ФРЕЙМ НУЖНО ИСПОЛЬЗОВАТЬ
         self.scrollable_frame = tk.Frame(self.canvas, bg=bg)
         
@@ -67,23 +100,161 @@ class ScrollableFrame(tk.Frame):
         # Привязываем колесо мыши
         self._bind_mousewheel()
         
+    # Режим переиспользуемых строк
+    def _init_rows(self, row_count, row_height, create_row, bind_row):
+        """Настройка режима переиспользуемых строк
+        
+        Строки размещаются окнами canvas на своих координатах, а область
+        прокрутки задаётся как row_count * row_height, поэтому Tk не
+        пересчитывает геометрию тысяч дочерних виджетов. Строка index
+        показывается виджетом из ячейки index % размер пула: при прокрутке
+        на одну строку заново заполняется только один виджет.
+        """
+        if not row_height or bind_row is None:
+            raise ValueError("Для режима строк нужны row_height и bind_row")
+        self.row_height = row_height
+        self._create_row = create_row or (lambda parent: tk.Label(parent, anchor="w"))
+        self._bind_row = bind_row
+        # Пул: [виджет, id окна в canvas, номер показанной строки]; номер -1 -
+        # виджет на экране, но его нужно заполнить заново, None - скрыт
+        self._rows = []
+        
+        self.canvas.configure(yscrollcommand=self._on_yscroll, yscrollincrement=row_height)
+        self.canvas.bind("<Configure>", self._on_rows_configure)
+        self._update_scrollregion()
+        
+    def _update_scrollregion(self):
+        """Область прокрутки по количеству строк"""
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(),
+                                            self.row_count * self.row_height))
+        
+    def _on_yscroll(self, first, last):
+        """Прокрутка: обновить полосу и переставить строки"""
+        self.v_scrollbar.set(first, last)
+        self._layout_rows()
+        
+    def _on_rows_configure(self, event):
+        """Изменение размера canvas в режиме строк"""
+        for widget, item, index in self._rows:
+            self.canvas.itemconfig(item, width=event.width)
+        self._update_scrollregion()
+        self._layout_rows()
+        
+    def _layout_rows(self):
+        """Показать видимые строки, переиспользуя виджеты пула"""
+        rh = self.row_height
+        visible = min(self.canvas.winfo_height() // rh + 2, self.row_count)
+        
+        if len(self._rows) < visible:
+            # Размер пула изменился: ячейки строк сдвигаются, заполняем заново
+            width = self.canvas.winfo_width()
+            while len(self._rows) < visible:
+                widget = self._create_row(self.canvas)
+                widget.bind("<MouseWheel>", self._on_mousewheel)
+                item = self.canvas.create_window(0, -rh, window=widget, anchor="nw",
+                                                 width=width, height=rh)
+                self._rows.append([widget, item, None])
+            for row in self._rows:
+                if row[2] is not None:
+                    row[2] = -1
+                
+        pool = len(self._rows)
+        if not pool:
+            return
+        top = max(0, int(self.canvas.canvasy(0)) // rh)
+        end = min(top + visible, self.row_count)
+        shown = set()
+        for index in range(top, end):
+            row = self._rows[index % pool]
+            shown.add(index % pool)
+            if row[2] != index:
+                self.canvas.coords(row[1], 0, index * rh)
+                self._bind_row(row[0], index)
+                row[2] = index
+        for slot, row in enumerate(self._rows):
+            if slot not in shown and row[2] is not None:
+                # Лишние виджеты уводятся за пределы области прокрутки
+                self.canvas.coords(row[1], 0, -rh)
+                row[2] = None
+                
+    def set_row_count(self, row_count):
+        """Изменить количество строк (режим переиспользуемых строк)
+        
+        Args:
+            row_count (int): Новое количество строк
+        """
+        self.row_count = row_count
+        self._update_scrollregion()
+        self.refresh()
+        
+    def refresh(self):
+        """Заново заполнить видимые строки (после изменения данных)"""
+        for row in self._rows:
+            if row[2] is not None:
+                row[2] = -1
+        self._layout_rows()
+        
+    def scroll_to_row(self, index):
+        """Прокрутить так, чтобы строка index оказалась сверху
+        
+        Args:
+            index (int): Номер строки
+        """
+        if self.row_count:
+            self.canvas.yview_moveto(index / self.row_count)
+        
     def _on_frame_configure(self, event):
-        """Обновление области прокрутки при изменении внутреннего фрейма"""
+        """Изменение внутреннего фрейма: запланировать пересчёт области"""
+        self._schedule_region()
+        
+    def _schedule_region(self):
+        """Запланировать пересчёт области прокрутки (один на цикл ожидания)"""
+        if self._region_after is None and not self._batch_depth:
+            self._region_after = self.after_idle(self._update_region)
+            
+    def _update_region(self):
+        """Обновление области прокрутки по содержимому"""
+        self._region_after = None
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
         
+    @contextmanager
+    def batch(self):
+        """Не пересчитывать область прокрутки до конца блока with
+        
+        Пример:
+            >>> with scroll.batch():
+            ...     for item in items:
+            ...         Label(scroll.scrollable_frame, item)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self.row_count is None:
+                self._schedule_region()
+                
+    def _on_destroy(self, event=None):
+        """Отменить отложенный пересчёт при удалении виджета"""
+        if self._region_after is not None:
+            self.after_cancel(self._region_after)
+            self._region_after = None
+        
     def _on_canvas_configure(self, event):
         """Изменение ширины внутреннего фрейма при изменении canvas"""
         canvas_width = event.width
         self.canvas.itemconfig(self.canvas_window, width=canvas_width)
         
+    def _on_mousewheel(self, event):
+        """Прокрутка колесом мыши"""
+        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        
     def _bind_mousewheel(self):
         """Привязка колеса мыши к прокрутке"""
-        def _on_mousewheel(event):
-            self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
         # Привязываем к canvas и всем дочерним элементам
-        self.canvas.bind("<MouseWheel>", _on_mousewheel)
-        self.scrollable_frame.bind("<MouseWheel>", _on_mousewheel)
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        if self.row_count is None:
+            self.scrollable_frame.bind("<MouseWheel>", self._on_mousewheel)
         
     def scroll_to_top(self):
         """Прокрутить вверх"""
@@ -95,5 +266,8 @@ class ScrollableFrame(tk.Frame):
         
     def clear(self):
         """Очистить все элементы из внутреннего фрейма"""
+        if self.row_count is not None:
+            self.set_row_count(0)
+            return
         for widget in self.scrollable_frame.winfo_children():
             widget.destroy()
\ No newline at end of file
@@ -1,4 +1,5 @@
 import tkinter as tk
+from contextlib import contextmanager
 
 class ScrollArea:
     """Область с прокруткой для размещения большого количества элементов
@@ -7,15 +8,33 @@ class ScrollArea:
         >>> scroll = ScrollArea(app, height=200, width=400)
         >>> for i in range(50):
         ...     Label(scroll, f"Строка {i+1}")
+        
+    Область прокрутки пересчитывается один раз за цикл ожидания Tk, а
+    внутри batch() - один раз после выхода из блока.
+    
+    Режим переиспользуемых строк (как у ScrollableFrame): виджеты
+    создаются только для видимых строк и при прокрутке получают данные
+    других строк через bind_row(widget, index):
+        >>> scroll = ScrollArea(app, height=300, row_count=len(users),
+        ...                     row_height=24,
+        ...                     bind_row=lambda w, i: w.config(text=users[i]))
     """
     
-    def __init__(self, parent, height=200, width=400):
+    def __init__(self, parent, height=200, width=400,
+                 row_count=None, row_height=None, create_row=None, bind_row=None):
         """Инициализация области с прокруткой
         
         Args:
             parent: Родительский элемент
             height (int): Высота области
             width (int): Ширина области
+            row_count (int): Количество строк; включает режим
+                переиспользуемых строк (inner не создаётся)
+            row_height (int): Высота строки в пикселях
+            create_row (callable): create_row(parent) создаёт виджет строки
+                (по умолчанию tk.Label)
+            bind_row (callable): bind_row(widget, index) заполняет виджет
+                данными строки index
         """
         # Get the actual tkinter widget
         if hasattr(parent, 'frame'):
@@ -40,6 +59,16 @@ class ScrollArea:
         self.h_scroll.pack(side=tk.BOTTOM, fill=tk.X)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
+        self._region_after = None  # Отложенный пересчёт области прокрутки
+        self._batch_depth = 0
+        self.frame.bind("<Destroy>", self._on_destroy)
+        
+        self.row_count = row_count
+        if row_count is not None:
+            self.inner = None
+            self._init_rows(row_count, row_height, create_row, bind_row)
+            return
+        
         # Inner frame for content
         self.inner = tk.Frame(self.canvas)
         self.canvas.create_window((0, 0), window=self.inner, anchor="nw")
@@ -48,22 +77,173 @@ class ScrollArea:
         self.inner.bind("<Configure>", self._update_scroll)
         self.canvas.bind("<Configure>", self._resize_inner)
         
+    # Режим переиспользуемых строк
+    def _init_rows(self, row_count, row_height, create_row, bind_row):
+        """Настройка режима переиспользуемых строк
+        
+        Строки - окна canvas на своих координатах, область прокрутки равна
+        row_count * row_height. Строка index показывается виджетом из
+        ячейки index % размер пула (см. ScrollableFrame._init_rows).
+        """
+        if not row_height or bind_row is None:
+            raise ValueError("Для режима строк нужны row_height и bind_row")
+        self.row_height = row_height
+        self._create_row = create_row or (lambda parent: tk.Label(parent, anchor="w"))
+        self._bind_row = bind_row
+        # Пул: [виджет, id окна в canvas, номер показанной строки]; номер -1 -
+        # виджет на экране, но его нужно заполнить заново, None - скрыт
+        self._rows = []
+        
+        self.canvas.configure(yscrollcommand=self._on_yscroll, yscrollincrement=row_height)
+        self.canvas.bind("<Configure>", self._on_rows_configure)
+        self._update_rows_region()
+        
+    def _update_rows_region(self):
+        """Область прокрутки по количеству строк"""
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(),
+                                            self.row_count * self.row_height))
+        
+    def _on_yscroll(self, first, last):
+        """Прокрутка: обновить полосу и переставить строки"""
+        self.v_scroll.set(first, last)
+        self._layout_rows()
+        
+    def _on_rows_configure(self, event):
+        """Изменение размера canvas в режиме строк"""
+        for widget, item, index in self._rows:
+            self.canvas.itemconfig(item, width=event.width)
+        self._update_rows_region()
+        self._layout_rows()
+        
+    def _layout_rows(self):
+        """Показать видимые строки, переиспользуя виджеты пула"""
+        rh = self.row_height
+        visible = min(self.canvas.winfo_height() // rh + 2, self.row_count)
+        
+        if len(self._rows) < visible:
+            # Размер пула изменился: ячейки строк сдвигаются, заполняем заново
+            width = self.canvas.winfo_width()
+            while len(self._rows) < visible:
+                widget = self._create_row(self.canvas)
+                item = self.canvas.create_window(0, -rh, window=widget, anchor="nw",
+                                                 width=width, height=rh)
+                self._rows.append([widget, item, None])
+            for row in self._rows:
+                if row[2] is not None:
+                    row[2] = -1
+                
+        pool = len(self._rows)
+        if not pool:
+            return
+        top = max(0, int(self.canvas.canvasy(0)) // rh)
+        end = min(top + visible, self.row_count)
+        shown = set()
+        for index in range(top, end):
+            row = self._rows[index % pool]
+            shown.add(index % pool)
+            if row[2] != index:
+                self.canvas.coords(row[1], 0, index * rh)
+                self._bind_row(row[0], index)
+                row[2] = index
+        for slot, row in enumerate(self._rows):
+            if slot not in shown and row[2] is not None:
+                # Лишние виджеты уводятся за пределы области прокрутки
+                self.canvas.coords(row[1], 0, -rh)
+                row[2] = None
+                
+    def set_row_count(self, row_count):
+        """Изменить количество строк (режим переиспользуемых строк)
+        
+        Args:
+            row_count (int): Новое количество строк
+        """
+        self.row_count = row_count
+        self._update_rows_region()
+        self.refresh()
+        
+    def refresh(self):
+        """Заново заполнить видимые строки (после изменения данных)"""
+        for row in self._rows:
+            if row[2] is not None:
+                row[2] = -1
+        self._layout_rows()
+        
+    def scroll_to_row(self, index):
+        """Прокрутить так, чтобы строка index оказалась сверху
+        
+        Args:
+            index (int): Номер строки
+        """
+        if self.row_count:
+            self.canvas.yview_moveto(index / self.row_count)
+        
     def _update_scroll(self, event):
-        """Обновить область прокрутки при изменении внутреннего фрейма"""
+        """Изменение внутреннего фрейма: запланировать пересчёт области"""
+        if self._region_after is None and not self._batch_depth and self.row_count is None:
+            self._region_after = self.canvas.after_idle(self._update_region)
+            
+    def _update_region(self):
+        """Обновить область прокрутки по содержимому"""
+        self._region_after = None
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
         
+    @contextmanager
+    def batch(self):
+        """Не пересчитывать область прокрутки до конца блока with
+        
+        Пример:
+            >>> with scroll.batch():
+            ...     for i in range(1000):
+            ...         Label(scroll, f"Строка {i+1}")
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            self._update_scroll(None)
+            
+    def _on_destroy(self, event=None):
+        """Отменить отложенный пересчёт при удалении виджета"""
+        if self._region_after is not None:
+            self.canvas.after_cancel(self._region_after)
+            self._region_after = None
+        
     def _resize_inner(self, event):
         """Изменить размер внутреннего фрейма при изменении canvas"""
         canvas_width = event.width
         self.canvas.itemconfig(1, width=canvas_width)  # 1 is the window id of inner frame
         
+    def _check_inner(self):
+        """В режиме переиспользуемых строк внутреннего фрейма нет"""
+        if self.inner is None:
+            raise ValueError("В режиме строк элементы не добавляются: строки создаёт "
+                             "create_row и заполняет bind_row")
+        
     def add(self, element):
         """Добавить элемент в область с прокруткой
         
         Args:
             element: Элемент для добавления
         """
+        self._check_inner()
         if hasattr(element, 'widget'):
             element.widget.pack(in_=self.inner, fill=tk.X, pady=1)
         else:
-            element.pack(in_=self.inner, fill=tk.X, pady=1)
\ No newline at end of file
+            element.pack(in_=self.inner, fill=tk.X, pady=1)
+            
+    def add_many(self, elements):
+        """Добавить несколько элементов одной командой pack
+        
+        Область прокрутки пересчитывается один раз после вставки.
+        
+        Args:
+            elements (list): Элементы для добавления
+        """
+        self._check_inner()
+        widgets = [str(e.widget if hasattr(e, 'widget') else e) for e in elements]
+        if not widgets:
+            return
+        with self.batch():
+            self.inner.tk.call('pack', 'configure', *widgets, '-in', str(self.inner),
+                               '-fill', tk.X, '-pady', 1)
\ No newline at end of file
@@ -0,0 +1,95 @@
+from datetime import date, datetime
+
+# Форматы дат, которые распознаются при сортировке по колонке типа 'date'
+DATE_FORMATS = ("%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M",
+                "%d.%m.%Y", "%d.%m.%Y %H:%M:%S", "%d.%m.%Y %H:%M", "%d/%m/%Y")
+
+
+def _number_key(value):
+    """Ключ для числовой колонки: нечисловые значения идут в конце"""
+    try:
+        return (0, float(value))
+    except (TypeError, ValueError):
+        return (1, 0.0)
+
+
+def _int_key(value):
+    """Ключ для целочисленной колонки: нечисловые значения идут в конце"""
+    try:
+        return (0, int(value))
+    except (TypeError, ValueError):
+        return (1, 0)
+
+
+def _date_key(value):
+    """Ключ для колонки с датами: нераспознанные значения идут в конце"""
+    if isinstance(value, datetime):
+        return (0, value)
+    if isinstance(value, date):
+        return (0, datetime(value.year, value.month, value.day))
+    text = str(value).strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return (0, datetime.strptime(text, fmt))
+        except ValueError:
+            continue
+    return (1, datetime.min)
+
+
+def _auto_key(value):
+    """Ключ по умолчанию: числа сравниваются как числа и идут раньше строк"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value, "")
+    return (1, 0, _string_key(value))
+
+
+def _string_key(value):
+    """Ключ для строковой колонки (без учёта регистра)"""
+    return "" if value is None else str(value).lower()
+
+
+SORT_KEYS = {
+    'auto': _auto_key,
+    'str': _string_key,
+    'number': _number_key,
+    'int': _int_key,
+    'date': _date_key,
+}
+
+
+def sort_key(column_type):
+    """Функция-ключ сортировки для типа колонки
+
+    Args:
+        column_type (str): 'auto', 'str', 'number', 'int' или 'date'
+
+    Returns:
+        callable: Функция, преобразующая значение ячейки в ключ сортировки
+    """
+    if column_type not in SORT_KEYS:
+        raise ValueError(f"Неизвестный тип колонки: {column_type}")
+    return SORT_KEYS[column_type]
+
+
+def ranks(keys, order):
+    """Ранги строк по отсортированному порядку
+
+    Одинаковые ключи получают одинаковый ранг, поэтому сортировка по
+    нескольким колонкам сводится к сравнению кортежей целых чисел.
+
+    Args:
+        keys (list): Ключи в порядке order
+        order (list): Номера строк в порядке возрастания ключа
+
+    Returns:
+        list: rank[номер строки] - ранг строки
+    """
+    result = [0] * len(order)
+    rank = 0
+    previous = None
+    for i, (key, position) in enumerate(zip(keys, order)):
+        if i and key != previous:
+            rank += 1
+        result[position] = rank
+        previous = key
+    return result
@@ -1,17 +1,31 @@
 import tkinter as tk
 from tkinter import ttk
 
+from .datasource import ListDataSource
+from .csvsource import CSVDataSource
+from .filtering import RowFilter
+from ..streaming import StreamLoader
+from ..profiler import profiled
+
 class Table:
     """Таблица с пагинацией
     
+    Данные хранятся в источнике данных (см. datasource.DataSource), из
+    которого при отображении запрашивается только текущая страница.
+    
     Пример:
         >>> data = [["Товар 1", "100", "10"], ["Товар 2", "200", "5"]]
         >>> table = Table(app, ["Название", "Цена", "Кол-во"], data, rows_per_page=5)
         >>> selected = table.get_selected()
         >>> table.add_row(["Новый товар", "300", "3"])
+        >>> big = Table(app, ["Название", "Цена"],
+        ...             source=SQLiteDataSource("data.db", "products"), virtual=True)
+        >>> table.sort_by("Цена", descending=True)  # Или щелчок по заголовку
+        >>> table.set_filter("Цена", "100..500")
     """
     
-    def __init__(self, parent, columns, data=None, rows_per_page=5):
+    def __init__(self, parent, columns, data=None, rows_per_page=5, source=None,
+                 virtual=False, sortable=True, column_types=None):
         """Инициализация таблицы
         
         Args:
@@ -19,6 +33,14 @@ class Table:
             columns (list): Список названий колонок
             data (list): Список строк данных
             rows_per_page (int): Количество строк на странице
+            source: Источник данных вместо data (например, SQLiteDataSource)
+            virtual (bool): Непрерывная прокрутка вместо страниц. В Treeview
+                создаётся rows_per_page строк, которые при прокрутке получают
+                новые значения, а полоса прокрутки охватывает все строки
+            sortable (bool): Сортировка щелчком по заголовку колонки
+                (с Shift - добавить колонку к сортировке)
+            column_types: Типы колонок для сортировки - список по порядку колонок
+                или словарь {колонка: тип}; типы 'auto', 'str', 'number', 'date'
         """
         # Get the actual tkinter widget
         if hasattr(parent, 'frame'):
@@ -29,13 +51,29 @@ class Table:
             self.parent = parent
             
         self.columns = columns
-        self.all_data = data or []
+        self.source = source if source is not None else ListDataSource(data or [])
+        self.column_types = self._normalize_column_types(column_types)
+        if self.column_types:
+            self.source.set_column_types(self.column_types)
+        self.sort = None  # Список пар (номер колонки, по убыванию)
+        self.filter = None  # Функция-фильтр строк
+        self.filters = {}  # Выражения фильтров {номер колонки: выражение}
         self.rows_per_page = rows_per_page
         self.current_page = 0
         
+        # Непрерывная прокрутка: логический номер первой строки и выбранной строки
+        self.virtual = virtual
+        self.top_row = 0
+        self._virtual_selection = None
+        
+        # Показанные строки: {iid строки Treeview: (идентификатор строки, строка)}
+        self._items = {}
+        self._loader = None  # Текущая потоковая загрузка (load_stream)
+        
         # Main frame
         self.main_frame = tk.Frame(self.parent)
         self.main_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.main_frame.bind('<Destroy>', lambda e: self.cancel_stream())
         
         # Treeview frame
         self.tree_frame = tk.Frame(self.main_frame)
@@ -48,63 +86,369 @@ class Table:
             self.tree.heading(col, text=col)
             self.tree.column(col, width=100)
         
+        if sortable:
+            # В "Table.sort" попадают только щелчки по заголовкам, не по строкам
+            self._sort_clicked = profiled(self.tree, self._sort_by_heading, "Table.sort")
+            self.tree.bind('<Button-1>', lambda e: self._on_heading_click(e, add=False))
+            self.tree.bind('<Shift-Button-1>', lambda e: self._on_heading_click(e, add=True))
+        
         # Scrollbar
-        self.scrollbar = ttk.Scrollbar(self.tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=self.scrollbar.set)
+        if virtual:
+            self.scrollbar = ttk.Scrollbar(self.tree_frame, orient=tk.VERTICAL,
+                                           command=profiled(self.tree, self._on_virtual_scroll,
+                                                            "Table.scroll"))
+            self._create_row_pool()
+        else:
+            self.scrollbar = ttk.Scrollbar(self.tree_frame, orient=tk.VERTICAL,
+                                           command=self.tree.yview)
+            self.tree.configure(yscrollcommand=self.scrollbar.set)
         
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Pagination controls
         self.pagination_frame = tk.Frame(self.main_frame)
-        self.pagination_frame.pack(fill=tk.X, padx=5, pady=5)
+        if not virtual:
+            self.pagination_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        self.prev_btn = tk.Button(self.pagination_frame, text="←", command=self.prev_page)
+        self.prev_btn = tk.Button(self.pagination_frame, text="←",
+                                  command=profiled(self.tree, self.prev_page, "Table.page"))
         self.prev_btn.pack(side=tk.LEFT, padx=2)
         
         self.page_label = tk.Label(self.pagination_frame, text="Страница 1")
         self.page_label.pack(side=tk.LEFT, padx=10)
         
-        self.next_btn = tk.Button(self.pagination_frame, text="→", command=self.next_page)
+        self.next_btn = tk.Button(self.pagination_frame, text="→",
+                                  command=profiled(self.tree, self.next_page, "Table.page"))
         self.next_btn.pack(side=tk.LEFT, padx=2)
         
         # Show first page
         self._show_page(0)
         
+    @classmethod
+    def from_csv(cls, parent, path, mmap=True, columns=None, delimiter=None,
+                 encoding='utf-8', header=True, **kwargs):
+        """Таблица по CSV/TSV файлу без загрузки файла в память
+        
+        Создаёт CSVDataSource: файл один раз индексируется (индекс
+        сохраняется в path + '.idx'), а строки читаются только для текущей
+        страницы или видимой области. Для больших файлов удобно virtual=True.
+        
+        Args:
+            parent: Родительский элемент
+            path (str): Путь к файлу
+            mmap (bool): Читать строки через отображение файла в память
+            columns (list): Названия колонок (по умолчанию из заголовка файла)
+            delimiter (str): Разделитель (по умолчанию по расширению файла)
+            encoding (str): Кодировка файла
+            header (bool): Первая строка файла - заголовок
+            **kwargs: Остальные параметры Table (rows_per_page, virtual и т.д.)
+            
+        Returns:
+            Table: Новая таблица
+            
+        Пример:
+            >>> table = Table.from_csv(app, "export.csv", virtual=True, rows_per_page=30)
+        """
+        source = CSVDataSource(path, delimiter=delimiter, encoding=encoding,
+                               header=header, use_mmap=mmap)
+        return cls(parent, columns or source.columns, source=source, **kwargs)
+        
+    @property
+    def all_data(self):
+        """Все строки таблицы (для источника данных в памяти)"""
+        return self.source.rows
+        
+    @all_data.setter
+    def all_data(self, rows):
+        self.source = ListDataSource(rows)
+        if self.column_types:
+            self.source.set_column_types(self.column_types)
+        
+    def _normalize_column_types(self, column_types):
+        """Привести типы колонок к словарю {номер колонки: тип}"""
+        if not column_types:
+            return {}
+        if isinstance(column_types, dict):
+            return {self._column_index(column): column_type
+                    for column, column_type in column_types.items()}
+        return dict(enumerate(column_types))
+        
+    def _column_index(self, column):
+        """Номер колонки по номеру или названию"""
+        if isinstance(column, int):
+            return column
+        return list(self.columns).index(column)
+        
+    def _total_pages(self):
+        """Количество страниц (не меньше одной)"""
+        total = self.source.count(self.filter)
+        return max(1, (total + self.rows_per_page - 1) // self.rows_per_page)
+        
     def _show_page(self, page_num):
         """Показать указанную страницу
         
         Args:
             page_num (int): Номер страницы
         """
+        if self.virtual:
+            self._render_rows(self.top_row)
+            return
+        
         self.tree.delete(*self.tree.get_children())
+        self._items = {}
         
         start = page_num * self.rows_per_page
-        end = start + self.rows_per_page
-        page = self.all_data[start:end]
+        page = self.source.fetch_keyed(start, self.rows_per_page, self.sort, self.filter)
+        for row_id, row in page:
+            # Постоянный идентификатор строки источника служит iid строки Treeview
+            iid = str(row_id) if self.source.stable_ids else None
+            iid = self.tree.insert('', tk.END, iid=iid, values=row)
+            self._items[iid] = (row_id, row)
         
-        for row in page:
-            self.tree.insert('', tk.END, values=row)
+        self._update_nav(page_num)
         
-        total_pages = (len(self.all_data) + self.rows_per_page - 1) // self.rows_per_page
-        if total_pages == 0:
-            total_pages = 1
-            
+    def _update_nav(self, page_num):
+        """Обновить подпись и кнопки навигации
+        
+        Args:
+            page_num (int): Номер страницы
+        """
+        if self.virtual:
+            self._update_scrollbar()
+            return
+        
+        total_pages = self._total_pages()
         self.page_label.config(text=f"Страница {page_num + 1} из {total_pages}")
         
         self.prev_btn.config(state=tk.NORMAL if page_num > 0 else tk.DISABLED)
         self.next_btn.config(state=tk.NORMAL if page_num < total_pages - 1 else tk.DISABLED)
         
+    def _refresh_after_append(self):
+        """Обновить таблицу после добавления строк в конец
+        
+        Текущая страница перерисовывается, только если новые строки могут
+        на неё попасть, иначе обновляется лишь навигация.
+        """
+        shown = len(self.tree.get_children())
+        if self.sort or self.filter is not None or shown < self.rows_per_page:
+            self._show_page(self.current_page)
+        else:
+            self._update_nav(self.current_page)
+        
+    # Непрерывная прокрутка
+    def _create_row_pool(self):
+        """Создать постоянный набор строк Treeview"""
+        self._pool = [self.tree.insert('', tk.END, iid=f"row{i}")
+                      for i in range(self.rows_per_page)]
+        self.tree.bind('<<TreeviewSelect>>', self._on_virtual_select)
+        self.tree.bind('<MouseWheel>',
+                       lambda e: self._scroll_to(self.top_row - int(e.delta / 120) * 3))
+        self.tree.bind('<Button-4>', lambda e: self._scroll_to(self.top_row - 3))
+        self.tree.bind('<Button-5>', lambda e: self._scroll_to(self.top_row + 3))
+        self.tree.bind('<Up>', lambda e: self._move_selection(-1))
+        self.tree.bind('<Down>', lambda e: self._move_selection(1))
+        self.tree.bind('<Prior>', lambda e: self._move_selection(-self.rows_per_page))
+        self.tree.bind('<Next>', lambda e: self._move_selection(self.rows_per_page))
+        
+    def _render_rows(self, top):
+        """Заполнить строки Treeview данными начиная с логической строки top
+        
+        Args:
+            top (int): Логический номер первой видимой строки
+        """
+        total = self.source.count(self.filter)
+        top = max(0, min(top, total - self.rows_per_page))
+        self.top_row = top
+        rows = self.source.fetch_keyed(top, self.rows_per_page, self.sort, self.filter)
+        self._items = {}
+        
+        for i, iid in enumerate(self._pool):
+            if i < len(rows):
+                self.tree.item(iid, values=rows[i][1])
+                self.tree.move(iid, '', i)
+                self._items[iid] = rows[i]
+            else:
+                self.tree.detach(iid)
+        
+        selection = self._virtual_selection
+        if selection is not None and top <= selection < top + len(rows):
+            self.tree.selection_set(self._pool[selection - top])
+        else:
+            self.tree.selection_remove(*self.tree.selection())
+        self._update_scrollbar(total)
+        
+    def _update_scrollbar(self, total=None):
+        """Установить полосу прокрутки по логическому номеру строки"""
+        if total is None:
+            total = self.source.count(self.filter)
+        if total:
+            self.scrollbar.set(self.top_row / total,
+                               min(1.0, (self.top_row + self.rows_per_page) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+            
+    def _scroll_to(self, top):
+        """Прокрутить так, чтобы строка top стала первой видимой"""
+        if top != self.top_row:
+            self._render_rows(top)
+            
+    def _on_virtual_scroll(self, *args):
+        """Обработка команд полосы прокрутки"""
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * self.source.count(self.filter)))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= self.rows_per_page
+            self._scroll_to(self.top_row + step)
+            
+    def _on_virtual_select(self, event=None):
+        """Запомнить логический номер выбранной строки"""
+        selection = self.tree.selection()
+        if selection:
+            self._virtual_selection = self.top_row + self._pool.index(selection[0])
+            
+    def _move_selection(self, step):
+        """Перемещение выбора клавишами с прокруткой за пределы видимых строк"""
+        total = self.source.count(self.filter)
+        if not total:
+            return 'break'
+        current = self._virtual_selection
+        target = 0 if current is None else max(0, min(current + step, total - 1))
+        self._virtual_selection = target
+        if target < self.top_row:
+            self._render_rows(target)
+        elif target >= self.top_row + self.rows_per_page:
+            self._render_rows(target - self.rows_per_page + 1)
+        else:
+            self.tree.selection_set(self._pool[target - self.top_row])
+        self.tree.focus(self._pool[target - self.top_row])
+        return 'break'
+        
+    # Сортировка
+    def _on_heading_click(self, event, add):
+        """Щелчок по таблице: сортировка, если щёлкнули по заголовку колонки"""
+        if self.tree.identify_region(event.x, event.y) != 'heading':
+            return
+        column_id = self.tree.identify_column(event.x)
+        if not column_id:
+            return
+        self._sort_clicked(int(column_id.lstrip('#')) - 1, add)
+        
+    def _sort_by_heading(self, column, add):
+        """Сортировка по щелчку на заголовке колонки"""
+        # Повторный щелчок по той же колонке меняет направление
+        current = dict(self.sort or [])
+        descending = not current[column] if column in current else False
+        if add or (len(current) == 1 and column in current):
+            self.sort_by(column, descending, add=True)
+        else:
+            self.sort_by(column, descending)
+            
+    def sort_by(self, column, descending=False, add=False):
+        """Сортировать таблицу по колонке
+        
+        Args:
+            column: Номер или название колонки
+            descending (bool): Сортировка по убыванию
+            add (bool): Добавить колонку к текущей сортировке
+                (если колонка уже участвует, меняется только направление)
+        """
+        column = self._column_index(column)
+        sort = list(self.sort or []) if add else []
+        for i, (existing, _) in enumerate(sort):
+            if existing == column:
+                sort[i] = (column, descending)
+                break
+        else:
+            sort.append((column, descending))
+        self.sort = sort
+        self._after_sort_change()
+        
+    def clear_sort(self):
+        """Отменить сортировку"""
+        self.sort = None
+        self._after_sort_change()
+        
+    def _after_sort_change(self):
+        """Обновить заголовки и показать начало таблицы"""
+        self._update_headings()
+        self.current_page = 0
+        self.top_row = 0
+        self._virtual_selection = None
+        self._show_page(0)
+        
+    def _update_headings(self):
+        """Показать стрелки сортировки в заголовках"""
+        order = {column: (i, descending) for i, (column, descending) in enumerate(self.sort or [])}
+        for index, col in enumerate(self.columns):
+            text = col
+            if index in order:
+                position, descending = order[index]
+                text += " ▼" if descending else " ▲"
+                if len(order) > 1:
+                    text += str(position + 1)
+            self.tree.heading(col, text=text)
+        
+    # Фильтрация
+    def set_filter(self, column, expr):
+        """Установить фильтр по колонке
+        
+        Фильтры по разным колонкам объединяются условием И. Пустое
+        выражение снимает фильтр с колонки.
+        
+        Выражения:
+            =значение, !=значение  - равенство и неравенство
+            >5, >=5, <5, <=5       - сравнение
+            10..20                 - диапазон (включительно)
+            ~текст или текст       - содержит подстроку
+            /шаблон/ или /шаблон/i - регулярное выражение
+        
+        Args:
+            column: Номер или название колонки
+            expr (str): Выражение фильтра
+        """
+        column = self._column_index(column)
+        filters = dict(self.filters)
+        if expr and expr.strip():
+            filters[column] = expr
+        else:
+            filters.pop(column, None)
+        # Выражение компилируется до изменения таблицы, чтобы ошибка не сбросила фильтры
+        row_filter = RowFilter(filters, self.column_types) if filters else None
+        self.filters = filters
+        self.filter = row_filter
+        self._after_sort_change()
+        
+    def clear_filter(self, column=None):
+        """Снять фильтр с колонки или все фильтры
+        
+        Args:
+            column: Номер или название колонки (None - все колонки)
+        """
+        if column is None:
+            self.filters = {}
+            self.filter = None
+            self._after_sort_change()
+        else:
+            self.set_filter(column, "")
+        
     def prev_page(self):
         """Перейти на предыдущую страницу"""
+        if self.virtual:
+            self._scroll_to(self.top_row - self.rows_per_page)
+            return
         if self.current_page > 0:
             self.current_page -= 1
             self._show_page(self.current_page)
             
     def next_page(self):
         """Перейти на следующую страницу"""
-        total_pages = (len(self.all_data) + self.rows_per_page - 1) // self.rows_per_page
-        if self.current_page < total_pages - 1:
+        if self.virtual:
+            self._scroll_to(self.top_row + self.rows_per_page)
+            return
+        if self.current_page < self._total_pages() - 1:
             self.current_page += 1
             self._show_page(self.current_page)
     
@@ -114,8 +458,8 @@ class Table:
         Args:
             row (list): Строка данных
         """
-        self.all_data.append(row)
-        self._show_page(self.current_page)
+        self.source.append(row)
+        self._refresh_after_append()
         
     def add_rows(self, rows):
         """Добавить несколько строк в таблицу
@@ -123,30 +467,86 @@ class Table:
         Args:
             rows (list): Список строк данных
         """
-        self.all_data.extend(rows)
-        self._show_page(self.current_page)
+        self.source.extend(rows)
+        self._refresh_after_append()
+        
+    def load_stream(self, iterable, chunk_size=1000, on_progress=None, on_done=None):
+        """Добавить строки из итератора порциями, не блокируя интерфейс
+        
+        Первая порция показывается сразу, остальные добавляются через
+        after_idle() по мере чтения, поэтому таблица отвечает на прокрутку
+        и щелчки во время загрузки.
+        
+        Args:
+            iterable: Источник строк (генератор, csv.reader, курсор БД и т.д.)
+            chunk_size (int): Количество строк в порции
+            on_progress (callable): Вызывается с числом загруженных строк
+            on_done (callable): Вызывается с общим числом строк
+            
+        Returns:
+            StreamLoader: Объект загрузки (loader.cancel() - остановить)
+            
+        Пример:
+            >>> def read_rows():
+            ...     with open("data.csv", newline="") as f:
+            ...         yield from csv.reader(f)
+            >>> table.load_stream(read_rows(), on_done=lambda n: print(n, "строк"))
+        """
+        self.cancel_stream()
+        self._loader = StreamLoader(self.main_frame, iterable, self.add_rows,
+                                    chunk_size, on_progress, on_done)
+        return self._loader
+        
+    def cancel_stream(self):
+        """Остановить потоковую загрузку, начатую load_stream()"""
+        if self._loader is not None:
+            self._loader.cancel()
+            self._loader = None
         
     def clear(self):
         """Очистить таблицу"""
-        self.all_data = []
+        self.cancel_stream()
+        self.source.clear()
         self.current_page = 0
+        self.top_row = 0
+        self._virtual_selection = None
         self._show_page(0)
         
+    def _selected_items(self):
+        """Выбранные строки в виде пар (идентификатор строки, строка)"""
+        selection = [iid for iid in self.tree.selection() if iid in self._items]
+        if self.virtual and not selection and self._virtual_selection is not None:
+            # Выбранная строка прокручена за пределы видимых строк
+            return self.source.fetch_keyed(self._virtual_selection, 1, self.sort, self.filter)
+        return [self._items[iid] for iid in selection]
+        
     def get_selected(self):
         """Получить выбранную строку
         
         Returns:
-            list or None: Выбранная строка или None
+            list or None: Выбранная строка (тот же объект, что в данных) или None
         """
-        selection = self.tree.selection()
-        if selection:
-            return self.tree.item(selection[0])['values']
-        return None
+        items = self._selected_items()
+        return items[0][1] if items else None
+        
+    def get_selected_rows(self):
+        """Получить все выбранные строки
+        
+        Returns:
+            list: Выбранные строки (те же объекты, что в данных)
+        """
+        return [row for _, row in self._selected_items()]
         
     def delete_selected(self):
-        """Удалить выбранную строку"""
-        selection = self.tree.selection()
-        if selection:
-            values = self.tree.item(selection[0])['values']
-            self.all_data = [row for row in self.all_data if row != values]
-            self._show_page(self.current_page)
\ No newline at end of file
+        """Удалить выбранные строки"""
+        items = self._selected_items()
+        if not items:
+            return
+        self._virtual_selection = None
+        if self.source.stable_ids:
+            self.source.delete_ids([row_id for row_id, _ in items])
+        else:
+            for _, row in items:
+                self.source.remove(row)
+        self.current_page = min(self.current_page, self._total_pages() - 1)
+        self._show_page(self.current_page)
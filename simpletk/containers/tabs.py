@@ -1,6 +1,9 @@
 import tkinter as tk
 from tkinter import ttk
 
+from .lazy import LazyContent
+from ..profiler import profiled
+
 class Tabs:
     """Контейнер с вкладками
     
@@ -10,13 +13,18 @@ class Tabs:
         >>> Label(tab1, "Содержимое вкладки 1")
         >>> tab2 = tabs.add("Вкладка 2")
         >>> Button(tab2, "Кнопка на вкладке 2")
+        
+        Содержимое редко открываемых вкладок можно строить при открытии:
+        >>> tabs.add_lazy("Отчёт", lambda frame: Table(frame, columns, data))
     """
     
-    def __init__(self, parent):
+    def __init__(self, parent, max_alive=None):
         """Инициализация контейнера с вкладками
         
         Args:
             parent: Родительский элемент
+            max_alive (int): Сколько вкладок из add_lazy() держать
+                построенными (None - без ограничения)
         """
         # Get the actual tkinter widget
         if hasattr(parent, 'frame'):
@@ -29,6 +37,10 @@ class Tabs:
         self.notebook = ttk.Notebook(self.parent)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        self._lazy = LazyContent(max_alive)
+        on_tab_changed = profiled(self.notebook, self._on_tab_changed, "Tabs.tab_changed")
+        self.notebook.bind('<<NotebookTabChanged>>', on_tab_changed)
+        
     def add(self, title):
         """Добавить новую вкладку
         
@@ -40,4 +52,30 @@ class Tabs:
         """
         frame = tk.Frame(self.notebook)
         self.notebook.add(frame, text=title)
-        return frame
\ No newline at end of file
+        return frame
+        
+    def add_lazy(self, title, builder):
+        """Добавить вкладку, содержимое которой строится при открытии
+        
+        builder(frame) вызывается при первом открытии вкладки. Если задан
+        max_alive, содержимое давно не открывавшихся вкладок уничтожается
+        и builder вызывается снова, поэтому он не должен рассчитывать на
+        однократный вызов.
+        
+        Args:
+            title (str): Заголовок вкладки
+            builder (callable): Функция, создающая содержимое в frame
+            
+        Returns:
+            tk.Frame: Фрейм вкладки
+        """
+        frame = self.add(title)
+        self._lazy.add(str(frame), frame, builder)
+        if str(self.notebook.select()) == str(frame):
+            # Первая вкладка открыта сразу
+            self._lazy.activate(str(frame))
+        return frame
+        
+    def _on_tab_changed(self, event=None):
+        """Построить содержимое открытой вкладки"""
+        self._lazy.activate(str(self.notebook.select()))
\ No newline at end of file
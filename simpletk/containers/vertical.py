@@ -37,4 +37,25 @@ class Vertical:
         if hasattr(element, 'widget'):
             element.widget.pack(in_=self.frame, fill=tk.X, pady=2)
         else:
-            element.pack(in_=self.frame, fill=tk.X, pady=2)
\ No newline at end of file
+            element.pack(in_=self.frame, fill=tk.X, pady=2)
+            
+    def add_many(self, elements):
+        """Добавить несколько элементов одной командой pack
+        
+        Все элементы передаются в одну команду Tcl, а распространение
+        размеров на родителя отключается до конца вставки, поэтому
+        геометрия пересчитывается один раз.
+        
+        Args:
+            elements (list): Элементы для добавления
+        """
+        widgets = [str(e.widget if hasattr(e, 'widget') else e) for e in elements]
+        if not widgets:
+            return
+        propagate = self.frame.pack_propagate()
+        self.frame.pack_propagate(False)
+        try:
+            self.frame.tk.call('pack', 'configure', *widgets, '-in', str(self.frame),
+                               '-fill', tk.X, '-pady', 2)
+        finally:
+            self.frame.pack_propagate(propagate)
\ No newline at end of file
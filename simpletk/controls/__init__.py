@@ -1,16 +1,34 @@
 """Элементы управления SimpleTK"""
 
-from .button import Button
-from .label import Label
-from .input import Input
-from .checkbox import Checkbox
-from .radiogroup import RadioGroup
-from .dropdown import Dropdown
-from .slider import Slider
-from .listbox import ListBox
-from .searchable_list import SearchableList
+import importlib
 
 __all__ = [
     'Button', 'Label', 'Input', 'Checkbox', 'RadioGroup',
     'Dropdown', 'Slider', 'ListBox', 'SearchableList'
-]
\ No newline at end of file
+]
+
+# Модули элементов импортируются при первом обращении к классу
+_LAZY = {
+    'Button': 'button',
+    'Label': 'label',
+    'Input': 'input',
+    'Checkbox': 'checkbox',
+    'RadioGroup': 'radiogroup',
+    'Dropdown': 'dropdown',
+    'Slider': 'slider',
+    'ListBox': 'listbox',
+    'SearchableList': 'searchable_list',
+}
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+def __getattr__(name):
+    """Ленивый импорт классов элементов управления"""
+    if name in _LAZY:
+        value = getattr(importlib.import_module('.' + _LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"Модуль '{__name__}' не имеет атрибута '{name}'")
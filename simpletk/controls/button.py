@@ -1,5 +1,7 @@
 import tkinter as tk
 
+from ..callbacks import wrap_callback
+
 class Button:
     """Простая кнопка
     
@@ -26,6 +28,7 @@ class Button:
         else:
             self.parent = parent
             
+        on_click = wrap_callback(self.parent, on_click, "Button.on_click")
         self.widget = tk.Button(self.parent, text=text, command=on_click, bg=color)
         self.widget.pack(pady=2)
         
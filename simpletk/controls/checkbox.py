@@ -1,5 +1,7 @@
 import tkinter as tk
 
+from ..callbacks import wrap_callback
+
 class Checkbox:
     """Флажок (чекбокс)
     
@@ -26,6 +28,7 @@ class Checkbox:
             self.parent = parent
             
         self.value = tk.BooleanVar()
+        on_change = wrap_callback(self.parent, on_change, "Checkbox.on_change")
         self.widget = tk.Checkbutton(self.parent, text=text, variable=self.value, command=on_change)
         self.widget.pack(pady=2)
         
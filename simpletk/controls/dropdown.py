@@ -86,6 +86,12 @@ class Dropdown:
 
 import tkinter as tk
 from tkinter import ttk
+from array import array
+
+from .item_store import ItemStore
+from .search_index import SearchIndex
+from ..callbacks import wrap_callback
+from ..profiler import profiled
 
 class Dropdown:
     """Выпадающий список с поддержкой сортировки
@@ -94,9 +100,13 @@ class Dropdown:
         >>> city = Dropdown(app, ["Москва", "СПб", "Казань", "Астрахань"])
         >>> city.sort()  # Сортировка по алфавиту
         >>> city.sort(reverse=True)  # Сортировка по убыванию
+        
+        Для длинных списков - подсказки при вводе:
+        >>> street = Dropdown(app, streets, autocomplete=True, max_values=50)
     """
     
-    def __init__(self, parent, items, on_select=None, width=20, sortable=True):
+    def __init__(self, parent, items, on_select=None, width=20, sortable=True,
+                 packed=False, intern=False, autocomplete=False, max_values=100):
         """Инициализация выпадающего списка
         
         Args:
@@ -105,6 +115,11 @@ class Dropdown:
             on_select (callable): Функция, вызываемая при выборе
             width (int): Ширина списка
             sortable (bool): Возможность сортировки
+            packed (bool): Хранить строки упакованными в UTF-8 (см. ItemStore)
+            intern (bool): Хранить одинаковые строки одним объектом
+            autocomplete (bool): Фильтровать варианты по введённому тексту;
+                в список загружаются только max_values подходящих элементов
+            max_values (int): Количество вариантов в режиме autocomplete
         """
         # Get the actual tkinter widget
         if hasattr(parent, 'frame'):
@@ -116,9 +131,22 @@ class Dropdown:
         else:
             self.parent = parent
             
-        self.items = items.copy()
+        # Элементы хранятся один раз, порядок - массив позиций в хранилище
+        self.store = ItemStore(items, packed=packed, intern=intern)
+        self._order = self.store.positions()
+        self._reverse = None  # Направление активной сортировки (None - нет)
         self.sortable = sortable
         self.on_select = on_select
+        self.autocomplete = autocomplete
+        self.max_values = max_values
+        self._values_after = None  # Отложенное обновление списка вариантов
+        self._filter_text = ""
+        
+        # Индекс для подсказок; id элементов совпадают с позициями в хранилище
+        self.index = None
+        if autocomplete:
+            self.index = SearchIndex()
+            self.index.build(self.store.items())
         
         # Создаём основной контейнер
         self.container = tk.Frame(self.parent)
@@ -139,23 +167,106 @@ class Dropdown:
         # Combobox
         self.value = tk.StringVar()
         self.widget = ttk.Combobox(self.container, textvariable=self.value,
-                                   values=self.items, width=width)
+                                   values=self._popup_values(), width=width)
         self.widget.pack(fill=tk.X)
+        self.container.bind('<Destroy>', self._on_destroy)
         
-        if items:
+        if items and not autocomplete:
             self.value.set(items[0])
             
+        if autocomplete:
+            self.widget.bind('<KeyRelease>', profiled(self.widget, self._on_type,
+                                                      "Dropdown.autocomplete"))
+            
         if on_select:
+            on_select = wrap_callback(self.widget, on_select, "Dropdown.on_select")
             self.widget.bind('<<ComboboxSelected>>', lambda e: on_select(self.value.get()))
             
+    @property
+    def items(self):
+        """Элементы в текущем порядке (новый список)
+        
+        Изменение возвращённого списка не меняет Dropdown: для этого есть
+        add_item(), remove_item() или присваивание dropdown.items = [...].
+        """
+        return self.store.values(self._order)
+        
+    @items.setter
+    def items(self, items):
+        # Новый список заменяет все элементы, сортировка сбрасывается
+        items = list(items)
+        self.store = ItemStore(items, packed=self.store.packed, intern=self.store.intern)
+        self._order = self.store.positions()
+        self._reverse = None
+        if self.index is not None:
+            self.index.build(items)
+        self._update_values()
+        
+    def _popup_values(self):
+        """Варианты для Combobox
+        
+        Без autocomplete - все элементы. С autocomplete - не больше
+        max_values элементов: сначала начинающиеся с введённого текста,
+        затем содержащие его.
+        """
+        if not self.autocomplete:
+            return self.items
+        limit = self.max_values
+        text = self._filter_text
+        if not text:
+            return self.store.values(self._order[:limit])
+        positions = self.index.startswith_ids(text)[:limit]
+        if len(positions) < limit:
+            found = set(positions)
+            for position in self.index.contains_ids(text):
+                if position not in found:
+                    positions.append(position)
+                    if len(positions) == limit:
+                        break
+        return self.store.values(positions)
+        
+    def _update_values(self):
+        """Запланировать обновление вариантов Combobox
+        
+        Список Tcl собирается заново не чаще одного раза за цикл ожидания:
+        несколько изменений подряд дают одно присваивание values.
+        """
+        if self._values_after is None:
+            self._values_after = self.widget.after_idle(self._flush_values)
+            
+    def _flush_values(self):
+        """Передать варианты в Combobox"""
+        self._values_after = None
+        self.widget['values'] = self._popup_values()
+        
+    def _on_type(self, event=None):
+        """Фильтрация вариантов при вводе (режим autocomplete)"""
+        text = self.value.get()
+        if text != self._filter_text:
+            self._filter_text = text
+            self._update_values()
+            
+    def _on_destroy(self, event=None):
+        """Отменить отложенное обновление при удалении виджета"""
+        if self._values_after is not None:
+            self.widget.after_cancel(self._values_after)
+            self._values_after = None
+        
     def sort(self, reverse=False):
         """Сортировка элементов
         
+        Сортировка запоминается: новые элементы встают на свои места.
+        Смена направления только разворачивает список.
+        
         Args:
             reverse (bool): Сортировка по убыванию
         """
-        self.items.sort(reverse=reverse)
-        self.widget['values'] = self.items
+        if self._reverse is None:
+            self._order = self.store.sort(self._order, reverse=reverse)
+        elif self._reverse != reverse:
+            self._order.reverse()
+        self._reverse = reverse
+        self._update_values()
         
     def sort_ascending(self):
         """Сортировка по возрастанию"""
@@ -187,8 +298,14 @@ class Dropdown:
         Args:
             item (str): Новый элемент
         """
-        self.items.append(item)
-        self.widget['values'] = self.items
+        position = self.store.add(item)
+        if self._reverse is None:
+            self._order.append(position)
+        else:
+            self.store.insort(self._order, position, reverse=self._reverse)
+        if self.index is not None:
+            self.index.add(item)
+        self._update_values()
         
     def add_items(self, items):
         """Добавить несколько элементов
@@ -196,8 +313,15 @@ class Dropdown:
         Args:
             items (list): Список новых элементов
         """
-        self.items.extend(items)
-        self.widget['values'] = self.items
+        items = list(items)
+        added = self.store.extend(items)
+        if self._reverse is None:
+            self._order.extend(added)
+        else:
+            self._order = self.store.merge(self._order, added, reverse=self._reverse)
+        if self.index is not None:
+            self.index.extend(items)
+        self._update_values()
         
     def remove_item(self, item):
         """Удалить элемент из списка
@@ -205,9 +329,19 @@ class Dropdown:
         Args:
             item (str): Элемент для удаления
         """
-        if item in self.items:
-            self.items.remove(item)
-            self.widget['values'] = self.items
+        for index, position in enumerate(self._order):
+            if self.store[position] == item:
+                self.store.discard(position)
+                del self._order[index]
+                if self.index is not None:
+                    self.index.remove_id(position)
+                if self.store.slots > 2 * len(self.store) + 1024:
+                    remap = self.store.compact()
+                    self._order = array('I', map(remap.__getitem__, self._order))
+                    if self.index is not None:
+                        self.index.build(self.store.items())
+                self._update_values()
+                break
             
     def hide(self):
         """Скрыть выпадающий список"""
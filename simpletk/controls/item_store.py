@@ -0,0 +1,287 @@
+import bisect
+import sys
+from array import array
+from itertools import compress
+
+
+class _KeyedView:
+    """Ключи сортировки для массива позиций без его копирования (для bisect)"""
+
+    def __init__(self, positions, item_key, last=None):
+        self.positions = positions
+        self.item_key = item_key
+        self.last = last  # Если задан, индексы отсчитываются с конца
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __getitem__(self, index):
+        if self.last is not None:
+            index = self.last - index
+        return self.item_key(self.positions[index])
+
+
+class ItemStore:
+    """Общее хранилище элементов списка
+
+    Каждый элемент хранится один раз и получает постоянную позицию.
+    Отображаемые и найденные элементы списки хранят как array('I') позиций
+    в хранилище: 4 байта на элемент вместо отдельного списка ссылок, а
+    сброс поиска не копирует все элементы.
+
+    Удалённый элемент оставляет пустую ячейку, поэтому позиции остальных
+    элементов не меняются. Ячейки освобождает compact().
+
+    Режимы хранения строк:
+        intern=True - одинаковые строки хранятся одним объектом (sys.intern)
+        packed=True - все строки хранятся одним массивом байт UTF-8 со
+            смещениями, без отдельного объекта str на элемент; строка
+            создаётся при чтении
+
+    Пример:
+        >>> store = ItemStore(["Яблоко", "Банан", "Апельсин"])
+        >>> view = store.search("ан")
+        >>> store.values(view)
+        ['Банан']
+    """
+
+    # Новая позиция удалённого элемента в результате compact(): не совпадает
+    # ни с одной настоящей позицией
+    DELETED = 0xFFFFFFFF
+
+    def __init__(self, items=(), packed=False, intern=False):
+        """Инициализация
+
+        Args:
+            items: Начальные элементы
+            packed (bool): Хранить строки упакованными в UTF-8
+            intern (bool): Хранить одинаковые строки одним объектом
+        """
+        self.packed = packed
+        self.intern = intern
+        self.clear()
+        self.extend(items)
+
+    def clear(self):
+        """Удалить все элементы"""
+        self._items = []           # Элементы по позициям (обычный режим)
+        self._data = bytearray()   # Байты строк (режим packed)
+        self._offsets = array('Q', [0])  # Границы строк в _data (режим packed)
+        self._alive = bytearray()  # 1 - элемент на позиции есть, 0 - удалён
+        self._count = 0
+        self._key_func = None      # Функция ключа, для которой заполнен кэш
+        self._key_values = []      # Ключи сортировки по позициям
+
+    def _prepare(self, item):
+        """Привести элемент к виду для хранения"""
+        if self.intern and type(item) is str:
+            return sys.intern(item)
+        return item
+
+    def add(self, item):
+        """Добавить элемент
+
+        Returns:
+            int: Позиция элемента
+        """
+        return self.extend((item,)).start
+
+    def extend(self, items):
+        """Добавить несколько элементов
+
+        Returns:
+            range: Позиции новых элементов
+        """
+        start = len(self._alive)
+        if self.packed:
+            data, offsets = self._data, self._offsets
+            for item in items:
+                data += item.encode('utf-8')
+                offsets.append(len(data))
+        else:
+            self._items.extend(map(self._prepare, items))
+        end = len(self._offsets) - 1 if self.packed else len(self._items)
+        self._alive.extend(b'\x01' * (end - start))
+        self._count += end - start
+        return range(start, end)
+
+    def discard(self, position):
+        """Удалить элемент по позиции (ячейка остаётся пустой)"""
+        if self._alive[position]:
+            self._alive[position] = 0
+            self._count -= 1
+            if not self.packed:
+                self._items[position] = None
+
+    def is_alive(self, position):
+        """Есть ли элемент на позиции"""
+        return bool(self._alive[position])
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def slots(self):
+        """Количество позиций вместе с пустыми ячейками"""
+        return len(self._alive)
+
+    def __getitem__(self, position):
+        if self.packed:
+            offsets = self._offsets
+            return self._data[offsets[position]:offsets[position + 1]].decode('utf-8')
+        return self._items[position]
+
+    def positions(self):
+        """Позиции всех элементов по порядку
+
+        Returns:
+            array: array('I') позиций
+        """
+        if self._count == len(self._alive):
+            return array('I', range(self._count))
+        return array('I', compress(range(len(self._alive)), self._alive))
+
+    def values(self, positions):
+        """Элементы по списку позиций
+
+        Returns:
+            list: Элементы
+        """
+        if self.packed:
+            return [self[p] for p in positions]
+        return list(map(self._items.__getitem__, positions))
+
+    def items(self):
+        """Все элементы по порядку (новый список)"""
+        if self._count == len(self._alive) and not self.packed:
+            return list(self._items)
+        return self.values(self.positions())
+
+    def __iter__(self):
+        return iter(self.items())
+
+    def search(self, text, positions=None):
+        """Позиции элементов, содержащих подстроку (без учёта регистра)
+
+        Args:
+            text (str): Текст для поиска
+            positions: Где искать (по умолчанию - все элементы)
+
+        Returns:
+            array: array('I') позиций найденных элементов
+        """
+        if positions is None:
+            positions = self.positions()
+        text = text.lower()
+        found = (text in item.lower() for item in map(self.__getitem__, positions))
+        return array('I', compress(positions, found))
+
+    def sort_key(self, key=None):
+        """Функция ключа сортировки по позиции
+
+        Ключи последней использованной функции key кэшируются: повторная
+        сортировка и вставка новых элементов не вызывают key заново для
+        уже посчитанных элементов.
+
+        Args:
+            key (callable): Функция ключа для элемента (None - сам элемент)
+
+        Returns:
+            callable: Ключ по позиции элемента
+        """
+        if key is None:
+            return self.__getitem__ if self.packed else self._items.__getitem__
+        if key is not self._key_func:
+            self._key_func = key
+            self._key_values = []
+        values = self._key_values
+        if len(values) < len(self._alive):
+            values.extend(key(self[p]) if self._alive[p] else None
+                          for p in range(len(values), len(self._alive)))
+        return values.__getitem__
+
+    def sort(self, positions, key=None, reverse=False):
+        """Отсортировать позиции по значениям элементов
+
+        Returns:
+            array: array('I') позиций в порядке сортировки
+        """
+        return array('I', sorted(positions, key=self.sort_key(key), reverse=reverse))
+
+    def insort(self, positions, position, key=None, reverse=False):
+        """Вставить позицию в отсортированный массив позиций (bisect)
+
+        Новый элемент встаёт после элементов с равным ключом, как при
+        устойчивой сортировке.
+
+        Args:
+            positions (array): Позиции, отсортированные по key и reverse
+            position (int): Новая позиция
+            key (callable): Функция ключа (None - сам элемент)
+            reverse (bool): Массив отсортирован по убыванию
+        """
+        item_key = self.sort_key(key)
+        value = item_key(position)
+        n = len(positions)
+        if reverse:
+            # По возрастанию ключи идут с конца массива
+            keys = _KeyedView(positions, item_key, n - 1)
+            index = n - bisect.bisect_left(keys, value)
+        else:
+            index = bisect.bisect_right(_KeyedView(positions, item_key), value)
+        positions.insert(index, position)
+
+    def merge(self, positions, added, key=None, reverse=False):
+        """Добавить позиции в отсортированный массив позиций
+
+        Несколько позиций вставляются через bisect; большая порция
+        дописывается в конец, и массив сортируется заново: Timsort сливает
+        две упорядоченные части за линейное время.
+
+        Returns:
+            array: Отсортированный массив (может быть тем же объектом)
+        """
+        if len(added) * 8 > len(positions):
+            positions.extend(self.sort(added, key=key, reverse=reverse))
+            return self.sort(positions, key=key, reverse=reverse)
+        for position in added:
+            self.insort(positions, position, key=key, reverse=reverse)
+        return positions
+
+    def find(self, items):
+        """Позиции для списка элементов
+
+        Одинаковые элементы получают разные позиции по порядку. Элементы,
+        которых нет в хранилище, пропускаются.
+
+        Returns:
+            array: array('I') позиций
+        """
+        free = {}
+        for position in reversed(self.positions()):
+            free.setdefault(self[position], []).append(position)
+        result = array('I')
+        for item in items:
+            stack = free.get(item)
+            if stack:
+                result.append(stack.pop())
+        return result
+
+    def compact(self):
+        """Освободить пустые ячейки
+
+        Позиции элементов меняются. Массив позиций, в котором могут быть
+        удалённые элементы (например, строки, ещё показанные в tk.Listbox),
+        после пересчёта через remap содержит для них DELETED, поэтому
+        sync_listbox() удалит эти строки из виджета.
+
+        Returns:
+            array: Новая позиция для каждой старой (для удалённых - DELETED)
+        """
+        remap = array('I', [self.DELETED]) * len(self._alive)
+        items = self.items()
+        for new, old in enumerate(self.positions()):
+            remap[old] = new
+        self.clear()
+        self.extend(items)
+        return remap
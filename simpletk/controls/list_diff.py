@@ -0,0 +1,52 @@
+def diff_range(old, new):
+    """Найти отличающийся участок двух списков
+
+    Общее начало и общий конец списков отбрасываются, остаётся один
+    участок, который нужно заменить.
+
+    Args:
+        old (list): Прежний список
+        new (list): Новый список
+
+    Returns:
+        tuple: (start, old_end, new_end) - old[start:old_end] заменяется
+            на new[start:new_end]
+    """
+    n_old, n_new = len(old), len(new)
+
+    # Частые случаи (добавление в конец, усечение) проверяются сравнением срезов
+    if n_new >= n_old and new[:n_old] == old:
+        return n_old, n_old, n_new
+    if n_new < n_old and old[:n_new] == new:
+        return n_new, n_old, n_new
+
+    start = 0
+    limit = min(n_old, n_new)
+    while start < limit and old[start] == new[start]:
+        start += 1
+
+    old_end, new_end = n_old, n_new
+    while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+    return start, old_end, new_end
+
+
+def sync_listbox(widget, old, new, store=None):
+    """Привести содержимое tk.Listbox от old к new
+
+    Вместо полного удаления и поэлементной вставки выполняется не более
+    одного delete и одного insert со всеми новыми строками сразу.
+
+    Args:
+        widget (tk.Listbox): Список tkinter, сейчас содержащий old
+        old (list): Текущее содержимое виджета
+        new (list): Новое содержимое
+        store (ItemStore): Если задан, old и new - массивы позиций в нём
+    """
+    start, old_end, new_end = diff_range(old, new)
+    if old_end > start:
+        widget.delete(start, old_end - 1)
+    if new_end > start:
+        values = new[start:new_end]
+        widget.insert(start, *(values if store is None else store.values(values)))
@@ -71,6 +71,14 @@ class ListBox:
 
 import tkinter as tk
 
+from array import array
+
+from .search_worker import SearchWorker, filter_indexes
+from .list_diff import sync_listbox
+from .item_store import ItemStore
+from ..streaming import StreamLoader
+from ..profiler import profiled
+
 class ListBox:
     """Список для выбора элементов с поддержкой сортировки и поиска
     
@@ -79,9 +87,12 @@ class ListBox:
         >>> listbox.sort()  # Сортировка по алфавиту
         >>> listbox.search("а")  # Поиск: показать только элементы с буквой 'а'
         >>> listbox.clear_search()  # Сброс поиска
+        >>> big = ListBox(app, [f"Строка {i}" for i in range(500000)], virtual=True)
     """
     
-    def __init__(self, parent, items, height=5, sortable=True, searchable=True):
+    def __init__(self, parent, items, height=5, sortable=True, searchable=True,
+                 virtual=False, overscan=50, search_delay=0, search_worker=None,
+                 packed=False, intern=False):
         """Инициализация списка
         
         Args:
@@ -90,6 +101,14 @@ class ListBox:
             height (int): Высота списка в строках
             sortable (bool): Возможность сортировки
             searchable (bool): Возможность поиска (ИСПРАВЛЕНО: searchable, а не searchable)
+            virtual (bool): Виртуальный режим для больших списков: в tk.Listbox
+                хранятся только видимые строки и запас overscan сверху и снизу
+            overscan (int): Количество строк запаса в виртуальном режиме
+            search_delay (int): Задержка поиска после ввода в миллисекундах
+            search_worker (str): Где выполнять поиск при вводе: None (в потоке Tk),
+                'thread' или 'process'
+            packed (bool): Хранить строки упакованными в UTF-8 (см. ItemStore)
+            intern (bool): Хранить одинаковые строки одним объектом
         """
         # Get the actual tkinter widget
         if hasattr(parent, 'frame'):
@@ -101,16 +120,32 @@ class ListBox:
         else:
             self.parent = parent
             
-        self.all_items = items.copy()  # Все элементы (оригинал)
-        self.displayed_items = items.copy()  # Отображаемые элементы
+        # Элементы хранятся один раз, отображаемые - массив позиций в хранилище
+        self.store = ItemStore(items, packed=packed, intern=intern)
+        self._view = self.store.positions()
+        self._sort = None  # Активная сортировка: (key, reverse)
         self.sortable = sortable
         self.searchable = searchable  # ИСПРАВЛЕНО
         self.current_search = ""
         
+        # Виртуальный режим: в виджете только окно [_window_start, _window_end)
+        self.virtual = virtual
+        self.height = height
+        self.overscan = max(1, overscan)
+        self._window_start = 0
+        self._window_end = 0
+        self._virtual_selection = None
+        self._rendered = array('I')  # Позиции строк, находящихся сейчас в tk.Listbox
+        
         # Создаём основной контейнер
         self.container = tk.Frame(self.parent)
         self.container.pack(fill=tk.BOTH, expand=True, pady=2)
         
+        # Поиск при вводе: с задержкой и, при необходимости, в фоне
+        self._search_worker = SearchWorker(self.container, search_delay, search_worker)
+        self._loader = None  # Текущая потоковая загрузка (load_stream)
+        self.container.bind('<Destroy>', self._on_destroy)
+        
         # Панель поиска (если включена)
         if searchable:
             self.search_frame = tk.Frame(self.container)
@@ -119,7 +154,8 @@ class ListBox:
             tk.Label(self.search_frame, text="🔍 Поиск:").pack(side=tk.LEFT, padx=2)
             self.search_entry = tk.Entry(self.search_frame, width=15)
             self.search_entry.pack(side=tk.LEFT, padx=2)
-            self.search_entry.bind('<KeyRelease>', self._on_search_change)
+            self.search_entry.bind('<KeyRelease>', profiled(self.container, self._on_search_change,
+                                                            "ListBox.search"))
             
             tk.Button(self.search_frame, text="✕", command=self.clear_search,
                      font=("Arial", 8), width=2).pack(side=tk.LEFT, padx=2)
@@ -141,56 +177,220 @@ class ListBox:
         listbox_frame.pack(fill=tk.BOTH, expand=True)
         
         self.widget = tk.Listbox(listbox_frame, height=height)
-        self.scrollbar = tk.Scrollbar(listbox_frame, orient=tk.VERTICAL, command=self.widget.yview)
-        self.widget.configure(yscrollcommand=self.scrollbar.set)
+        if virtual:
+            # Полоса прокрутки отражает логическое количество строк, а не окно
+            self.scrollbar = tk.Scrollbar(listbox_frame, orient=tk.VERTICAL,
+                                          command=self._on_virtual_scroll)
+            self.widget.configure(yscrollcommand=self._on_virtual_yview)
+            self.widget.bind('<<ListboxSelect>>', self._on_virtual_select)
+        else:
+            self.scrollbar = tk.Scrollbar(listbox_frame, orient=tk.VERTICAL,
+                                          command=self.widget.yview)
+            self.widget.configure(yscrollcommand=self.scrollbar.set)
         
         self.widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Счётчик результатов
         if searchable:
-            self.result_label = tk.Label(self.search_frame, text=f"({len(self.displayed_items)})", 
+            self.result_label = tk.Label(self.search_frame, text=f"({len(self._view)})", 
                                         font=("Arial", 7))
             self.result_label.pack(side=tk.LEFT, padx=2)
         
         # Заполняем список
         self._update_display()
         
+    @property
+    def all_items(self):
+        """Все элементы (новый список)"""
+        return self.store.items()
+        
+    @property
+    def displayed_items(self):
+        """Отображаемые элементы (новый список)"""
+        return self.store.values(self._view)
+        
+    @displayed_items.setter
+    def displayed_items(self, items):
+        self._view = self.store.find(items)
+        
     def _on_search_change(self, event=None):
         """Обработка изменения поискового запроса"""
         search_text = self.search_entry.get().lower()
         self.current_search = search_text
-        self._apply_search()
+        if not search_text:
+            self._apply_search()
+            return
+        self._submit_search(search_text)
+        
+    def _submit_search(self, search_text):
+        """Запустить поиск через SearchWorker (с задержкой или в фоне)"""
+        if self._search_worker.kind == 'process':
+            # В другой процесс передаются сами строки, результат - их номера
+            positions = self.store.positions()
+            self._search_worker.submit(
+                filter_indexes, (self.store.values(positions), search_text),
+                lambda indexes: self._show_search_result(
+                    array('I', map(positions.__getitem__, indexes))))
+        else:
+            self._search_worker.submit(self.store.search, (search_text,),
+                                       self._show_search_result)
+        
+    def _show_search_result(self, view):
+        """Показать результат фонового поиска
+        
+        Args:
+            view (array): Позиции найденных элементов в хранилище
+        """
+        self._view = self._sorted(view)
+        self._update_display()
         
     def _apply_search(self):
         """Применение поиска"""
+        self._search_worker.cancel()
         if not self.current_search:
-            self.displayed_items = self.all_items.copy()
+            view = self.store.positions()
         else:
-            self.displayed_items = [
-                item for item in self.all_items 
-                if self.current_search in item.lower()
-            ]
+            view = self.store.search(self.current_search)
+        self._view = self._sorted(view)
         self._update_display()
         
+    def _sorted(self, view):
+        """Упорядочить позиции по активной сортировке (ключи из кэша)"""
+        if self._sort is None:
+            return view
+        key, reverse = self._sort
+        return self.store.sort(view, key=key, reverse=reverse)
+        
     def _update_display(self):
         """Обновление отображения списка"""
-        self.widget.delete(0, tk.END)
-        for item in self.displayed_items:
-            self.widget.insert(tk.END, item)
+        if self.virtual:
+            self._virtual_selection = None
+            self._render_window(self._virtual_top())
+        else:
+            sync_listbox(self.widget, self._rendered, self._view, self.store)
+            self._rendered = array('I', self._view)
         
         # Обновляем счётчик результатов
         if hasattr(self, 'result_label'):
-            self.result_label.config(text=f"({len(self.displayed_items)})")
+            self.result_label.config(text=f"({len(self._view)})")
+            
+    # Виртуальный режим
+    def _visible_rows(self):
+        """Количество строк, помещающихся в видимой области"""
+        rows = self.widget.nearest(self.widget.winfo_height()) - self.widget.nearest(0) + 1
+        return max(self.height, rows)
+        
+    def _virtual_top(self):
+        """Логический индекс первой видимой строки"""
+        if self._window_end <= self._window_start:
+            return 0
+        return self._window_start + self.widget.nearest(0)
+        
+    def _render_window(self, top):
+        """Заполнить виджет строками вокруг логического индекса top
+        
+        Args:
+            top (int): Логический индекс первой видимой строки
+        """
+        total = len(self._view)
+        visible = self._visible_rows()
+        top = max(0, min(top, total - visible))
+        start = max(0, top - self.overscan)
+        end = min(total, top + visible + self.overscan)
+        
+        self._window_start, self._window_end = start, end
+        self.widget.delete(0, tk.END)
+        if end > start:
+            self.widget.insert(tk.END, *self.store.values(self._view[start:end]))
+        self.widget.yview(top - start)
+        
+        if self._virtual_selection is not None and start <= self._virtual_selection < end:
+            self.widget.selection_set(self._virtual_selection - start)
+        self._update_virtual_scrollbar(top, visible)
+            
+    def _needs_render(self, top, visible):
+        """Проверить, подошла ли видимая область к краю окна"""
+        total = len(self._view)
+        margin = max(1, self.overscan // 2)
+        if self._window_start > 0 and top - self._window_start < margin:
+            return True
+        if self._window_end < total and self._window_end - (top + visible) < margin:
+            return True
+        return False
+        
+    def _update_virtual_scrollbar(self, top, visible):
+        """Установить положение полосы прокрутки по логическому индексу"""
+        total = len(self._view)
+        if total:
+            self.scrollbar.set(top / total, min(1.0, (top + visible) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        
+    def _on_virtual_yview(self, first, last):
+        """Прокрутка внутри окна (колесо мыши, клавиатура)"""
+        top = self._virtual_top()
+        visible = self._visible_rows()
+        if self._needs_render(top, visible):
+            self._render_window(top)
+        else:
+            self._update_virtual_scrollbar(top, visible)
+            
+    def _on_virtual_scroll(self, *args):
+        """Обработка команд полосы прокрутки в виртуальном режиме"""
+        total = len(self._view)
+        visible = self._visible_rows()
+        top = self._virtual_top()
+        if args[0] == 'moveto':
+            top = int(float(args[1]) * total)
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            top += step * visible if args[2] == 'pages' else step
+        top = max(0, min(top, total - visible))
+        
+        if self._window_start <= top and top + visible <= self._window_end \
+                and not self._needs_render(top, visible):
+            self.widget.yview(top - self._window_start)
+        else:
+            self._render_window(top)
+            
+    def _on_virtual_select(self, event=None):
+        """Запомнить логический индекс выбранной строки"""
+        selection = self.widget.curselection()
+        if selection:
+            self._virtual_selection = self._window_start + selection[0]
+            
+    def _selected_index(self):
+        """Логический индекс выбранного элемента среди отображаемых
+        
+        Returns:
+            int or None: Индекс или None
+        """
+        if self.virtual:
+            return self._virtual_selection
+        selection = self.widget.curselection()
+        if selection:
+            return selection[0]
+        return None
             
     def sort(self, key=None, reverse=False):
         """Сортировка элементов
         
+        Сортировка запоминается: результаты поиска и новые элементы
+        показываются в том же порядке. Ключи кэшируются для каждого
+        элемента, а смена направления с тем же key только разворачивает
+        список без повторной сортировки.
+        
         Args:
             key: Функция для получения ключа сортировки
             reverse (bool): Сортировка по убыванию
         """
-        self.displayed_items.sort(key=key, reverse=reverse)
+        if self._sort is not None and self._sort[0] is key:
+            if self._sort[1] != reverse:
+                self._view.reverse()
+        else:
+            self._view = self.store.sort(self._view, key=key, reverse=reverse)
+        self._sort = (key, reverse)
         self._update_display()
         
     def search(self, text):
@@ -207,20 +407,23 @@ class ListBox:
         
     def clear_search(self):
         """Сброс поиска"""
+        self._search_worker.cancel()
         self.current_search = ""
         if self.searchable:
             self.search_entry.delete(0, tk.END)
-        self.displayed_items = self.all_items.copy()
+        self._view = self._sorted(self.store.positions())
         self._update_display()
         
     def add_item(self, item):
         """Добавить элемент в список
         
+        Элемент встаёт на своё место при активной сортировке и
+        показывается, если подходит под текущий поиск.
+        
         Args:
             item (str): Новый элемент
         """
-        self.all_items.append(item)
-        self.clear_search()  # Обновляем отображение
+        self._append_items([item])
         
     def add_items(self, items):
         """Добавить несколько элементов
@@ -228,30 +431,103 @@ class ListBox:
         Args:
             items (list): Список новых элементов
         """
-        self.all_items.extend(items)
-        self.clear_search()
+        self._append_items(items)
+        
+    def load_stream(self, iterable, chunk_size=1000, on_progress=None, on_done=None):
+        """Добавить элементы из итератора порциями, не блокируя интерфейс
+        
+        Первая порция показывается сразу, остальные добавляются в конец по
+        мере чтения. Активный поиск не сбрасывается: новые элементы
+        проверяются по текущему запросу.
+        
+        Args:
+            iterable: Источник элементов (генератор, файл, курсор и т.д.)
+            chunk_size (int): Количество элементов в порции
+            on_progress (callable): Вызывается с числом загруженных элементов
+            on_done (callable): Вызывается с общим числом элементов
+            
+        Returns:
+            StreamLoader: Объект загрузки (loader.cancel() - остановить)
+        """
+        self.cancel_stream()
+        self._loader = StreamLoader(self.container, iterable, self._append_items,
+                                    chunk_size, on_progress, on_done)
+        return self._loader
+        
+    def cancel_stream(self):
+        """Остановить потоковую загрузку, начатую load_stream()"""
+        if self._loader is not None:
+            self._loader.cancel()
+            self._loader = None
+        
+    def _append_items(self, items):
+        """Добавить элементы без сброса поиска и выбора
+        
+        Без сортировки элементы дописываются в конец, при активной
+        сортировке - вставляются на свои места.
+        """
+        added = array('I', self.store.extend(items))
+        if self.current_search and self._search_worker.stale:
+            # Результат фонового поиска не содержал бы новых элементов
+            self._submit_search(self.current_search)
+            return
+        if self.current_search:
+            added = self.store.search(self.current_search, added)
+        if self._sort is not None and added:
+            key, reverse = self._sort
+            self._view = self.store.merge(self._view, added, key=key, reverse=reverse)
+            self._update_display()
+            return
+        self._view.extend(added)
+        
+        if self.virtual:
+            top = self._virtual_top()
+            visible = self._visible_rows()
+            if self._needs_render(top, visible):
+                self._render_window(top)
+            else:
+                self._update_virtual_scrollbar(top, visible)
+        elif added:
+            self.widget.insert(tk.END, *self.store.values(added))
+            self._rendered.extend(added)
+        
+        if hasattr(self, 'result_label'):
+            self.result_label.config(text=f"({len(self._view)})")
+        
+    def _on_destroy(self, event=None):
+        """Остановить фоновые задачи при удалении виджета"""
+        self._search_worker.shutdown()
+        self.cancel_stream()
         
     def remove_selected(self):
         """Удалить выбранный элемент"""
-        selection = self.widget.curselection()
-        if selection:
-            index = selection[0]
-            item = self.displayed_items[index]
-            # Удаляем из оригинального списка
-            self.all_items.remove(item)
-            # Удаляем из отображаемого
-            self.displayed_items.pop(index)
+        index = self._selected_index()
+        if index is not None:
+            self._search_worker.cancel()
+            # Удаляем из хранилища и из отображаемых
+            self.store.discard(self._view[index])
+            del self._view[index]
+            if self.store.slots > 2 * len(self.store) + 1024:
+                self._compact()
             self._update_display()
             
+    def _compact(self):
+        """Освободить пустые ячейки хранилища после удалений"""
+        remap = self.store.compact()
+        self._view = array('I', map(remap.__getitem__, self._view))
+        # Удалённые, но ещё показанные строки получают ItemStore.DELETED и
+        # убираются из виджета при следующей синхронизации
+        self._rendered = array('I', map(remap.__getitem__, self._rendered))
+            
     def get_selected(self):
         """Получить выбранный элемент
         
         Returns:
             str or None: Выбранный элемент или None
         """
-        selection = self.widget.curselection()
-        if selection:
-            return self.displayed_items[selection[0]]
+        index = self._selected_index()
+        if index is not None:
+            return self.store[self._view[index]]
         return None
         
     def get_all_items(self):
@@ -260,7 +536,7 @@ class ListBox:
         Returns:
             list: Все элементы
         """
-        return self.all_items.copy()
+        return self.store.items()
         
     def get_displayed_items(self):
         """Получить отображаемые элементы (с учётом поиска)
@@ -268,12 +544,14 @@ class ListBox:
         Returns:
             list: Отображаемые элементы
         """
-        return self.displayed_items.copy()
+        return self.store.values(self._view)
         
     def clear(self):
         """Очистить список"""
-        self.all_items = []
-        self.displayed_items = []
+        self._search_worker.cancel()
+        self.cancel_stream()
+        self.store.clear()
+        self._view = array('I')
         self._update_display()
         
     def hide(self):
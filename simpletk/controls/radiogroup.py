@@ -1,5 +1,7 @@
 import tkinter as tk
 
+from ..callbacks import wrap_callback
+
 class RadioGroup:
     """Группа радиокнопок
     
@@ -28,6 +30,7 @@ class RadioGroup:
         self.value = tk.StringVar()
         self.value.set(options[0] if options else "")
         self.buttons = []
+        on_change = wrap_callback(self.parent, on_change, "RadioGroup.on_change")
         
         for option in options:
             rb = tk.Radiobutton(self.parent, text=option, variable=self.value,
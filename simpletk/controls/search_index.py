@@ -0,0 +1,386 @@
+import bisect
+import heapq
+from array import array
+from itertools import compress
+
+# Подсчёт единичных битов (int.bit_count появился в Python 3.10)
+_bit_count = getattr(int, 'bit_count', None) or (lambda value: bin(value).count('1'))
+
+
+def char_mask(text):
+    """Битовая маска символов строки
+
+    Каждый символ устанавливает бит ord(символ) % 64. Если в маске строки
+    нет бита символа запроса, этого символа нет и в строке, поэтому
+    строки без нужных символов отбрасываются одной операцией AND.
+
+    Args:
+        text (str): Строка (обычно в нижнем регистре)
+
+    Returns:
+        int: 64-битная маска
+    """
+    mask = 0
+    for ch in set(text):
+        mask |= 1 << (ord(ch) & 63)
+    return mask
+
+
+def fuzzy_score(query, text, typos=1):
+    """Оценка нечёткого совпадения запроса со строкой
+
+    Символы запроса ищутся в строке по порядку (как подпоследовательность).
+    Не более typos символов запроса могут не найтись - так учитываются
+    опечатки, лишние и переставленные буквы. Больше очков дают символы,
+    идущие подряд и стоящие в начале слов; при равенстве выше более
+    короткие строки.
+
+    Args:
+        query (str): Запрос в нижнем регистре
+        text (str): Строка в нижнем регистре
+        typos (int): Допустимое количество ненайденных символов запроса
+
+    Returns:
+        tuple: Ключ для сравнения (больше - лучше) или None, если строка
+            не подходит
+    """
+    find = text.find
+    # Если запрос входит в строку целиком, совпадение начинается с него
+    start = max(find(query), 0)
+    score = 0
+    missed = 0
+    last = -2
+    for ch in query:
+        i = find(ch, start)
+        if i < 0:
+            missed += 1
+            if missed > typos:
+                return None
+            continue
+        if i == last + 1:
+            score += 3
+        elif i == 0 or not text[i - 1].isalnum():
+            score += 2
+        else:
+            score += 1
+        last = i
+        start = i + 1
+    return score - 2 * missed, -len(text)
+
+
+class SearchIndex:
+    """Индекс для быстрого поиска по списку строк
+
+    Хранит строки в нижнем регистре, отсортированный массив строк для
+    поиска по началу и массив перевёрнутых строк для поиска по концу.
+    Индекс строится один раз методом build() и дальше обновляется
+    методами add(), extend() и remove(). Новые элементы попадают в
+    отсортированные массивы не сразу, а при следующем поиске по началу
+    или концу, одним слиянием для всех добавленных порций. Уточняющий
+    запрос (новый текст содержит предыдущий) проверяет только результат
+    прошлого поиска.
+
+    Результаты всегда возвращаются в порядке добавления элементов, кроме
+    нечёткого поиска fuzzy(), который возвращает лучшие совпадения по
+    убыванию оценки.
+
+    У каждого элемента есть id - его номер в порядке добавления (после
+    build() нумерация начинается с нуля). Методы *_ids() возвращают
+    найденные id вместо элементов.
+
+    Свой индекс можно передать в SearchableList(index=...): достаточно
+    реализовать методы build, add, remove, contains, startswith и endswith;
+    без метода extend элементы добавляются по одному через add(), без
+    метода clear индекс очищается через build([]), без методов *_ids()
+    найденные элементы сопоставляются с позициями списка.
+
+    Пример:
+        >>> index = SearchIndex()
+        >>> index.build(["Яблоко", "Банан", "Апельсин"])
+        >>> index.startswith("ап")
+        ['Апельсин']
+    """
+
+    def __init__(self):
+        """Инициализация пустого индекса"""
+        self.clear()
+
+    def clear(self):
+        """Очистить индекс"""
+        self._next_id = 0
+        self._items = {}    # id -> элемент (в порядке добавления)
+        self._folded = {}   # id -> строка в нижнем регистре
+        self._ids = {}      # элемент -> список id его копий
+        self._prefix = []   # отсортированные пары (строка, id)
+        self._suffix = []   # отсортированные пары (перевёрнутая строка, id)
+        self._unsorted = []  # (id, строка), ещё не добавленные в _prefix и _suffix
+        self._last_query = ""
+        self._last_result = None
+        self._version = 0
+        self._masks = None  # Маски символов по id (строятся при первом fuzzy())
+
+    def _store(self, item):
+        """Сохранить элемент без обновления отсортированных массивов"""
+        item_id = self._next_id
+        self._next_id += 1
+        self._version += 1
+        folded = item.lower()
+        self._items[item_id] = item
+        self._folded[item_id] = folded
+        self._ids.setdefault(item, []).append(item_id)
+        if self._masks is not None:
+            self._masks.append(char_mask(folded))
+        return item_id, folded
+
+    def build(self, items):
+        """Построить индекс заново
+
+        Args:
+            items (list): Список элементов
+        """
+        self.clear()
+        for item in items:
+            self._store(item)
+        self._prefix = sorted((folded, i) for i, folded in self._folded.items())
+        self._suffix = sorted((folded[::-1], i) for i, folded in self._folded.items())
+
+    def add(self, item):
+        """Добавить элемент в индекс
+
+        Args:
+            item (str): Новый элемент
+        """
+        self.extend((item,))
+
+    def extend(self, items):
+        """Добавить несколько элементов в индекс
+
+        Время не зависит от размера индекса: ключи новых элементов
+        сливаются с отсортированными массивами при следующем поиске по
+        началу или концу (см. _merge_unsorted).
+
+        Args:
+            items (list): Новые элементы
+        """
+        new = [self._store(item) for item in items]
+        self._unsorted.extend(new)
+        if self._last_result is not None:
+            query = self._last_query
+            self._last_result.extend(i for i, folded in new if query in folded)
+
+    def _merge_unsorted(self):
+        """Добавить отложенные ключи в отсортированные массивы
+
+        Несколько ключей вставляются через bisect. Много ключей
+        сортируются отдельно, а массив собирается из срезов между местами
+        их вставки: сравнений O(k log n) вместо сравнения всех n ключей.
+        """
+        new, self._unsorted = self._unsorted, []
+        if len(new) <= 16:
+            for item_id, folded in new:
+                bisect.insort(self._prefix, (folded, item_id))
+                bisect.insort(self._suffix, (folded[::-1], item_id))
+            return
+        self._merge_keys(self._prefix, sorted((folded, i) for i, folded in new))
+        self._merge_keys(self._suffix, sorted((folded[::-1], i) for i, folded in new))
+
+    @staticmethod
+    def _merge_keys(array, keys):
+        """Слить отсортированные keys с отсортированным массивом (на месте)"""
+        merged = []
+        start = 0
+        for key in keys:
+            pos = bisect.bisect_right(array, key, start)
+            merged.extend(array[start:pos])
+            merged.append(key)
+            start = pos
+        merged.extend(array[start:])
+        array[:] = merged
+
+    def remove(self, item):
+        """Удалить элемент из индекса (первое вхождение)
+
+        Args:
+            item (str): Элемент для удаления
+        """
+        ids = self._ids.get(item)
+        if ids:
+            self.remove_id(ids[0])
+
+    def remove_id(self, item_id):
+        """Удалить элемент из индекса по его id
+
+        Args:
+            item_id (int): id элемента
+        """
+        item = self._items.pop(item_id, None)
+        if item is None:
+            return
+        self._version += 1
+        ids = self._ids[item]
+        ids.remove(item_id)
+        if not ids:
+            del self._ids[item]
+        folded = self._folded.pop(item_id)
+        if self._masks is not None:
+            self._masks[item_id] = 0
+        if self._unsorted:
+            self._merge_unsorted()
+        self._discard(self._prefix, (folded, item_id))
+        self._discard(self._suffix, (folded[::-1], item_id))
+        if self._last_result is not None and item_id in self._last_result:
+            self._last_result.remove(item_id)
+
+    @staticmethod
+    def _discard(array, key):
+        """Удалить ключ из отсортированного массива"""
+        pos = bisect.bisect_left(array, key)
+        if pos < len(array) and array[pos] == key:
+            del array[pos]
+
+    def _result(self, ids):
+        """Преобразовать список id в список элементов"""
+        return [self._items[i] for i in ids]
+
+    def _scan_sorted(self, array, key):
+        """Найти id всех строк массива, начинающихся с key"""
+        if self._unsorted:
+            self._merge_unsorted()
+        ids = []
+        pos = bisect.bisect_left(array, (key,))
+        while pos < len(array) and array[pos][0].startswith(key):
+            ids.append(array[pos][1])
+            pos += 1
+        ids.sort()
+        return ids
+
+    def contains(self, text):
+        """Найти элементы, содержащие подстроку (без учёта регистра)
+
+        Args:
+            text (str): Текст для поиска
+
+        Returns:
+            list: Найденные элементы
+        """
+        return self._result(self.contains_ids(text))
+
+    def contains_ids(self, text):
+        """id элементов, содержащих подстроку (без учёта регистра)
+
+        Поиск может выполняться в фоновом потоке (SearchWorker), поэтому
+        результат запоминается для уточняющих запросов, только если индекс
+        не изменился за время поиска.
+
+        Args:
+            text (str): Текст для поиска
+
+        Returns:
+            list: id найденных элементов по возрастанию
+        """
+        text = text.lower()
+        if not text:
+            return list(self._items)
+        version = self._version
+
+        if self._last_result is not None and self._last_query and self._last_query in text:
+            folded = self._folded
+            ids = [i for i in self._last_result if text in folded[i]]
+        else:
+            ids = [i for i, folded in self._folded.items() if text in folded]
+
+        if version == self._version:
+            self._last_query = text
+            self._last_result = ids
+        return list(ids)
+
+    def startswith(self, prefix):
+        """Найти элементы, начинающиеся с prefix (без учёта регистра)
+
+        Args:
+            prefix (str): Начало строки
+
+        Returns:
+            list: Найденные элементы
+        """
+        return self._result(self.startswith_ids(prefix))
+
+    def startswith_ids(self, prefix):
+        """id элементов, начинающихся с prefix (без учёта регистра)"""
+        return self._scan_sorted(self._prefix, prefix.lower())
+
+    def endswith(self, suffix):
+        """Найти элементы, заканчивающиеся на suffix (без учёта регистра)
+
+        Args:
+            suffix (str): Конец строки
+
+        Returns:
+            list: Найденные элементы
+        """
+        return self._result(self.endswith_ids(suffix))
+
+    def endswith_ids(self, suffix):
+        """id элементов, заканчивающихся на suffix (без учёта регистра)"""
+        return self._scan_sorted(self._suffix, suffix.lower()[::-1])
+
+    def fuzzy(self, text, limit=100, typos=1):
+        """Нечёткий поиск: лучшие совпадения по убыванию оценки
+
+        Args:
+            text (str): Текст для поиска
+            limit (int): Максимальное количество результатов
+            typos (int): Допустимое количество опечаток (см. fuzzy_score)
+
+        Returns:
+            list: Найденные элементы
+        """
+        return self._result(self.fuzzy_ids(text, limit, typos))
+
+    def fuzzy_ids(self, text, limit=100, typos=1):
+        """id лучших нечётких совпадений по убыванию оценки
+
+        Сначала маски символов отбрасывают строки, в которых не хватает
+        больше typos символов запроса. Проверка идёт цепочкой map() и
+        compress() без Python-кода на каждый элемент. Оставшиеся строки
+        оцениваются fuzzy_score(), а лучшие limit выбираются кучей
+        (heapq.nlargest) без сортировки всех совпадений.
+
+        Args:
+            text (str): Текст для поиска
+            limit (int): Максимальное количество результатов
+            typos (int): Допустимое количество опечаток
+
+        Returns:
+            list: id найденных элементов
+        """
+        query = text.lower()
+        if not query:
+            return list(self._items)[:limit]
+        if self._masks is None:
+            self._masks = array('Q', [0]) * self._next_id
+            for item_id, folded in self._folded.items():
+                self._masks[item_id] = char_mask(folded)
+
+        # Биты запроса, которых нет в маске строки: q ^ (q & mask)
+        need = char_mask(query)
+        missing = map(need.__xor__, map(need.__and__, self._masks))
+        if typos:
+            passed = map(typos.__ge__, map(_bit_count, missing))
+        else:
+            passed = map((0).__eq__, missing)
+        candidates = compress(range(len(self._masks)), passed)
+
+        def scored():
+            folded = self._folded
+            for item_id in candidates:
+                text_folded = folded.get(item_id)
+                if text_folded is not None:
+                    score = fuzzy_score(query, text_folded, typos)
+                    if score is not None:
+                        yield score, -item_id
+
+        return [-neg_id for score, neg_id in heapq.nlargest(limit, scored())]
+
+    def __len__(self):
+        return len(self._items)
@@ -0,0 +1,175 @@
+import heapq
+
+from .search_index import fuzzy_score
+from ..profiler import profiled
+
+
+def filter_contains(items, text):
+    """Отфильтровать элементы, содержащие подстроку (без учёта регистра)
+
+    Функция объявлена на уровне модуля, чтобы её можно было выполнить
+    в отдельном процессе.
+
+    Args:
+        items (list): Список элементов
+        text (str): Текст для поиска
+
+    Returns:
+        list: Найденные элементы
+    """
+    text = text.lower()
+    return [item for item in items if text in item.lower()]
+
+
+def filter_indexes(items, text):
+    """Номера элементов, содержащих подстроку (без учёта регистра)
+
+    То же, что filter_contains(), но возвращает номера найденных элементов:
+    обратно из процесса передаются только числа.
+
+    Args:
+        items (list): Список элементов
+        text (str): Текст для поиска
+
+    Returns:
+        list: Номера найденных элементов
+    """
+    text = text.lower()
+    return [i for i, item in enumerate(items) if text in item.lower()]
+
+
+def rank_fuzzy(items, text, limit=100, typos=1):
+    """Номера лучших нечётких совпадений по убыванию оценки
+
+    Используется без индекса (в отдельном процессе или с пользовательским
+    индексом); оценка та же, что в SearchIndex.fuzzy().
+
+    Args:
+        items (list): Список элементов
+        text (str): Текст для поиска
+        limit (int): Максимальное количество результатов
+        typos (int): Допустимое количество опечаток
+
+    Returns:
+        list: Номера найденных элементов
+    """
+    query = text.lower()
+    if not query:
+        return list(range(min(limit, len(items))))
+    scores = (fuzzy_score(query, item.lower(), typos) for item in items)
+    scored = ((score, -i) for i, score in enumerate(scores) if score is not None)
+    return [-neg_i for score, neg_i in heapq.nlargest(limit, scored)]
+
+
+class SearchWorker:
+    """Отложенный и отменяемый поиск для списков
+
+    Каждый новый запрос откладывается на delay миллисекунд, предыдущий
+    при этом отменяется. Если задан kind ('thread' или 'process'), поиск
+    выполняется в фоновом исполнителе, а результат передаётся в on_result
+    в потоке Tk через after(). Применяется только результат последнего
+    запроса, устаревшие результаты отбрасываются.
+
+    Пример:
+        >>> worker = SearchWorker(widget, delay=200, kind='thread')
+        >>> worker.submit(filter_contains, (items, "яб"), show_result)
+    """
+
+    POLL_INTERVAL = 15  # мс между проверками готовности результата
+
+    def __init__(self, widget, delay=0, kind=None):
+        """Инициализация
+
+        Args:
+            widget: Виджет tkinter для планирования after()
+            delay (int): Задержка перед поиском в миллисекундах
+            kind (str): None (поиск в потоке Tk), 'thread' или 'process'
+        """
+        if kind not in (None, 'thread', 'process'):
+            raise ValueError(f"Неизвестный тип исполнителя: {kind}")
+        self.widget = widget
+        self.delay = delay
+        self.kind = kind
+        self._executor = None
+        self._pending = None
+        self._future = None
+        self._generation = 0
+        self._start = profiled(widget, self._start, "SearchWorker.search")
+
+    def _get_executor(self):
+        """Создать исполнитель при первом использовании"""
+        if self._executor is None:
+            # concurrent.futures импортируется только при фоновом поиске
+            from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+            if self.kind == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=1)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+        return self._executor
+
+    def submit(self, func, args, on_result):
+        """Запланировать поиск, отменив предыдущий
+
+        Args:
+            func (callable): Функция поиска
+            args (tuple): Аргументы функции
+            on_result (callable): Вызывается с результатом в потоке Tk
+        """
+        self.cancel()
+        if not self.delay and self.kind is None:
+            on_result(func(*args))
+            return
+        if self.kind is not None:
+            on_result = profiled(self.widget, on_result, "SearchWorker.on_result")
+        self._pending = self.widget.after(self.delay, self._start,
+                                          self._generation, func, args, on_result)
+
+    def cancel(self):
+        """Отменить ожидающий и выполняющийся поиск"""
+        self._generation += 1
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+            self._pending = None
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+
+    @property
+    def stale(self):
+        """Не учтёт ли ожидаемый результат изменений списка
+
+        Так бывает, если поиск уже выполняется в фоне или ждёт запуска в
+        отдельном процессе (строки для него уже скопированы). Список после
+        изменения должен запустить поиск заново, иначе устаревший результат
+        заменит обновлённое отображение.
+        """
+        return self._future is not None or (self.kind == 'process' and self._pending is not None)
+
+    def _start(self, generation, func, args, on_result):
+        """Запустить поиск по истечении задержки"""
+        self._pending = None
+        if generation != self._generation:
+            return
+        if self.kind is None:
+            on_result(func(*args))
+            return
+        self._future = self._get_executor().submit(func, *args)
+        self._poll(generation, self._future, on_result)
+
+    def _poll(self, generation, future, on_result):
+        """Проверить готовность результата и применить его"""
+        if generation != self._generation:
+            return
+        if not future.done():
+            self.widget.after(self.POLL_INTERVAL, self._poll, generation, future, on_result)
+            return
+        self._future = None
+        if not future.cancelled():
+            on_result(future.result())
+
+    def shutdown(self):
+        """Остановить исполнитель"""
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -1,4 +1,12 @@
 import tkinter as tk
+from array import array
+
+from .search_index import SearchIndex
+from .search_worker import SearchWorker, filter_indexes, rank_fuzzy
+from .list_diff import sync_listbox
+from .item_store import ItemStore
+from ..streaming import StreamLoader
+from ..profiler import profiled
 
 class SearchableList:
     """Список с расширенными возможностями поиска и сортировки
@@ -10,9 +18,12 @@ class SearchableList:
         >>> slist.search("а")  # Поиск элементов с буквой 'а'
         >>> slist.search_startswith("А")  # Поиск элементов на 'А'
         >>> slist.sort_by_length()  # Сортировка по длине
+        >>> slist.search_fuzzy("апльсин")  # Нечёткий поиск с опечаткой
     """
     
-    def __init__(self, parent, items, height=5, show_controls=True):
+    def __init__(self, parent, items, height=5, show_controls=True, index=None,
+                 search_delay=0, search_worker=None, packed=False, intern=False,
+                 fuzzy=False, fuzzy_limit=100, typos=1):
         """Инициализация списка с поиском
         
         Args:
@@ -20,6 +31,16 @@ class SearchableList:
             items (list): Список элементов
             height (int): Высота списка
             show_controls (bool): Показывать панель управления
+            index: Поисковый индекс (по умолчанию SearchIndex)
+            search_delay (int): Задержка поиска после ввода в миллисекундах
+            search_worker (str): Где выполнять поиск при вводе: None (в потоке Tk),
+                'thread' или 'process'
+            packed (bool): Хранить строки упакованными в UTF-8 (см. ItemStore)
+            intern (bool): Хранить одинаковые строки одним объектом
+            fuzzy (bool): Нечёткий поиск при вводе (лучшие совпадения по
+                убыванию оценки вместо поиска подстроки)
+            fuzzy_limit (int): Количество результатов нечёткого поиска
+            typos (int): Допустимое количество опечаток в нечётком поиске
         """
         # Get the actual tkinter widget
         if hasattr(parent, 'frame'):
@@ -31,13 +52,32 @@ class SearchableList:
         else:
             self.parent = parent
             
-        self.all_items = items.copy()
-        self.displayed_items = items.copy()
+        # Элементы хранятся один раз, отображаемые - массив позиций в хранилище
+        self.store = ItemStore(items, packed=packed, intern=intern)
+        self._view = self.store.positions()
+        self._sort = None  # Активная сортировка: (key, reverse)
+        # Активный поиск не по тексту из поля (search_startswith и т.д.):
+        # (предикат для новых элементов, повтор поиска) или None
+        self._filter = None
+        self._rendered = array('I')  # Позиции строк, находящихся сейчас в tk.Listbox
+        
+        # Индекс строится один раз и дальше обновляется инкрементально;
+        # id элементов SearchIndex совпадают с позициями в хранилище
+        self.index = index if index is not None else SearchIndex()
+        self.index.build(items)
+        self.fuzzy = fuzzy
+        self.fuzzy_limit = fuzzy_limit
+        self.typos = typos
         
         # Создаём основной контейнер
         self.container = tk.Frame(self.parent)
         self.container.pack(fill=tk.BOTH, expand=True, pady=2)
         
+        # Поиск при вводе: с задержкой и, при необходимости, в фоне
+        self._search_worker = SearchWorker(self.container, search_delay, search_worker)
+        self._loader = None  # Текущая потоковая загрузка (load_stream)
+        self.container.bind('<Destroy>', self._on_destroy)
+        
         if show_controls:
             self._create_control_panel()
         
@@ -56,7 +96,8 @@ class SearchableList:
         tk.Label(search_frame, text="🔍 Поиск:").pack(side=tk.LEFT)
         self.search_entry = tk.Entry(search_frame)
         self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=2)
-        self.search_entry.bind('<KeyRelease>', self._on_search)
+        self.search_entry.bind('<KeyRelease>', profiled(self.container, self._on_search,
+                                                        "SearchableList.search"))
         
         tk.Button(search_frame, text="✕", command=self.clear_search,
                  font=("Arial", 8), width=2).pack(side=tk.LEFT)
@@ -87,7 +128,7 @@ class SearchableList:
         
         # Информация
         self.info_label = tk.Label(self.control_frame, 
-                                   text=f"Всего: {len(self.all_items)}", 
+                                   text=f"Всего: {len(self.store)}", 
                                    font=("Arial", 7))
         self.info_label.pack(pady=1)
         
@@ -105,24 +146,114 @@ class SearchableList:
         
         self._update_display()
         
+    @property
+    def all_items(self):
+        """Все элементы (новый список)"""
+        return self.store.items()
+        
+    @property
+    def displayed_items(self):
+        """Отображаемые элементы (новый список)"""
+        return self.store.values(self._view)
+        
+    @displayed_items.setter
+    def displayed_items(self, items):
+        self._view = self.store.find(items)
+        
     def _update_display(self):
         """Обновление отображения"""
-        self.widget.delete(0, tk.END)
-        for item in self.displayed_items:
-            self.widget.insert(tk.END, item)
+        sync_listbox(self.widget, self._rendered, self._view, self.store)
+        self._rendered = array('I', self._view)
+        self._update_info()
         
+    def _update_info(self):
+        """Обновление счётчика найденных элементов"""
         if hasattr(self, 'info_label'):
-            self.info_label.config(text=f"Найдено: {len(self.displayed_items)} из {len(self.all_items)}")
+            self.info_label.config(text=f"Найдено: {len(self._view)} из {len(self.store)}")
+        
+    def _index_search(self, method, text):
+        """Поиск по индексу
+        
+        Args:
+            method (str): 'contains', 'startswith' или 'endswith'
+            text (str): Текст для поиска
+            
+        Returns:
+            array: array('I') позиций найденных элементов в хранилище
+        """
+        search_ids = getattr(self.index, method + '_ids', None)
+        if search_ids is not None:
+            return array('I', search_ids(text))
+        # Пользовательский индекс возвращает сами элементы
+        return self.store.find(getattr(self.index, method)(text))
+        
+    def _fuzzy_search(self, text, limit, typos):
+        """Нечёткий поиск по индексу (или по всем элементам без индекса)
+        
+        Returns:
+            array: array('I') позиций лучших совпадений по убыванию оценки
+        """
+        if hasattr(self.index, 'fuzzy_ids'):
+            return array('I', self.index.fuzzy_ids(text, limit, typos))
+        positions = self.store.positions()
+        indexes = rank_fuzzy(self.store.values(positions), text, limit, typos)
+        return array('I', map(positions.__getitem__, indexes))
+        
+    def _text_search(self, text):
+        """Поиск по тексту из поля ввода в текущем режиме"""
+        if self.fuzzy:
+            return self._fuzzy_search(text, self.fuzzy_limit, self.typos)
+        return self._index_search('contains', text)
         
     def _on_search(self, event=None):
-        """Обработка поиска"""
-        text = self.search_entry.get().lower()
-        if text:
-            self.displayed_items = [item for item in self.all_items if text in item.lower()]
+        """Обработка ввода в поле поиска"""
+        self._filter = None
+        text = self.search_entry.get()
+        if not text:
+            self._run_search()
+        elif self._search_worker.kind == 'process':
+            # Индекс живёт в этом процессе, поэтому в другой передаются сами
+            # строки, а обратно - номера найденных
+            positions = self.store.positions()
+            values = self.store.values(positions)
+            if self.fuzzy:
+                func, args = rank_fuzzy, (values, text, self.fuzzy_limit, self.typos)
+            else:
+                func, args = filter_indexes, (values, text)
+            self._search_worker.submit(
+                func, args,
+                lambda indexes: self._show_search_result(
+                    array('I', map(positions.__getitem__, indexes))))
         else:
-            self.displayed_items = self.all_items.copy()
+            self._search_worker.submit(self._text_search, (text,),
+                                       self._show_search_result)
+        
+    def _show_search_result(self, view):
+        """Показать результат поиска
+        
+        Args:
+            view (array): Позиции найденных элементов в хранилище
+        """
+        self._view = self._sorted(view)
         self._update_display()
         
+    def _sorted(self, view):
+        """Упорядочить позиции по активной сортировке (ключи из кэша)"""
+        if self._sort is None:
+            return view
+        key, reverse = self._sort
+        return self.store.sort(view, key=key, reverse=reverse)
+        
+    def _run_search(self):
+        """Немедленный поиск по тексту из поля ввода"""
+        self._search_worker.cancel()
+        self._filter = None
+        text = self.search_entry.get()
+        if text:
+            self._show_search_result(self._text_search(text))
+        else:
+            self._show_search_result(self.store.positions())
+        
     def _search_startswith_dialog(self):
         """Диалог для поиска по началу строки"""
         dialog = tk.Toplevel(self.parent)
@@ -162,32 +293,38 @@ class SearchableList:
     # Методы сортировки
     def sort_ascending(self):
         """Сортировка по возрастанию"""
-        self.displayed_items.sort()
-        self._update_display()
+        self.sort_by(None)
         
     def sort_descending(self):
         """Сортировка по убыванию"""
-        self.displayed_items.sort(reverse=True)
-        self._update_display()
+        self.sort_by(None, reverse=True)
         
     def sort_by_length_asc(self):
         """Сортировка по длине (возрастание)"""
-        self.displayed_items.sort(key=len)
-        self._update_display()
+        self.sort_by(len)
         
     def sort_by_length_desc(self):
         """Сортировка по длине (убывание)"""
-        self.displayed_items.sort(key=len, reverse=True)
-        self._update_display()
+        self.sort_by(len, reverse=True)
         
     def sort_by(self, key_func, reverse=False):
         """Сортировка по пользовательской функции
         
+        Сортировка запоминается: результаты поиска и новые элементы
+        показываются в том же порядке. Ключи кэшируются для каждого
+        элемента, а смена направления с тем же key_func только разворачивает
+        список без повторной сортировки.
+        
         Args:
             key_func: Функция для получения ключа сортировки
             reverse (bool): Сортировка по убыванию
         """
-        self.displayed_items.sort(key=key_func, reverse=reverse)
+        if self._sort is not None and self._sort[0] is key_func:
+            if self._sort[1] != reverse:
+                self._view.reverse()
+        else:
+            self._view = self.store.sort(self._view, key=key_func, reverse=reverse)
+        self._sort = (key_func, reverse)
         self._update_display()
         
     # Методы поиска
@@ -199,7 +336,7 @@ class SearchableList:
         """
         self.search_entry.delete(0, tk.END)
         self.search_entry.insert(0, text)
-        self._on_search()
+        self._run_search()
         
     def search_startswith(self, prefix):
         """Поиск по началу строки
@@ -207,10 +344,10 @@ class SearchableList:
         Args:
             prefix (str): Начало строки
         """
-        prefix = prefix.lower()
-        self.displayed_items = [item for item in self.all_items 
-                               if item.lower().startswith(prefix)]
-        self._update_display()
+        self._search_worker.cancel()
+        folded = prefix.lower()
+        self._filter = (lambda item: item.lower().startswith(folded), None)
+        self._show_search_result(self._index_search('startswith', prefix))
         
     def search_endswith(self, suffix):
         """Поиск по концу строки
@@ -218,10 +355,41 @@ class SearchableList:
         Args:
             suffix (str): Конец строки
         """
-        suffix = suffix.lower()
-        self.displayed_items = [item for item in self.all_items 
-                               if item.lower().endswith(suffix)]
-        self._update_display()
+        self._search_worker.cancel()
+        folded = suffix.lower()
+        self._filter = (lambda item: item.lower().endswith(folded), None)
+        self._show_search_result(self._index_search('endswith', suffix))
+        
+    def search_fuzzy(self, text, limit=None, typos=None):
+        """Нечёткий поиск: лучшие совпадения по убыванию оценки
+        
+        Символы запроса ищутся в строках по порядку, допускаются опечатки.
+        Выше оказываются совпадения подряд и с начала слов.
+        
+        Args:
+            text (str): Текст для поиска
+            limit (int): Количество результатов (по умолчанию fuzzy_limit)
+            typos (int): Допустимое количество опечаток (по умолчанию typos)
+        """
+        self._search_worker.cancel()
+        limit = self.fuzzy_limit if limit is None else limit
+        typos = self.typos if typos is None else typos
+        
+        def rerun():
+            return self._fuzzy_search(text, limit, typos)
+            
+        self._filter = (None, rerun)
+        self._show_search_result(rerun())
+        
+    def set_fuzzy(self, enabled=True):
+        """Включить или выключить нечёткий поиск при вводе
+        
+        Args:
+            enabled (bool): Нечёткий поиск вместо поиска подстроки
+        """
+        self.fuzzy = enabled
+        if hasattr(self, 'search_entry') and self.search_entry.get():
+            self._run_search()
         
     def search_by_length(self, min_len=None, max_len=None):
         """Поиск по длине строки
@@ -237,8 +405,7 @@ class SearchableList:
                 return False
             return True
             
-        self.displayed_items = [item for item in self.all_items if check_length(item)]
-        self._update_display()
+        self.search_custom(check_length)
         
     def search_custom(self, search_func):
         """Поиск по пользовательской функции
@@ -246,45 +413,156 @@ class SearchableList:
         Args:
             search_func: Функция, возвращающая True для элементов, которые нужно показать
         """
-        self.displayed_items = [item for item in self.all_items if search_func(item)]
-        self._update_display()
+        self._search_worker.cancel()
+        self._filter = (search_func, None)
+        positions = self.store.positions()
+        self._show_search_result(
+            array('I', (p for p in positions if search_func(self.store[p]))))
         
     def clear_search(self):
         """Сброс всех поисковых запросов"""
+        self._search_worker.cancel()
+        self._filter = None
         self.search_entry.delete(0, tk.END)
-        self.displayed_items = self.all_items.copy()
-        self._update_display()
+        self._show_search_result(self.store.positions())
         
     # Базовые методы
     def add_item(self, item):
-        """Добавить элемент"""
-        self.all_items.append(item)
-        self.clear_search()
+        """Добавить элемент
+        
+        Элемент встаёт на своё место при активной сортировке и
+        показывается, если подходит под активный поиск: введённый запрос
+        или последний из search_startswith, search_endswith, search_fuzzy,
+        search_by_length и search_custom.
+        """
+        self._append_items([item])
         
     def add_items(self, items):
         """Добавить несколько элементов"""
-        self.all_items.extend(items)
-        self.clear_search()
+        self._append_items(list(items))
+        
+    def _index_items(self, items):
+        """Добавить элементы в поисковый индекс"""
+        if hasattr(self.index, 'extend'):
+            self.index.extend(items)
+        else:
+            # Пользовательский индекс может не поддерживать пакетное добавление
+            for item in items:
+                self.index.add(item)
+        
+    def load_stream(self, iterable, chunk_size=1000, on_progress=None, on_done=None):
+        """Добавить элементы из итератора порциями, не блокируя интерфейс
+        
+        Первая порция показывается сразу, остальные добавляются в конец по
+        мере чтения. Активный поиск не сбрасывается: новые элементы
+        проверяются по нему (см. add_item).
+        
+        Args:
+            iterable: Источник элементов (генератор, файл, курсор и т.д.)
+            chunk_size (int): Количество элементов в порции
+            on_progress (callable): Вызывается с числом загруженных элементов
+            on_done (callable): Вызывается с общим числом элементов
+            
+        Returns:
+            StreamLoader: Объект загрузки (loader.cancel() - остановить)
+        """
+        self.cancel_stream()
+        self._loader = StreamLoader(self.container, iterable, self._append_items,
+                                    chunk_size, on_progress, on_done)
+        return self._loader
+        
+    def cancel_stream(self):
+        """Остановить потоковую загрузку, начатую load_stream()"""
+        if self._loader is not None:
+            self._loader.cancel()
+            self._loader = None
+        
+    def _append_items(self, items):
+        """Добавить элементы без сброса поиска
+        
+        Без сортировки элементы дописываются в конец, при активной
+        сортировке - вставляются на свои места.
+        """
+        added = array('I', self.store.extend(items))
+        self._index_items(items)
+        text = self.search_entry.get() if hasattr(self, 'search_entry') else ""
+        if self._filter is not None:
+            predicate, rerun = self._filter
+            if rerun is not None:
+                # Новые элементы могут попасть в лучшие совпадения нечёткого
+                # поиска в любом месте: поиск повторяется
+                self._show_search_result(rerun())
+                return
+            store = self.store
+            added = array('I', (p for p in added if predicate(store[p])))
+        elif text and (self.fuzzy or self._search_worker.stale):
+            # Результат фонового поиска не содержал бы новых элементов, а в
+            # нечётком поиске они могут попасть в лучшие совпадения в любом
+            # месте: поиск повторяется через SearchWorker
+            self._on_search()
+            self._update_info()
+            return
+        elif text:
+            added = self.store.search(text, added)
+        if self._sort is not None and added:
+            key, reverse = self._sort
+            self._view = self.store.merge(self._view, added, key=key, reverse=reverse)
+            self._update_display()
+            return
+        self._view.extend(added)
+        if added:
+            self.widget.insert(tk.END, *self.store.values(added))
+            self._rendered.extend(added)
+        self._update_info()
+        
+    def _on_destroy(self, event=None):
+        """Остановить фоновые задачи при удалении виджета"""
+        self._search_worker.shutdown()
+        self.cancel_stream()
         
     def remove_selected(self):
         """Удалить выбранный элемент"""
         selection = self.widget.curselection()
         if selection:
+            self._search_worker.cancel()
             index = selection[0]
-            item = self.displayed_items[index]
-            self.all_items.remove(item)
-            self.displayed_items.pop(index)
+            position = self._view[index]
+            if hasattr(self.index, 'remove_id'):
+                self.index.remove_id(position)
+            else:
+                self.index.remove(self.store[position])
+            self.store.discard(position)
+            del self._view[index]
+            if self.store.slots > 2 * len(self.store) + 1024:
+                self._compact()
             self._update_display()
             
+    def _compact(self):
+        """Освободить пустые ячейки хранилища после удалений"""
+        remap = self.store.compact()
+        self._view = array('I', map(remap.__getitem__, self._view))
+        # Удалённые, но ещё показанные строки получают ItemStore.DELETED и
+        # убираются из виджета при следующей синхронизации
+        self._rendered = array('I', map(remap.__getitem__, self._rendered))
+        if hasattr(self.index, 'remove_id'):
+            # Позиции элементов изменились, id в индексе должны совпадать с ними
+            self.index.build(self.store.items())
+            
     def get_selected(self):
         """Получить выбранный элемент"""
         selection = self.widget.curselection()
         if selection:
-            return self.displayed_items[selection[0]]
+            return self.store[self._view[selection[0]]]
         return None
         
     def clear(self):
         """Очистить список"""
-        self.all_items = []
-        self.displayed_items = []
+        self._search_worker.cancel()
+        self.cancel_stream()
+        self.store.clear()
+        if hasattr(self.index, 'clear'):
+            self.index.clear()
+        else:
+            self.index.build([])
+        self._view = array('I')
         self._update_display()
\ No newline at end of file
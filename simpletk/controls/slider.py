@@ -1,5 +1,7 @@
 import tkinter as tk
 
+from ..callbacks import wrap_callback
+
 class Slider:
     """Ползунок для выбора числа
     
@@ -27,6 +29,7 @@ class Slider:
             self.parent = parent
             
         self.value = tk.IntVar()
+        on_change = wrap_callback(self.parent, on_change, "Slider.on_change")
         self.widget = tk.Scale(self.parent, from_=from_, to=to, orient=tk.HORIZONTAL,
                                variable=self.value, command=on_change)
         self.widget.pack(fill=tk.X, pady=2)
@@ -1,5 +1,7 @@
 import tkinter as tk
 
+from .callbacks import wrap_callback
+
 class Menu:
     """Меню приложения
     
@@ -46,6 +48,7 @@ class Menu:
             shortcut (str): Горячая клавиша
         """
         if menu_name in self.menus:
+            on_click = wrap_callback(self.menu_bar, on_click, "Menu.on_click")
             if shortcut:
                 self.menus[menu_name].add_command(label=item_text, command=on_click, accelerator=shortcut)
             else:
@@ -0,0 +1,328 @@
+import functools
+import sys
+import threading
+import time
+from collections import deque
+
+# Границы корзин гистограммы времени обработчиков в миллисекундах
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+def profiled(widget, callback, name):
+    """Обернуть обработчик замером времени, если для окна включён профилировщик
+
+    Элементы simpletk пропускают через эту функцию свои обработчики (поиск
+    при вводе, сортировка, страницы таблицы и т.д.); обработчики
+    пользователя проходят через callbacks.wrap_callback(), которая тоже
+    вызывает profiled(). Без App(profile=True) обработчик возвращается
+    без изменений.
+
+    Args:
+        widget: Виджет tkinter, по которому находится главное окно
+        callback (callable): Обработчик (None возвращается как есть)
+        name (str): Название обработчика в статистике, например "Button.on_click"
+
+    Returns:
+        callable: Обработчик
+    """
+    if callback is None:
+        return None
+    profiler = getattr(widget._root(), '_simpletk_profiler', None)
+    if profiler is None:
+        return callback
+    return profiler.wrap(callback, name)
+
+
+def _callable_name(callback):
+    """Имя функции для статистики: модуль.имя"""
+    func = getattr(callback, '__func__', callback)
+    func = getattr(func, 'func', func)  # functools.partial
+    name = getattr(func, '__qualname__', None) or type(func).__name__
+    module = getattr(func, '__module__', None)
+    return f"{module}.{name}" if module and module != 'builtins' else name
+
+
+class _Histogram:
+    """Количество вызовов обработчика по корзинам времени"""
+
+    __slots__ = ('count', 'total', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)  # Последняя - больше BUCKETS_MS[-1]
+
+    def add(self, ms):
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+        for i, bound in enumerate(BUCKETS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def percentile(self, fraction):
+        """Оценка перцентиля: верхняя граница корзины (не больше max)"""
+        target = self.count * fraction
+        seen = 0
+        for bound, n in zip(BUCKETS_MS, self.buckets):
+            seen += n
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self):
+        labels = [f"<={bound}" for bound in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}"]
+        return {
+            'count': self.count,
+            'total_ms': self.total,
+            'mean_ms': self.total / self.count if self.count else 0.0,
+            'max_ms': self.max,
+            'p50_ms': self.percentile(0.5),
+            'p90_ms': self.percentile(0.9),
+            'p99_ms': self.percentile(0.99),
+            'histogram': dict(zip(labels, self.buckets)),
+        }
+
+
+class Profiler:
+    """Время обработчиков и зависания главного цикла Tk
+
+    Создаётся через App(profile=True) и доступен как app.profiler.
+
+    Обработчики, которые simpletk передаёт в tkinter, оборачиваются
+    замером времени; по каждому обработчику копится гистограмма.
+
+    Зависания ищутся так: таймер after() каждые heartbeat_ms отмечает,
+    что цикл событий жив, а фоновый поток-сторож проверяет отметку. Если
+    её нет дольше stall_ms, сторож снимает стек потока Tk
+    (sys._current_frames()), поэтому видно, какая строка какого
+    обработчика держит цикл. Длительность зависания записывается, когда
+    таймер снова срабатывает.
+
+    Пример:
+        >>> app = App("Моё приложение", profile=True, profile_path="profile.json")
+        >>> app.run()  # После выхода статистика сохраняется в profile.json
+        >>> print(app.profiler.report())
+        >>> app.profiler.stalls()[-1]['stack']
+    """
+
+    def __init__(self, root, stall_ms=200, heartbeat_ms=50, max_stalls=100, on_stall=None):
+        """Инициализация
+
+        Args:
+            root (tk.Tk): Главное окно
+            stall_ms (int): С какой задержки цикла событий считать зависание
+            heartbeat_ms (int): Период таймера-отметки
+            max_stalls (int): Сколько последних зависаний хранить
+            on_stall (callable): Вызывается в потоке Tk со словарём
+                зависания, когда цикл событий освободился
+        """
+        self.root = root
+        self.stall_ms = stall_ms
+        self.heartbeat_ms = heartbeat_ms
+        self.on_stall = on_stall
+        self.running = False
+        self._histograms = {}
+        self._active = []  # Имена выполняющихся сейчас обработчиков (вложенные - в конце)
+        self._stalls = deque(maxlen=max_stalls)
+        self._pending = None  # Зависание, замеченное сторожем и ещё не закончившееся
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watchdog = None
+        self._after_id = None
+        self._last_beat = time.perf_counter()
+        self._thread_id = None
+        self._started = None
+        root._simpletk_profiler = self
+
+    # Обработчики
+    def wrap(self, callback, name):
+        """Обернуть обработчик замером времени
+
+        Args:
+            callback (callable): Обработчик
+            name (str): Откуда он вызывается, например "Button.on_click"
+
+        Returns:
+            callable: Обёртка с тем же поведением
+        """
+        name = f"{name} ({_callable_name(callback)})"
+        active = self._active
+        record = self.record
+
+        @functools.wraps(callback)
+        def wrapper(*args, **kwargs):
+            active.append(name)
+            start = time.perf_counter()
+            try:
+                return callback(*args, **kwargs)
+            finally:
+                active.pop()
+                record(name, time.perf_counter() - start)
+        return wrapper
+
+    def record(self, name, seconds):
+        """Добавить замер обработчика
+
+        Args:
+            name (str): Название обработчика
+            seconds (float): Время выполнения в секундах
+        """
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = _Histogram()
+        histogram.add(seconds * 1000)
+
+    def stats(self):
+        """Статистика обработчиков
+
+        Returns:
+            dict: {название: count, total_ms, mean_ms, max_ms, p50_ms,
+                p90_ms, p99_ms, histogram}, по убыванию общего времени
+        """
+        items = sorted(self._histograms.items(), key=lambda item: item[1].total, reverse=True)
+        return {name: histogram.as_dict() for name, histogram in items}
+
+    # Зависания
+    def start(self):
+        """Запустить таймер-отметку и поток-сторож (вызывается из потока Tk)"""
+        if self.running:
+            return
+        self.running = True
+        self._thread_id = threading.get_ident()
+        self._started = self._started or time.time()
+        self._last_beat = time.perf_counter()
+        self._after_id = self.root.after(self.heartbeat_ms, self._beat)
+        self._stop.clear()
+        self._watchdog = threading.Thread(target=self._watch, name='simpletk-watchdog',
+                                          daemon=True)
+        self._watchdog.start()
+
+    def stop(self):
+        """Остановить поиск зависаний (статистика сохраняется)"""
+        if not self.running:
+            return
+        self.running = False
+        self._stop.set()
+        self._watchdog.join()
+        self._watchdog = None
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass  # Окно уже уничтожено
+            self._after_id = None
+        with self._lock:
+            self._pending = None
+
+    def _beat(self):
+        """Отметка таймера: цикл событий жив"""
+        now = time.perf_counter()
+        lag_ms = (now - self._last_beat) * 1000 - self.heartbeat_ms
+        self._last_beat = now
+        self._after_id = self.root.after(self.heartbeat_ms, self._beat)
+
+        with self._lock:
+            stall, self._pending = self._pending, None
+            if stall is None and lag_ms > self.stall_ms:
+                # Сторож не успел заметить короткое зависание
+                stall = self._new_stall(None)
+            if stall is not None:
+                stall['duration_ms'] = max(lag_ms, 0.0)
+                stall['finished'] = True
+        if stall is not None and self.on_stall:
+            self.on_stall(dict(stall))
+
+    def _watch(self):
+        """Поток-сторож: снимок стека потока Tk при зависании"""
+        # traceback и json не нужны без профилирования: импорт при запуске
+        import traceback
+        interval = min(self.heartbeat_ms, self.stall_ms) / 2000
+        while not self._stop.wait(interval):
+            lag_ms = (time.perf_counter() - self._last_beat) * 1000 - self.heartbeat_ms
+            if lag_ms <= self.stall_ms:
+                continue
+            with self._lock:
+                if self._pending is not None:
+                    self._pending['duration_ms'] = lag_ms  # Зависание продолжается
+                    continue
+                frame = sys._current_frames().get(self._thread_id)
+                stack = traceback.format_stack(frame) if frame is not None else None
+                del frame
+                self._pending = self._new_stall(stack)
+                self._pending['duration_ms'] = lag_ms
+
+    def _new_stall(self, stack):
+        """Запись о зависании (добавляется в список сразу, вызывать под _lock)"""
+        try:
+            callback = self._active[-1]
+        except IndexError:
+            callback = None
+        stall = {'time': time.time(), 'duration_ms': 0.0, 'finished': False,
+                 'callback': callback, 'stack': stack}
+        self._stalls.append(stall)
+        return stall
+
+    def stalls(self):
+        """Последние зависания
+
+        Returns:
+            list: Словари time, duration_ms, finished (False - ещё
+                продолжается), callback (обработчик, который выполнялся) и
+                stack (строки стека потока Tk или None)
+        """
+        with self._lock:
+            return [dict(stall) for stall in self._stalls]
+
+    def reset(self):
+        """Очистить статистику и список зависаний"""
+        self._histograms.clear()
+        with self._lock:
+            self._stalls.clear()
+
+    # Отчёты
+    def as_dict(self):
+        """Вся статистика одним словарём (для JSON)"""
+        return {
+            'started': self._started,
+            'stall_ms': self.stall_ms,
+            'heartbeat_ms': self.heartbeat_ms,
+            'callbacks': self.stats(),
+            'stalls': self.stalls(),
+        }
+
+    def dump(self, path):
+        """Сохранить статистику в JSON файл
+
+        Args:
+            path (str): Путь к файлу
+        """
+        import json
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.as_dict(), f, ensure_ascii=False, indent=2)
+
+    def report(self, limit=20):
+        """Текстовая сводка: самые долгие обработчики и зависания
+
+        Args:
+            limit (int): Сколько обработчиков показать
+
+        Returns:
+            str: Текст сводки
+        """
+        lines = [f"{'вызовов':>8} {'всего, мс':>10} {'p50':>7} {'p99':>7} {'макс':>8}  обработчик"]
+        for name, s in list(self.stats().items())[:limit]:
+            lines.append(f"{s['count']:>8} {s['total_ms']:>10.1f} {s['p50_ms']:>7.1f} "
+                         f"{s['p99_ms']:>7.1f} {s['max_ms']:>8.1f}  {name}")
+        stalls = self.stalls()
+        if stalls:
+            lines.append(f"\nЗависаний дольше {self.stall_ms} мс: {len(stalls)}")
+            for stall in stalls[-5:]:
+                lines.append(f"  {stall['duration_ms']:.0f} мс в {stall['callback'] or '?'}")
+                if stall['stack']:
+                    lines.append('    ' + stall['stack'][-1].strip().replace('\n', '\n    '))
+        return '\n'.join(lines)
@@ -0,0 +1,99 @@
+from itertools import islice
+
+from .profiler import profiled
+
+
+class StreamLoader:
+    """Загрузка данных из итератора порциями без блокировки интерфейса
+
+    Первая порция добавляется сразу, поэтому первый экран виден без
+    задержки. Следующие порции добавляются через after_idle(), когда Tk
+    обработал накопившиеся события, поэтому окно остаётся отзывчивым,
+    пока читается генератор, csv.reader или курсор базы данных.
+
+    Объект возвращают методы load_stream() у Table, ListBox и
+    SearchableList; через него можно узнать состояние загрузки или
+    отменить её.
+
+    Пример:
+        >>> loader = table.load_stream(csv.reader(f), chunk_size=2000,
+        ...                            on_progress=lambda n: label.set_text(f"{n} строк"))
+        >>> loader.cancel()
+    """
+
+    def __init__(self, widget, iterable, add_chunk, chunk_size=1000,
+                 on_progress=None, on_done=None, on_error=None):
+        """Инициализация и загрузка первой порции
+
+        Args:
+            widget: Виджет tkinter для планирования after_idle()
+            iterable: Источник элементов (любой итерируемый объект)
+            add_chunk (callable): Добавляет список элементов в виджет
+            chunk_size (int): Количество элементов в порции
+            on_progress (callable): Вызывается с числом загруженных элементов
+                после каждой порции
+            on_done (callable): Вызывается с общим числом элементов после
+                окончания загрузки
+            on_error (callable): Вызывается с исключением, если чтение или
+                добавление порции завершилось ошибкой (без него исключение
+                передаётся в обработчик ошибок tkinter)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size должен быть положительным")
+        self.widget = widget
+        self.chunk_size = chunk_size
+        self.loaded = 0
+        self.done = False
+        self.cancelled = False
+        self._iterator = iter(iterable)
+        self._add_chunk = add_chunk
+        self._on_progress = on_progress
+        self._on_done = on_done
+        self._on_error = on_error
+        self._after_id = None
+        self._step = profiled(widget, self._step, "StreamLoader.chunk")
+        self._step()
+
+    def _step(self):
+        """Добавить очередную порцию и запланировать следующую"""
+        self._after_id = None
+        if self.done:
+            return
+        try:
+            chunk = list(islice(self._iterator, self.chunk_size))
+            if chunk:
+                self._add_chunk(chunk)
+        except Exception as e:
+            self._finish()
+            if self._on_error is None:
+                raise
+            self._on_error(e)
+            return
+
+        if not chunk:
+            self._finish()
+            if self._on_done:
+                self._on_done(self.loaded)
+            return
+
+        self.loaded += len(chunk)
+        if self._on_progress:
+            self._on_progress(self.loaded)
+        self._after_id = self.widget.after_idle(self._step)
+
+    def _finish(self):
+        """Завершить загрузку и закрыть источник"""
+        self.done = True
+        close = getattr(self._iterator, 'close', None)
+        if close is not None:
+            close()
+
+    def cancel(self):
+        """Остановить загрузку (уже добавленные элементы остаются)"""
+        if self.done:
+            return
+        self.cancelled = True
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        self._finish()
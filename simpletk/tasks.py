@@ -0,0 +1,247 @@
+import queue
+import sys
+
+from .callbacks import wrap_callback
+
+
+class _Progress:
+    """Функция progress(value), которую получает фоновая задача
+
+    Объект передаётся в процесс исполнителя, поэтому хранит только номер
+    задачи и очередь.
+    """
+
+    def __init__(self, task_id, target):
+        self.task_id = task_id
+        self.target = target
+
+    def __call__(self, value):
+        self.target.put((self.task_id, 'progress', value))
+
+
+class BackgroundTask:
+    """Задача, запущенная через App.run_background()
+
+    Атрибуты:
+        future: concurrent.futures.Future задачи
+        done (bool): Результат или ошибка уже переданы в поток Tk
+        cancelled (bool): Задача отменена, обработчики не вызываются
+    """
+
+    def __init__(self, task_id, on_done, on_error, on_progress):
+        self.id = task_id
+        self.future = None
+        self.done = False
+        self.cancelled = False
+        self._on_done = on_done
+        self._on_error = on_error
+        self._on_progress = on_progress
+
+    def cancel(self):
+        """Отменить задачу
+
+        Ещё не начатая задача не запускается. Уже выполняющуюся остановить
+        нельзя, но её результат и прогресс будут отброшены.
+        """
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+
+class TaskRunner:
+    """Выполнение функций в фоне с передачей результатов в поток Tk
+
+    Функции выполняются в ThreadPoolExecutor или ProcessPoolExecutor.
+    Результаты, ошибки и прогресс всех задач складываются в одну очередь,
+    которую разбирает один таймер after() в потоке Tk, по batch сообщений
+    за раз. Поэтому обработчики on_done, on_error и on_progress могут
+    менять виджеты, а сотня завершившихся задач не создаёт сотню вызовов
+    after(). Таймер работает, только пока есть незавершённые задачи.
+
+    Используется через App.run_background().
+    """
+
+    def __init__(self, root, executor='thread', max_workers=None, poll_ms=20, batch=100):
+        """Инициализация
+
+        Args:
+            root (tk.Tk): Главное окно
+            executor: 'thread', 'process' или готовый concurrent.futures.Executor
+            max_workers (int): Количество потоков или процессов исполнителя
+            poll_ms (int): Период разбора очереди в миллисекундах
+            batch (int): Сколько сообщений разбирать за один вызов таймера
+        """
+        if executor not in ('thread', 'process') and not hasattr(executor, 'submit'):
+            raise ValueError(f"Неизвестный тип исполнителя: {executor}")
+        self.root = root
+        self.kind = executor if isinstance(executor, str) else None
+        self.max_workers = max_workers
+        self.poll_ms = poll_ms
+        self.batch = batch
+        self._executor = None if self.kind else executor
+        # SimpleQueue (Python 3.7+, см. requires-python): put() из потоков
+        # исполнителя без лишних блокировок Queue
+        self._queue = queue.SimpleQueue()
+        self._progress_queue = None  # Очередь прогресса для процессов (multiprocessing)
+        self._manager = None
+        self._deferred = []  # Завершения, ожидающие прогресса из _progress_queue
+        self._tasks = {}
+        self._next_id = 0
+        self._after_id = None
+
+    def _get_executor(self):
+        """Создать исполнитель при первой задаче"""
+        if self._executor is None:
+            # concurrent.futures импортируется только при первой фоновой задаче
+            from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+            if self.kind == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='simpletk')
+        return self._executor
+
+    def _get_progress_queue(self):
+        """Очередь, в которую могут писать процессы исполнителя"""
+        if self.kind != 'process':
+            return self._queue
+        if self._progress_queue is None:
+            import multiprocessing
+            self._manager = multiprocessing.Manager()
+            self._progress_queue = self._manager.Queue()
+        return self._progress_queue
+
+    def submit(self, fn, *args, on_done=None, on_error=None, on_progress=None, **kwargs):
+        """Запустить функцию в фоне
+
+        Args:
+            fn (callable): Функция (для 'process' - объявленная на уровне модуля)
+            *args, **kwargs: Аргументы функции
+            on_done (callable): Вызывается в потоке Tk с результатом
+            on_error (callable): Вызывается в потоке Tk с исключением (без
+                него исключение передаётся в обработчик ошибок tkinter)
+            on_progress (callable): Вызывается в потоке Tk со значениями,
+                которые функция передаёт в progress(value). Если задан,
+                функция получает аргумент progress; из нескольких значений
+                одной задачи, накопившихся между разборами очереди,
+                передаётся последнее
+
+        Returns:
+            BackgroundTask: Задача (можно отменить через cancel())
+        """
+        task_id = self._next_id
+        self._next_id += 1
+        task = BackgroundTask(task_id,
+                              wrap_callback(self.root, on_done, "run_background.on_done"),
+                              wrap_callback(self.root, on_error, "run_background.on_error"),
+                              wrap_callback(self.root, on_progress, "run_background.on_progress"))
+        if on_progress is not None:
+            kwargs['progress'] = _Progress(task_id, self._get_progress_queue())
+
+        self._tasks[task_id] = task
+        task.future = self._get_executor().submit(fn, *args, **kwargs)
+        # Вызывается в потоке исполнителя: только кладёт сообщение в очередь
+        task.future.add_done_callback(lambda future: self._queue.put((task_id, 'done', future)))
+        self._schedule()
+        return task
+
+    def _schedule(self, delay=None):
+        if self._after_id is None:
+            self._after_id = self.root.after(self.poll_ms if delay is None else delay, self._poll)
+
+    def _drain(self, source, messages, limit):
+        """Забрать из очереди не больше limit сообщений
+
+        Returns:
+            bool: Очередь разобрана полностью
+        """
+        try:
+            while len(messages) < limit:
+                messages.append(source.get_nowait())
+        except queue.Empty:
+            return True
+        return False
+
+    def _poll(self):
+        """Разобрать накопившиеся сообщения в потоке Tk"""
+        self._after_id = None
+        messages, self._deferred = self._deferred, []
+        progress_drained = True
+        if self._progress_queue is not None:
+            progress_drained = self._drain(self._progress_queue, messages,
+                                           len(messages) + self.batch)
+        self._drain(self._queue, messages, len(messages) + self.batch)
+
+        # Прогресс задачи: только последнее значение из порции. Пока очередь
+        # прогресса процессов не разобрана, завершения откладываются, чтобы
+        # on_done был после последнего on_progress
+        progress = {}
+        finished = []
+        for message in messages:
+            task_id, kind, value = message
+            if kind == 'progress':
+                progress[task_id] = value
+            elif progress_drained:
+                finished.append((task_id, value))
+            else:
+                self._deferred.append(message)
+
+        for task_id, value in progress.items():
+            task = self._tasks.get(task_id)
+            if task is not None and not task.cancelled and task._on_progress is not None:
+                self._call(task._on_progress, value)
+
+        for task_id, future in finished:
+            task = self._tasks.pop(task_id, None)
+            if task is None or task.cancelled or future.cancelled():
+                continue
+            task.done = True
+            error = future.exception()
+            if error is None:
+                if task._on_done is not None:
+                    self._call(task._on_done, future.result())
+            elif task._on_error is not None:
+                self._call(task._on_error, error)
+            else:
+                self.root.report_callback_exception(type(error), error, error.__traceback__)
+
+        if len(messages) >= self.batch or self._deferred:
+            self._schedule(1)  # Очередь не разобрана: дать Tk обработать события
+        elif self._tasks:
+            self._schedule()
+
+    def _call(self, callback, value):
+        """Вызвать обработчик; ошибка не прерывает разбор остальных сообщений"""
+        try:
+            callback(value)
+        except Exception:
+            self.root.report_callback_exception(*sys.exc_info())
+
+    @property
+    def pending(self):
+        """Количество незавершённых задач"""
+        return len(self._tasks)
+
+    def shutdown(self, wait=False):
+        """Отменить задачи и остановить исполнитель
+
+        Args:
+            wait (bool): Дождаться завершения выполняющихся задач
+        """
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+        self._deferred = []
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass  # Окно уже уничтожено
+            self._after_id = None
+        if self._executor is not None and self.kind is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+            self._progress_queue = None
@@ -0,0 +1,69 @@
+import time
+import tkinter as tk
+
+import pytest
+
+
+@pytest.fixture
+def root():
+    """Скрытое главное окно Tk (тест пропускается, если нет дисплея)"""
+    try:
+        root = tk.Tk()
+    except tk.TclError as error:
+        pytest.skip(f"Tk недоступен: {error}")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+class FakeListbox:
+    """tk.Listbox без окна: только delete и insert, которые вызывает sync_listbox"""
+
+    def __init__(self, values=()):
+        self.values = list(values)
+
+    def delete(self, first, last=None):
+        last = first if last is None else last
+        del self.values[first:last + 1]
+
+    def insert(self, index, *values):
+        self.values[index:index] = values
+
+
+class FakeRoot:
+    """Главное окно без Tk: таймеры after() выполняются вызовом pump()"""
+
+    def __init__(self):
+        self.timers = {}
+        self.errors = []
+        self._next = 0
+
+    def _root(self):
+        return self
+
+    def after(self, ms, callback, *args):
+        self._next += 1
+        after_id = f"after#{self._next}"
+        self.timers[after_id] = (callback, args)
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.timers.pop(after_id, None)
+
+    def report_callback_exception(self, *exc_info):
+        self.errors.append(exc_info[1])
+
+    def pump(self, until, timeout=10):
+        """Выполнять таймеры, пока until() не вернёт True"""
+        deadline = time.monotonic() + timeout
+        while not until():
+            assert time.monotonic() < deadline, "timeout"
+            for after_id, (callback, args) in list(self.timers.items()):
+                del self.timers[after_id]
+                callback(*args)
+            time.sleep(0.001)
+
+
+@pytest.fixture
+def fake_root():
+    return FakeRoot()
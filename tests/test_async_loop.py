@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from simpletk.async_loop import AsyncLoop
+from simpletk.callbacks import is_async, wrap_callback
+
+from conftest import FakeRoot
+
+
+class LoopRoot(FakeRoot):
+    """Окно без Tk для AsyncLoop: dooneevent отдаёт заданное число событий"""
+
+    def __init__(self, events=0):
+        super().__init__()
+        self.tk = self
+        self.events = events
+        self.exists = True
+
+    def dooneevent(self, flags):
+        if self.events:
+            self.events -= 1
+            return 1
+        return 0
+
+    def winfo_exists(self):
+        return self.exists
+
+
+def test_async_callback_runs_as_task():
+    root = LoopRoot(events=5)
+    loop = AsyncLoop(root)
+    seen = []
+
+    async def on_click(value):
+        await asyncio.sleep(0)
+        seen.append(value)
+        loop.stop()
+
+    assert is_async(on_click)
+    callback = wrap_callback(root, on_click, "Button.on_click")
+
+    async def main():
+        runner = asyncio.ensure_future(loop.run())
+        await asyncio.sleep(0)
+        callback(42)
+        await runner
+
+    asyncio.run(main())
+    assert seen == [42]
+    assert root.events == 0
+    assert not hasattr(root, '_simpletk_async')
+
+
+def test_closing_window_cancels_tasks():
+    root = LoopRoot()
+    loop = AsyncLoop(root, max_interval=0.005)
+    cancelled = []
+
+    async def forever():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def close_later():
+        await asyncio.sleep(0.02)
+        root.exists = False
+
+    async def main():
+        loop.spawn(forever())
+        await asyncio.gather(loop.run(), close_later())
+
+    asyncio.run(main())
+    assert cancelled == [True] and not loop.running
+
+
+def test_task_error_is_reported():
+    root = LoopRoot()
+    loop = AsyncLoop(root)
+
+    async def broken():
+        raise ValueError("boom")
+
+    async def stop_later():
+        await asyncio.sleep(0.01)
+        loop.stop()
+
+    async def main():
+        loop.spawn(broken())
+        await asyncio.gather(loop.run(), stop_later())
+
+    asyncio.run(main())
+    assert [str(error) for error in root.errors] == ["boom"]
+
+
+def test_async_callback_outside_loop_raises():
+    async def on_click():
+        pass
+
+    callback = wrap_callback(LoopRoot(), on_click, "Button.on_click")
+    with pytest.raises(RuntimeError):
+        callback()
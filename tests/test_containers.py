@@ -0,0 +1,65 @@
+import tkinter as tk
+
+import pytest
+
+from simpletk.containers.grid import Grid
+from simpletk.containers.horizontal import Horizontal
+from simpletk.containers.scrollarea import ScrollArea
+from simpletk.containers.vertical import Vertical
+
+
+def _labels(root, count):
+    return [tk.Label(root, text=str(i)) for i in range(count)]
+
+
+def _layout(widgets, manager):
+    """Параметры размещения виджетов без ссылки на контейнер"""
+    result = []
+    for widget in widgets:
+        info = dict(getattr(widget, manager + '_info')())
+        info.pop('in')
+        result.append(info)
+    return result
+
+
+@pytest.mark.parametrize("first", [0, 1, 2, 3, 5])
+def test_grid_add_many_matches_add(root, first):
+    # first элементов добавляются по одному, поэтому add_many может начать
+    # с середины строки сетки (пустые ячейки пропускаются через "x")
+    one, many = Grid(root, cols=3), Grid(root, cols=3)
+    expected, widgets = _labels(root, 8), _labels(root, 8)
+    for widget in expected:
+        one.add(widget)
+    for widget in widgets[:first]:
+        many.add(widget)
+    many.add_many(widgets[first:])
+
+    assert _layout(widgets, 'grid') == _layout(expected, 'grid')
+    assert (many.current_row, many.current_col) == (one.current_row, one.current_col)
+    assert many.frame.grid_propagate()
+
+
+@pytest.mark.parametrize("container, attr", [
+    (Vertical, 'frame'), (Horizontal, 'frame'), (ScrollArea, 'inner'),
+])
+def test_pack_add_many_matches_add(root, container, attr):
+    one, many = container(root), container(root)
+    expected, widgets = _labels(root, 6), _labels(root, 6)
+    for widget in expected:
+        one.add(widget)
+    many.add(widgets[0])
+    many.add_many(widgets[1:])
+    many.add_many([])
+
+    assert _layout(widgets, 'pack') == _layout(expected, 'pack')
+    assert getattr(many, attr).pack_slaves() == widgets
+    assert getattr(many, attr).pack_propagate()
+
+
+def test_scroll_area_rows_reject_add(root):
+    scroll = ScrollArea(root, row_count=100, row_height=20,
+                        bind_row=lambda widget, index: widget.config(text=str(index)))
+    with pytest.raises(ValueError):
+        scroll.add_many(_labels(root, 2))
+    with pytest.raises(ValueError):
+        scroll.add(tk.Label(root))
@@ -0,0 +1,162 @@
+import csv
+import sqlite3
+
+import pytest
+
+from simpletk.containers.columnar import ColumnarDataSource
+from simpletk.containers.csvsource import CSVDataSource
+from simpletk.containers.datasource import ListDataSource, SQLiteDataSource
+from simpletk.containers.filtering import RowFilter
+from simpletk.containers.sorting import sort_key
+
+TYPES = {0: 'str', 1: 'int'}
+ROWS = [[("Item" if i % 2 else "item") + str(i % 13), (i * 7919) % 101] for i in range(300)]
+SORTS = [None, [(1, False)], [(1, True)], [(0, False), (1, True)]]
+FILTERS = [None, RowFilter({1: ">=50"}, TYPES), RowFilter({0: "~item1", 1: "10..60"}, TYPES)]
+
+
+def _list(rows):
+    source = ListDataSource([list(row) for row in rows])
+    source.set_column_types(TYPES)
+    return source
+
+
+def _columnar(rows):
+    return ColumnarDataSource(rows, column_types=TYPES)
+
+
+def _sqlite(rows):
+    source = SQLiteDataSource(sqlite3.connect(":memory:"), "items", columns=["name", "value"])
+    source.set_column_types(TYPES)
+    source.extend(rows)
+    return source
+
+
+SOURCES = [_list, _columnar, _sqlite]
+
+
+def _expected(rows, sort=None, filter=None):
+    """Эталон: фильтр и устойчивая сортировка списка в памяти"""
+    rows = [row for row in rows if filter is None or filter(row)]
+    for column, descending in reversed(sort or []):
+        key = sort_key(TYPES[column])
+        rows.sort(key=lambda row: key(row[column]), reverse=descending)
+    return rows
+
+
+def _sort_values(rows, sort):
+    """Значения колонок сортировки (строки с равными ключами взаимозаменяемы)"""
+    columns = [column for column, _ in sort or []]
+    return [[sort_key(TYPES[c])(row[c]) for c in columns] for row in rows]
+
+
+def _check_pages(source, rows):
+    for sort in SORTS:
+        for row_filter in FILTERS:
+            expected = _expected(rows, sort, row_filter)
+            assert source.count(row_filter) == len(expected)
+            for offset in (0, 7, len(expected) - 3):
+                offset = max(offset, 0)
+                page = source.fetch(offset, 20, sort, row_filter)
+                want = expected[offset:offset + 20]
+                if sort is None:
+                    assert page == want
+                else:
+                    assert _sort_values(page, sort) == _sort_values(want, sort)
+                keyed = source.fetch_keyed(offset, 20, sort, row_filter)
+                assert [row for _, row in keyed] == page
+                for row_id, row in keyed:
+                    assert source.get(row_id) == row
+
+
+@pytest.mark.parametrize("make", SOURCES)
+def test_fetch_sort_filter(make):
+    _check_pages(make(ROWS), ROWS)
+
+
+@pytest.mark.parametrize("make", SOURCES)
+def test_delete_extend_remove(make):
+    source = make(ROWS)
+    initial = source.fetch_keyed(0, len(ROWS))
+    assert [row for _, row in initial] == ROWS
+
+    # Удаляются строки, выбранные в отсортированном представлении
+    deleted = {row_id for row_id, _ in source.fetch_keyed(0, len(ROWS), [(1, False)])[::3]}
+    source.delete_ids(deleted)
+    rows = [row for row_id, row in initial if row_id not in deleted]
+    assert source.fetch(0, len(ROWS)) == rows
+    with pytest.raises(KeyError):
+        source.get(min(deleted))
+    _check_pages(source, rows)
+
+    added = [["new" + str(i), i] for i in range(30)]
+    source.extend(added)
+    rows += added
+    _check_pages(source, rows)
+
+    source.remove(list(rows[0]))
+    rows = [row for row in rows if row != rows[0]]
+    assert source.count() == len(rows)
+    assert source.fetch(0, len(rows) + 1) == rows
+
+    source.clear()
+    assert source.count() == 0 and source.fetch(0, 10) == []
+
+
+@pytest.mark.parametrize("make", [_list, _columnar])
+def test_compaction_keeps_ids_and_order(make):
+    rows = [["row" + str(i % 50), i] for i in range(3000)]
+    source = make(rows)
+    source.fetch(0, 10, [(0, False), (1, True)])  # Заполнить кэши сортировки
+    ids = [row_id for row_id, _ in source.fetch_keyed(0, 3000)]
+    source.delete_ids(ids[:2500])
+    source.delete_ids(ids[2500:2990:7])
+    survivors = [row for row_id, row in zip(ids, rows)
+                 if row_id in set(ids[2500:]) - set(ids[2500:2990:7])]
+    _check_pages(source, survivors)
+    assert source.rows == survivors
+    assert [source.get(row_id) for row_id, _ in source.fetch_keyed(0, 5)] == survivors[:5]
+
+
+def test_columnar_rows_assignment():
+    source = _columnar(ROWS)
+    source.rows = [["b", 2], ["a", 1]]
+    assert source.count() == 2
+    assert source.fetch(0, 5, [(1, False)]) == [["a", 1], ["b", 2]]
+
+
+def _write_csv(path, rows, delimiter=','):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, delimiter=delimiter)
+        writer.writerow(["name", "value"])
+        writer.writerows(rows)
+
+
+def test_csv_source_reads_pages(tmp_path):
+    path = str(tmp_path / "items.csv")
+    _write_csv(path, ROWS)
+    rows = [[name, str(value)] for name, value in ROWS]
+    source = CSVDataSource(path)
+    source.set_column_types(TYPES)
+    assert source.columns == ["name", "value"]
+    _check_pages(source, rows)
+    with pytest.raises(NotImplementedError):
+        source.append(["x", "1"])
+    with pytest.raises(NotImplementedError):
+        source.rows = []
+    source.close()
+
+    cached = CSVDataSource(path)  # Индекс читается из items.csv.idx
+    assert cached.fetch(0, 300) == rows
+    cached.close()
+
+
+def test_csv_index_cache_depends_on_dialect(tmp_path):
+    path = str(tmp_path / "items.csv")
+    _write_csv(path, [["a;b", 1], ["c", 2]])
+    comma = CSVDataSource(path)
+    assert comma.fetch(0, 5) == [["a;b", "1"], ["c", "2"]]
+    comma.close()
+    semicolon = CSVDataSource(path, delimiter=';')
+    assert semicolon.columns == ["name,value"]
+    semicolon.close()
@@ -0,0 +1,44 @@
+import pytest
+
+from simpletk.containers.filtering import RowFilter, compile_expression
+
+
+@pytest.mark.parametrize("expr, column_type, matches, rejects", [
+    ("=10", 'auto', [10, "10", 10.0], [11, "abc"]),
+    ("!=10", 'auto', [11, "abc", None], [10]),
+    (">=5", 'number', [5, "7,5", 100], [4.9, "", None]),
+    ("<5", 'int', [4, "-1"], [5, "abc"]),
+    ("10..20", 'auto', [10, "15", 20], [9, 21, "abc"]),
+    ("b..d", 'auto', ["b", "Cat", "d"], ["a", "e"]),
+    ("~Тов", 'auto', ["Товар 1", "ТОВАР"], ["Услуга"]),
+    ("тов", 'str', ["Товар"], ["Услуга"]),
+    ("/^a\\d+$/", 'auto', ["a12"], ["A12", "a1b"]),
+    ("/^a\\d+$/i", 'auto', ["A12"], ["b1"]),
+    (">=2024-01-15", 'date', ["2024-02-01", "2024-01-15"], ["2023-12-31", "нет"]),
+])
+def test_compile_expression(expr, column_type, matches, rejects):
+    predicate = compile_expression(expr, column_type)
+    assert all(predicate(value) for value in matches)
+    assert not any(predicate(value) for value in rejects)
+
+
+@pytest.mark.parametrize("expr, column_type", [
+    ("10..abc", 'auto'),
+    ("abc..10", 'auto'),
+    ("1..x", 'number'),
+    (">abc", 'number'),
+    ("/(/", 'auto'),
+])
+def test_invalid_expression_raises(expr, column_type):
+    with pytest.raises(ValueError):
+        compile_expression(expr, column_type)
+
+
+def test_row_filter_combines_columns():
+    row_filter = RowFilter({1: ">=100", 0: "~товар"})
+    assert row_filter(["Товар 1", 150])
+    assert not row_filter(["Товар 2", 50])
+    assert not row_filter(["Услуга", 150])
+    assert row_filter == RowFilter({0: "~товар", 1: ">=100"})
+    assert row_filter != RowFilter({0: "~товар", 1: ">=100"}, {1: 'int'})
+    assert hash(row_filter) == hash(RowFilter({0: "~товар", 1: ">=100"}))
@@ -0,0 +1,23 @@
+import subprocess
+import sys
+
+from simpletk.bench import importtime
+
+
+def test_import_within_budget_without_lazy_modules():
+    ok, result = importtime.check(runs=3)
+    assert result['loaded'] == []
+    assert result['best_ms'] <= importtime.DEFAULT_BUDGET_MS, result['slowest']
+    assert ok
+
+
+def test_lazy_names_resolve_on_access():
+    code = (
+        "import sys, simpletk\n"
+        "assert 'simpletk.controls' not in sys.modules\n"
+        "from simpletk import Button, Table\n"
+        "assert simpletk.controls.Button is Button\n"
+        "assert simpletk.containers.Table is Table\n"
+        "assert 'controls' in dir(simpletk)\n"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
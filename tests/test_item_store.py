@@ -0,0 +1,86 @@
+import random
+from array import array
+
+import pytest
+
+from simpletk.controls.item_store import ItemStore
+from simpletk.controls.list_diff import sync_listbox
+
+from conftest import FakeListbox
+
+
+def test_compact_remaps_deleted_positions_to_sentinel():
+    store = ItemStore(["a", "b", "c", "d"])
+    store.discard(0)
+    store.discard(2)
+    remap = store.compact()
+    assert store.items() == ["b", "d"]
+    assert remap[1] == 0 and remap[3] == 1
+    assert remap[0] == remap[2] == ItemStore.DELETED
+
+
+def test_rendered_rows_sync_after_compaction():
+    # Строка удалена из представления, но ещё показана в виджете, и в этот
+    # момент хранилище сжимается: после синхронизации в виджете не должно
+    # остаться удалённой строки, а элемент с новой позицией 0 должен появиться
+    items = [f"item{i:04d}" for i in range(10)]
+    store = ItemStore(items)
+    view = array('I', reversed(store.positions()))
+    widget = FakeListbox(store.values(view))
+    rendered = array('I', view)
+
+    for position in range(1, 9):
+        store.discard(position)
+    view = array('I', [9, 0])
+    remap = store.compact()
+    view = array('I', map(remap.__getitem__, view))
+    rendered = array('I', map(remap.__getitem__, rendered))
+
+    sync_listbox(widget, rendered, view, store)
+    assert widget.values == ["item0009", "item0000"]
+
+
+def test_positions_survive_discard():
+    store = ItemStore(["a", "b", "c"])
+    store.discard(1)
+    store.discard(1)
+    assert len(store) == 2 and store.slots == 3
+    assert list(store.positions()) == [0, 2]
+    assert store.items() == ["a", "c"]
+    assert store.add("d") == 3
+    assert not store.is_alive(1) and store.is_alive(3)
+
+
+def test_packed_and_interned_storage():
+    items = ["Яблоко", "банан", "", "Яблоко"]
+    packed = ItemStore(items, packed=True)
+    interned = ItemStore(items, intern=True)
+    assert packed.items() == interned.items() == items
+    assert packed[0] == "Яблоко"
+    assert interned[0] is interned[3]
+
+
+def test_search_is_case_insensitive_and_limited_to_positions():
+    store = ItemStore(["Банан", "Ананас", "Киви", "БАНАН"])
+    assert list(store.search("бан")) == [0, 3]
+    assert list(store.search("ан", array('I', [1, 2, 3]))) == [1, 3]
+
+
+def test_find_assigns_duplicates_in_order():
+    store = ItemStore(["x", "y", "x"])
+    assert list(store.find(["x", "x", "z", "y"])) == [0, 2, 1]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("key", [None, len])
+def test_insort_and_merge_match_stable_sort(key, reverse):
+    rnd = random.Random(1)
+    store = ItemStore(rnd.choice(["aa", "b", "ccc", "dd"]) for _ in range(50))
+    view = store.sort(store.positions(), key=key, reverse=reverse)
+    for size in (1, 3, 40):
+        added = store.extend(rnd.choice(["aa", "b", "ccc", "e"]) for _ in range(size))
+        if size == 1:
+            store.insort(view, added.start, key=key, reverse=reverse)
+        else:
+            view = store.merge(view, array('I', added), key=key, reverse=reverse)
+        assert list(view) == list(store.sort(store.positions(), key=key, reverse=reverse))
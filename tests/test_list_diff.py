@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from simpletk.controls.item_store import ItemStore
+from simpletk.controls.list_diff import diff_range, sync_listbox
+
+from conftest import FakeListbox
+
+
+@pytest.mark.parametrize("old, new, expected", [
+    ([], [], (0, 0, 0)),
+    ([1, 2], [1, 2], (2, 2, 2)),
+    ([1, 2], [1, 2, 3, 4], (2, 2, 4)),
+    ([1, 2, 3], [1], (1, 3, 1)),
+    ([1, 2, 3, 4], [1, 9, 4], (1, 3, 2)),
+    ([1, 2, 3], [0, 1, 2, 3], (0, 0, 1)),
+    ([1, 2, 3], [4, 5], (0, 3, 2)),
+    ([1, 1, 1], [1, 1], (2, 3, 2)),
+])
+def test_diff_range(old, new, expected):
+    assert diff_range(old, new) == expected
+
+
+def test_sync_listbox_random_edits():
+    rnd = random.Random(7)
+    old = []
+    widget = FakeListbox()
+    for _ in range(300):
+        new = list(old)
+        for _ in range(rnd.randint(0, 3)):
+            index = rnd.randint(0, len(new))
+            if rnd.random() < 0.5 and new:
+                del new[index:index + rnd.randint(1, 4)]
+            else:
+                new[index:index] = [rnd.randint(0, 9) for _ in range(rnd.randint(1, 4))]
+        sync_listbox(widget, old, new)
+        assert widget.values == new
+        old = new
+
+
+def test_sync_listbox_with_store_positions():
+    store = ItemStore(["a", "b", "c", "d"])
+    widget = FakeListbox(["a", "b", "c", "d"])
+    sync_listbox(widget, [0, 1, 2, 3], [3, 1, 2], store)
+    assert widget.values == ["d", "b", "c"]
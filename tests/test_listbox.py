@@ -0,0 +1,28 @@
+import tkinter as tk
+
+from simpletk.controls.listbox import ListBox
+from simpletk.controls.searchable_list import SearchableList
+
+
+def _remove_row(widget, index):
+    widget.widget.selection_clear(0, tk.END)
+    widget.widget.selection_set(index)
+    widget.remove_selected()
+
+
+def test_searchable_list_remove_across_compaction(root):
+    lst = SearchableList(root, [f"item{i:04d}" for i in range(3000)], show_controls=False)
+    lst.sort_by(None, reverse=True)
+    # Удаление предпоследней строки: после ~2000 удалений хранилище сжимается
+    for _ in range(2100):
+        _remove_row(lst, lst.widget.size() - 2)
+        assert list(lst.widget.get(0, tk.END))[-3:] == lst.displayed_items[-3:]
+    assert list(lst.widget.get(0, tk.END)) == lst.displayed_items
+
+
+def test_listbox_remove_across_compaction(root):
+    box = ListBox(root, [f"item{i:04d}" for i in range(3000)])
+    box.sort(reverse=True)
+    for _ in range(2100):
+        _remove_row(box, box.widget.size() - 2)
+    assert list(box.widget.get(0, tk.END)) == box.displayed_items
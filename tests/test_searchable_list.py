@@ -0,0 +1,64 @@
+import tkinter as tk
+
+from simpletk.controls.searchable_list import SearchableList
+
+FRUITS = ["Apple", "Banana", "Apricot", "Mango", "Peach"]
+
+
+def _shown(lst):
+    assert list(lst.widget.get(0, tk.END)) == lst.displayed_items
+    return lst.displayed_items
+
+
+def test_add_item_respects_startswith(root):
+    lst = SearchableList(root, FRUITS)
+    lst.search_startswith("ap")
+    lst.add_item("Cherry")
+    lst.add_item("apricot jam")
+    assert _shown(lst) == ["Apple", "Apricot", "apricot jam"]
+
+
+def test_add_items_respects_endswith(root):
+    lst = SearchableList(root, FRUITS)
+    lst.search_endswith("GO")
+    lst.add_items(["Kiwi", "Indigo"])
+    assert _shown(lst) == ["Mango", "Indigo"]
+
+
+def test_add_items_respects_custom_and_length(root):
+    lst = SearchableList(root, FRUITS)
+    lst.search_custom(lambda s: len(s) == 5)
+    lst.add_items(["Kiwi", "Lemon", "Watermelon"])
+    assert _shown(lst) == ["Apple", "Mango", "Peach", "Lemon"]
+
+    lst.search_by_length(max_len=4)
+    lst.add_items(["Fig", "Orange"])
+    assert _shown(lst) == ["Kiwi", "Fig"]
+
+
+def test_add_item_reranks_fuzzy(root):
+    lst = SearchableList(root, FRUITS)
+    lst.search_fuzzy("mango", limit=2, typos=0)
+    assert _shown(lst) == ["Mango"]
+    lst.add_items(["Mangosteen", "Cherry"])
+    assert _shown(lst) == ["Mango", "Mangosteen"]
+
+
+def test_text_search_replaces_active_filter(root):
+    lst = SearchableList(root, FRUITS)
+    lst.search_startswith("ap")
+    lst.search("an")
+    lst.add_items(["Orange", "Cherry"])
+    assert _shown(lst) == ["Banana", "Mango", "Orange"]
+
+    lst.clear_search()
+    lst.add_item("Cherry")
+    assert _shown(lst)[-1] == "Cherry"
+
+
+def test_sorted_view_keeps_filter(root):
+    lst = SearchableList(root, FRUITS)
+    lst.sort_by(None)
+    lst.search_startswith("a")
+    lst.add_items(["Avocado", "Blueberry", "Acerola"])
+    assert _shown(lst) == ["Acerola", "Apple", "Apricot", "Avocado"]
@@ -0,0 +1,96 @@
+import threading
+import time
+
+import pytest
+
+from simpletk.tasks import TaskRunner
+
+
+def square(value):
+    return value * value
+
+
+def count_up(n, progress):
+    for i in range(1, n + 1):
+        progress(i)
+    return n
+
+
+def fail(message):
+    raise ValueError(message)
+
+
+@pytest.fixture
+def runner(fake_root):
+    runner = TaskRunner(fake_root, 'thread', max_workers=4)
+    yield runner
+    runner.shutdown(wait=True)
+
+
+def test_results_are_delivered_in_tk_thread(fake_root, runner):
+    results, threads = [], []
+
+    def on_done(value):
+        results.append(value)
+        threads.append(threading.current_thread())
+
+    for i in range(250):
+        runner.submit(square, i, on_done=on_done)
+    fake_root.pump(lambda: len(results) == 250)
+    assert sorted(results) == [i * i for i in range(250)]
+    assert set(threads) == {threading.main_thread()}
+    assert runner.pending == 0
+    fake_root.pump(lambda: not fake_root.timers)  # Без задач таймер не перезапускается
+
+
+def test_progress_then_done(fake_root, runner):
+    events = []
+    runner.submit(count_up, 50, on_progress=lambda v: events.append(('progress', v)),
+                  on_done=lambda v: events.append(('done', v)))
+    fake_root.pump(lambda: events and events[-1][0] == 'done')
+    assert events[-1] == ('done', 50)
+    assert events[-2] == ('progress', 50)
+    values = [value for kind, value in events[:-1]]
+    assert values == sorted(values)
+
+
+def test_errors_go_to_on_error_or_tk_handler(fake_root, runner):
+    errors = []
+    runner.submit(fail, "a", on_error=errors.append)
+    runner.submit(fail, "b")
+    fake_root.pump(lambda: errors and fake_root.errors)
+    assert str(errors[0]) == "a"
+    assert str(fake_root.errors[0]) == "b"
+
+
+def test_cancelled_task_reports_nothing(fake_root, runner):
+    started = threading.Event()
+    calls = []
+
+    def slow():
+        started.set()
+        time.sleep(0.05)
+        return 1
+
+    task = runner.submit(slow, on_done=calls.append, on_error=calls.append)
+    started.wait(5)
+    task.cancel()
+    fake_root.pump(lambda: task.future.done() and runner.pending == 0)
+    assert calls == [] and task.cancelled and not task.done
+
+
+def test_process_executor(fake_root):
+    runner = TaskRunner(fake_root, 'process', max_workers=1)
+    events = []
+    try:
+        runner.submit(count_up, 3, on_progress=lambda v: events.append(('progress', v)),
+                      on_done=lambda v: events.append(('done', v)))
+        fake_root.pump(lambda: events and events[-1][0] == 'done', timeout=60)
+    finally:
+        runner.shutdown(wait=True)
+    assert events[-2:] == [('progress', 3), ('done', 3)]
+
+
+def test_unknown_executor():
+    with pytest.raises(ValueError):
+        TaskRunner(None, 'fiber')